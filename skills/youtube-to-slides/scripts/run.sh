@@ -1,6 +1,7 @@
 #!/usr/bin/env bash
 # Wrapper: activates virtual environment and runs yt-slides CLI.
-# All arguments are forwarded to the yt-slides command.
+# All arguments are forwarded to the yt-slides command. If the first argument
+# is not a subcommand, it is treated as a URL for `yt-slides generate`.
 
 set -euo pipefail
 
@@ -19,5 +20,11 @@ set -a
 [ -f "$SKILL_DIR/.env" ] && . "$SKILL_DIR/.env"
 set +a
 
+case "${1:-}" in
+    bench) shift; exec "$VENV_DIR/bin/yt-slides" bench "$@" ;;
+    generate|batch|export|serve|enqueue|worker|queue) COMMAND="$1"; shift ;;
+    *) COMMAND="generate" ;;
+esac
+
 # Pass explicit output path so slides always land in the repo root output/
-exec "$VENV_DIR/bin/yt-slides" --output "$REPO_DIR/output" "$@"
+exec "$VENV_DIR/bin/yt-slides" "$COMMAND" --output "$REPO_DIR/output" "$@"
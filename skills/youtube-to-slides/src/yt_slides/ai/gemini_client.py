@@ -1,8 +1,67 @@
 """Shared Gemini API client."""
 
-from google import genai
+from __future__ import annotations
 
+from typing import TYPE_CHECKING, Callable
 
-def create_client(api_key: str) -> genai.Client:
-    """Create a configured Gemini API client."""
-    return genai.Client(api_key=api_key)
+from yt_slides import budget, tracing
+from yt_slides.ai.response_cache import ResponseCache
+
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
+
+
+def create_client(api_key: str, base_url: str = "") -> genai.Client:
+    """Create a configured Gemini API client.
+
+    ``base_url`` points the client at a different endpoint, such as a local
+    stand-in server for testing.
+    """
+    # google-genai takes most of a second to import, so only load it here
+    from google import genai
+    from google.genai import types
+
+    http_options = types.HttpOptions(base_url=base_url) if base_url else None
+    return genai.Client(api_key=api_key, http_options=http_options)
+
+
+async def generate_text_async(
+    client: genai.Client,
+    model: str,
+    prompt: str,
+    config: types.GenerateContentConfig,
+    cache: ResponseCache | None = None,
+    validate: Callable[[str], object] | None = None,
+) -> str:
+    """Generate a text response, serving identical requests from ``cache``.
+
+    Only responses that ``validate`` accepts (returns without raising) are
+    cached, so a malformed or truncated reply is not replayed on later runs.
+    A cached response it rejects is dropped and requested again.
+    """
+    key = ResponseCache.key(model, [prompt], config) if cache else ""
+    if cache:
+        cached = cache.get(key)
+        if cached is not None:
+            if _accepts(validate, cached):
+                return cached
+            cache.delete(key)
+    with tracing.span("gemini.generate_content", model=model) as call:
+        response = await client.aio.models.generate_content(model=model, contents=[prompt], config=config)
+        tracing.record_response(call, len(prompt.encode("utf-8")), response)
+    budget.charge(response)
+    # text is None when the response was blocked or has no candidate
+    if cache and response.text is not None and _accepts(validate, response.text):
+        cache.put(key, response.text)
+    return response.text
+
+
+def _accepts(validate: Callable[[str], object] | None, text: str) -> bool:
+    if validate is None:
+        return True
+    try:
+        validate(text)
+    except Exception:
+        return False
+    return True
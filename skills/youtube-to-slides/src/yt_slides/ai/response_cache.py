@@ -0,0 +1,118 @@
+"""Content-addressed on-disk cache for Gemini text responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from google.genai import types
+
+    from yt_slides.config import Settings
+
+
+class ResponseCache:
+    """Stores response text keyed by a hash of (model, prompt, config).
+
+    Entries live as one file each under ``directory``. Reads refresh an
+    entry's mtime, and when the total size exceeds ``max_bytes`` the least
+    recently used entries are evicted. Hit/miss counters cover the lifetime
+    of this instance.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._total_bytes = sum(p.stat().st_size for p in self._entries())
+
+    @staticmethod
+    def key(
+        model: str, contents: list[str], config: types.GenerateContentConfig | None
+    ) -> str:
+        config_data = config.model_dump(exclude_none=True) if config else {}
+        # default=str covers non-JSON values such as response_schema types
+        raw = json.dumps([model, contents, config_data], sort_keys=True, default=str).encode()
+        return hashlib.sha256(raw).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        path = self._path(key)
+        with self._lock:
+            try:
+                text = path.read_text()
+                os.utime(path)
+            except OSError:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return text
+
+    def put(self, key: str, text: str) -> None:
+        path = self._path(key)
+        with self._lock:
+            old_size = path.stat().st_size if path.exists() else 0
+            # Unique per writer: other processes may share the cache directory
+            tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            tmp.write_text(text)
+            os.replace(tmp, path)
+            self._total_bytes += path.stat().st_size - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def delete(self, key: str) -> None:
+        path = self._path(key)
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except OSError:
+                return
+            self._total_bytes -= size
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under the size cap.
+
+        Entries that another process sharing the directory deletes meanwhile
+        are skipped.
+        """
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        for _, size, path in sorted(entries):
+            if self._total_bytes <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            self._total_bytes -= size
+
+    def _entries(self) -> list[Path]:
+        return list(self.directory.glob("*/*.txt"))
+
+    def _path(self, key: str) -> Path:
+        path = self.directory / key[:2] / f"{key}.txt"
+        path.parent.mkdir(exist_ok=True)
+        return path
+
+
+def open_response_cache(settings: Settings) -> ResponseCache | None:
+    """Open the text response cache configured in settings, if enabled."""
+    if settings.response_cache_max_mb <= 0:
+        return None
+    return ResponseCache(
+        Path(settings.cache_dir).expanduser() / "responses",
+        max_bytes=settings.response_cache_max_mb * 1024 * 1024,
+    )
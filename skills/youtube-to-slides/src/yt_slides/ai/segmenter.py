@@ -1,36 +1,42 @@
 """AI-powered transcript segmentation when no chapters exist."""
 
+from __future__ import annotations
+
+import asyncio
 import json
+from typing import TYPE_CHECKING
 
-from google import genai
-from google.genai import types
+from yt_slides.ai.gemini_client import generate_text_async
+from yt_slides.ai.response_cache import ResponseCache
+from yt_slides.models import Chapter, Section, VideoMetadata
+from yt_slides.transcript import Transcript, TranscriptWindow
+from yt_slides.youtube.chapters import assign_transcript_to_sections
 
-from yt_slides.models import Section, TranscriptSnippet, VideoMetadata
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
 
 
 def _format_transcript_with_timestamps(
-    transcript: list[TranscriptSnippet],
+    transcript: Transcript,
 ) -> str:
     """Format transcript with periodic timestamps for the LLM."""
     lines: list[str] = []
     last_ts = -30.0
-    for snippet in transcript:
-        if snippet.start - last_ts >= 15:
-            minutes = int(snippet.start // 60)
-            seconds = int(snippet.start % 60)
+    for start, text in zip(transcript.starts, transcript.texts()):
+        if start - last_ts >= 15:
+            minutes = int(start // 60)
+            seconds = int(start % 60)
             lines.append(f"\n[{minutes}:{seconds:02d}] ")
-            last_ts = snippet.start
-        lines.append(snippet.text)
+            last_ts = start
+        lines.append(text)
     return "".join(lines)
 
 
-def segment_transcript(
-    client: genai.Client,
-    transcript: list[TranscriptSnippet],
-    metadata: VideoMetadata,
-    model: str = "gemini-2.5-flash",
-) -> list[Section]:
-    """Use Gemini to identify logical sections in the transcript."""
+def _build_segment_prompt(
+    transcript: Transcript, metadata: VideoMetadata
+) -> str:
+    """Build the prompt asking Gemini to segment the whole transcript."""
     duration_min = metadata.duration_seconds / 60
     formatted = _format_transcript_with_timestamps(transcript)
 
@@ -58,25 +64,27 @@ Return a JSON object with a "sections" array. Example:
 
 Transcript:
 {formatted}"""
+    return prompt
+
+
+def _json_config() -> types.GenerateContentConfig:
+    from google.genai import types
 
-    response = client.models.generate_content(
-        model=model,
-        contents=[prompt],
-        config=types.GenerateContentConfig(
-            response_mime_type="application/json",
-            temperature=0.3,
-        ),
+    return types.GenerateContentConfig(
+        response_mime_type="application/json",
+        temperature=0.3,
     )
 
-    data = json.loads(response.text)
+
+def _parse_segments(
+    text: str, transcript: Transcript
+) -> list[Section]:
+    """Turn the model's section boundaries into Sections with transcript text."""
+    data = json.loads(text)
     sections: list[Section] = []
 
     for i, s in enumerate(data["sections"]):
-        section_text = " ".join(
-            t.text
-            for t in transcript
-            if s["start_seconds"] <= t.start < s["end_seconds"]
-        )
+        section_text = transcript.text_between(s["start_seconds"], s["end_seconds"])
         sections.append(
             Section(
                 index=i + 1,
@@ -90,21 +98,180 @@ Transcript:
     return sections
 
 
-def consolidate_sections(
+async def segment_transcript_async(
     client: genai.Client,
-    sections: list[Section],
-    target_count: int,
-    video_title: str,
+    transcript: Transcript,
+    metadata: VideoMetadata,
     model: str = "gemini-2.5-flash",
+    cache: ResponseCache | None = None,
 ) -> list[Section]:
-    """Merge many sections into fewer consolidated slides using AI.
+    """Use Gemini to identify logical sections in the transcript."""
+    prompt = _build_segment_prompt(transcript, metadata)
+    text = await generate_text_async(
+        client, model, prompt, _json_config(), cache, validate=lambda t: _parse_segments(t, transcript)
+    )
+    return _parse_segments(text, transcript)
 
-    Groups related sections together and produces new titles that span
-    the merged content.
+
+def segment_transcript(
+    client: genai.Client,
+    transcript: Transcript,
+    metadata: VideoMetadata,
+    model: str = "gemini-2.5-flash",
+    cache: ResponseCache | None = None,
+) -> list[Section]:
+    """Blocking :func:`segment_transcript_async`, for callers without an event loop."""
+    return asyncio.run(segment_transcript_async(client, transcript, metadata, model, cache))
+
+
+def transcript_windows(
+    transcript: Transcript,
+    duration_seconds: float,
+    window_seconds: float,
+    overlap_seconds: float,
+) -> list[TranscriptWindow]:
+    """Cut the transcript into windows that overlap by ``overlap_seconds``.
+
+    Each overlap is split at its midpoint between the two windows' cores,
+    so every moment of the video belongs to exactly one core.
     """
-    if len(sections) <= target_count:
-        return sections
+    step = max(window_seconds - overlap_seconds, 1.0)
+    starts = [0.0]
+    while starts[-1] + window_seconds < duration_seconds:
+        starts.append(starts[-1] + step)
+    windows: list[TranscriptWindow] = []
+    for k, start in enumerate(starts):
+        end = min(start + window_seconds, float(duration_seconds))
+        core_start = 0.0 if k == 0 else start + overlap_seconds / 2
+        core_end = float(duration_seconds) if k == len(starts) - 1 else starts[k + 1] + overlap_seconds / 2
+        snippets = transcript.between(start, end)
+        windows.append(
+            TranscriptWindow(
+                start=start, end=end, core_start=core_start, core_end=core_end, snippets=snippets
+            )
+        )
+    return windows
+
 
+def _build_window_prompt(
+    window: TranscriptWindow, part: int, parts: int, metadata: VideoMetadata
+) -> str:
+    """Build the prompt segmenting one window of a long transcript."""
+    minutes = (window.end - window.start) / 60
+    low = max(1, round(minutes / 10))
+    high = max(low + 1, round(minutes / 4))
+    formatted = _format_transcript_with_timestamps(window.snippets)
+
+    prompt = f"""You are analyzing part {part} of {parts} of a long YouTube video transcript to identify logical sections.
+
+Video title: {metadata.title}
+This part covers {int(window.start)} to {int(window.end)} seconds ({minutes:.1f} minutes).
+
+Below is this part of the transcript with timestamps. Identify {low}-{high} logical sections based on
+topic changes, transitions, or natural breaking points.
+
+For each section, provide:
+- title: A concise descriptive title (3-8 words)
+- start_seconds: The timestamp (in seconds, from the start of the video) where this section begins
+- end_seconds: The timestamp (in seconds) where this section ends
+
+Rules:
+- Sections must be contiguous (no gaps, no overlaps)
+- First section starts at {int(window.start)}, last section ends at {int(window.end)}
+- Each section should be 3-15 minutes long
+- Prefer natural topic transitions as boundaries; a topic may already be in
+  progress at the start of this part or continue past its end
+
+Return a JSON object with a "sections" array. Example:
+{{"sections": [{{"title": "Introduction", "start_seconds": {int(window.start)}, "end_seconds": {int(window.start) + 300}}}, ...]}}
+
+Transcript:
+{formatted}"""
+    return prompt
+
+
+def _parse_window_segments(text: str) -> list[tuple[float, str]]:
+    """Section starts and titles proposed for one window."""
+    data = json.loads(text)
+    return [(float(s["start_seconds"]), s["title"]) for s in data["sections"]]
+
+
+async def segment_window_async(
+    client: genai.Client,
+    window: TranscriptWindow,
+    part: int,
+    parts: int,
+    metadata: VideoMetadata,
+    model: str = "gemini-2.5-flash",
+    cache: ResponseCache | None = None,
+) -> list[tuple[float, str]]:
+    """Segment one window; returns ``(start_seconds, title)`` per section."""
+    prompt = _build_window_prompt(window, part, parts, metadata)
+    text = await generate_text_async(
+        client, model, prompt, _json_config(), cache, validate=_parse_window_segments
+    )
+    return _parse_window_segments(text)
+
+
+def merge_window_segments(
+    windows: list[TranscriptWindow],
+    results: list[list[tuple[float, str]] | None],
+    transcript: Transcript,
+    duration_seconds: float,
+    min_section_seconds: float = 60.0,
+    fallback_seconds: float = 180.0,
+) -> list[Section]:
+    """Reconcile per-window segmentations into one list of sections.
+
+    Each window contributes only the boundaries inside its core, so a topic
+    running across a window seam stays one section. A window whose result
+    is ``None`` (its call failed) is split every ``fallback_seconds``.
+    Sections shorter than ``min_section_seconds`` are merged into the
+    preceding one.
+    """
+    starts: list[tuple[float, str]] = []
+    for window, proposed in zip(windows, results):
+        if proposed is None:
+            t = window.core_start
+            proposed = []
+            while t < window.core_end:
+                proposed.append((t, ""))
+                t += fallback_seconds
+        for start, title in proposed:
+            if window.core_start <= start < window.core_end:
+                starts.append((start, title))
+    starts.sort()
+    if not starts:
+        starts = [(0.0, "")]
+    elif starts[0][0] > 0:
+        if starts[0][0] < min_section_seconds:
+            starts[0] = (0.0, starts[0][1])
+        else:
+            starts.insert(0, (0.0, ""))
+
+    kept: list[tuple[float, str]] = []
+    for start, title in starts:
+        if kept and start - kept[-1][0] < min_section_seconds:
+            continue
+        kept.append((start, title))
+    if len(kept) > 1 and duration_seconds - kept[-1][0] < min_section_seconds:
+        kept.pop()
+
+    chapters = [
+        Chapter(
+            title=title or f"Part {i + 1}",
+            start_seconds=start,
+            end_seconds=kept[i + 1][0] if i + 1 < len(kept) else float(duration_seconds),
+        )
+        for i, (start, title) in enumerate(kept)
+    ]
+    return assign_transcript_to_sections(chapters, transcript)
+
+
+def _build_consolidate_prompt(
+    sections: list[Section], target_count: int, video_title: str
+) -> str:
+    """Build the prompt asking Gemini to group sections into fewer slides."""
     sections_desc = "\n".join(
         f"  {s.index}. [{int(s.start_seconds//60)}:{int(s.start_seconds%60):02d}] "
         f"{s.title} ({int((s.end_seconds - s.start_seconds)//60)}m)"
@@ -134,17 +301,12 @@ Rules:
 - Every section index from 1 to {len(sections)} must appear exactly once
 - Keep indices in order within each group
 - Group thematically related sections together"""
+    return prompt
 
-    response = client.models.generate_content(
-        model=model,
-        contents=[prompt],
-        config=types.GenerateContentConfig(
-            response_mime_type="application/json",
-            temperature=0.3,
-        ),
-    )
 
-    data = json.loads(response.text)
+def _parse_groups(text: str, sections: list[Section]) -> list[Section]:
+    """Merge sections according to the model's grouping."""
+    data = json.loads(text)
     section_map = {s.index: s for s in sections}
     consolidated: list[Section] = []
 
@@ -162,3 +324,38 @@ Rules:
         )
 
     return consolidated
+
+
+async def consolidate_sections_async(
+    client: genai.Client,
+    sections: list[Section],
+    target_count: int,
+    video_title: str,
+    model: str = "gemini-2.5-flash",
+    cache: ResponseCache | None = None,
+) -> list[Section]:
+    """Merge many sections into fewer consolidated slides using AI.
+
+    Groups related sections together and produces new titles that span
+    the merged content.
+    """
+    if len(sections) <= target_count:
+        return sections
+
+    prompt = _build_consolidate_prompt(sections, target_count, video_title)
+    text = await generate_text_async(
+        client, model, prompt, _json_config(), cache, validate=lambda t: _parse_groups(t, sections)
+    )
+    return _parse_groups(text, sections)
+
+
+def consolidate_sections(
+    client: genai.Client,
+    sections: list[Section],
+    target_count: int,
+    video_title: str,
+    model: str = "gemini-2.5-flash",
+    cache: ResponseCache | None = None,
+) -> list[Section]:
+    """Blocking :func:`consolidate_sections_async`, for callers without an event loop."""
+    return asyncio.run(consolidate_sections_async(client, sections, target_count, video_title, model, cache))
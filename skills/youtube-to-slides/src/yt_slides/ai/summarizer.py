@@ -1,22 +1,27 @@
 """Summarize video sections for infographic generation."""
 
+from __future__ import annotations
+
+import asyncio
 import json
+from typing import TYPE_CHECKING
 
-from google import genai
-from google.genai import types
+from pydantic import BaseModel, ValidationError
 
+from yt_slides.ai.gemini_client import generate_text_async
+from yt_slides.ai.response_cache import ResponseCache
+from yt_slides.budget import estimate_tokens
 from yt_slides.models import Section, SectionSummary
 
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
 
-def summarize_section(
-    client: genai.Client,
-    section: Section,
-    video_title: str,
-    total_sections: int,
-    max_words: int = 350,
-    model: str = "gemini-2.5-flash",
-) -> SectionSummary:
-    """Summarize a section into infographic-ready content."""
+
+def _build_summary_prompt(
+    section: Section, video_title: str, total_sections: int, max_words: int
+) -> str:
+    """Build the summarization prompt for a single section."""
     duration_min = (section.end_seconds - section.start_seconds) / 60
 
     prompt = f"""You are creating content for an infographic slide. Summarize this section of a
@@ -42,17 +47,21 @@ Provide a JSON object with:
 CRITICAL: Total word count across all fields must stay under {max_words} words.
 
 Return JSON: {{"headline": "...", "key_points": [...], "summary": "...", "visual_suggestions": "..."}}"""
+    return prompt
+
+
+def _summary_config() -> types.GenerateContentConfig:
+    from google.genai import types
 
-    response = client.models.generate_content(
-        model=model,
-        contents=[prompt],
-        config=types.GenerateContentConfig(
-            response_mime_type="application/json",
-            temperature=0.4,
-        ),
+    return types.GenerateContentConfig(
+        response_mime_type="application/json",
+        temperature=0.4,
     )
 
-    data = json.loads(response.text)
+
+def _parse_summary(section: Section, text: str) -> SectionSummary:
+    """Parse the model's JSON response into a SectionSummary."""
+    data = json.loads(text)
     visual = data["visual_suggestions"]
     if isinstance(visual, list):
         visual = "; ".join(visual)
@@ -63,3 +72,174 @@ Return JSON: {{"headline": "...", "key_points": [...], "summary": "...", "visual
         summary=data["summary"],
         visual_suggestions=visual,
     )
+
+
+async def summarize_section_async(
+    client: genai.Client,
+    section: Section,
+    video_title: str,
+    total_sections: int,
+    max_words: int = 350,
+    model: str = "gemini-2.5-flash",
+    cache: ResponseCache | None = None,
+) -> SectionSummary:
+    """Summarize a section into infographic-ready content."""
+    prompt = _build_summary_prompt(section, video_title, total_sections, max_words)
+    text = await generate_text_async(
+        client, model, prompt, _summary_config(), cache, validate=lambda t: _parse_summary(section, t)
+    )
+    return _parse_summary(section, text)
+
+
+def summarize_section(
+    client: genai.Client,
+    section: Section,
+    video_title: str,
+    total_sections: int,
+    max_words: int = 350,
+    model: str = "gemini-2.5-flash",
+    cache: ResponseCache | None = None,
+) -> SectionSummary:
+    """Blocking :func:`summarize_section_async`, for callers without an event loop."""
+    return asyncio.run(
+        summarize_section_async(client, section, video_title, total_sections, max_words, model, cache)
+    )
+
+
+class _BatchSummaryItem(BaseModel):
+    """Response schema for one entry of a batched summarization request."""
+
+    index: int
+    headline: str
+    key_points: list[str]
+    summary: str
+    visual_suggestions: str
+
+
+def group_sections_by_tokens(
+    sections: list[Section], max_tokens: int
+) -> list[list[Section]]:
+    """Split sections into consecutive groups whose transcripts fit ``max_tokens``.
+
+    A section larger than the budget on its own still gets its own group.
+    """
+    groups: list[list[Section]] = []
+    current: list[Section] = []
+    used = 0
+    for section in sections:
+        tokens = estimate_tokens(section.transcript_text)
+        if current and used + tokens > max_tokens:
+            groups.append(current)
+            current, used = [], 0
+        current.append(section)
+        used += tokens
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _build_batch_summary_prompt(
+    sections: list[Section], video_title: str, total_sections: int, max_words: int
+) -> str:
+    """Build one prompt that summarizes several sections at once."""
+    blocks = "\n\n".join(
+        f"""=== SECTION {s.index}/{total_sections}: {s.title} ===
+Duration: {(s.end_seconds - s.start_seconds) / 60:.1f} minutes
+
+{s.transcript_text}"""
+        for s in sections
+    )
+
+    prompt = f"""You are creating content for infographic slides, one slide per section of a
+YouTube video. Summarize each section below into visual-friendly content.
+
+Video: {video_title}
+
+{blocks}
+
+For EVERY section above, create a summary optimized for a single infographic image.
+The infographic will contain text rendered directly in the image, so keep everything concise.
+
+Each entry must have:
+- index: The section number exactly as given in its header
+- headline: A punchy 3-7 word title for this slide (will be the largest text)
+- key_points: Array of 3-6 bullet points, each under 12 words
+- summary: 1-2 sentences providing context (under 40 words total)
+- visual_suggestions: Describe 1-2 visual metaphors, icons, or imagery that
+  would enhance understanding of this content
+
+CRITICAL: Total word count across all fields of one entry must stay under {max_words} words.
+
+Return a JSON array with one entry per section, in section order."""
+    return prompt
+
+
+def _batch_summary_config() -> types.GenerateContentConfig:
+    from google.genai import types
+
+    return types.GenerateContentConfig(
+        response_mime_type="application/json",
+        response_schema=list[_BatchSummaryItem],
+        temperature=0.4,
+    )
+
+
+def _parse_batch_summaries(
+    sections: list[Section], text: str
+) -> dict[int, SectionSummary]:
+    """Parse a batched response, keeping only well-formed entries.
+
+    Returns summaries keyed by section index. Sections that are missing or
+    malformed in the response are left out so the caller can retry them
+    individually.
+    """
+    section_map = {s.index: s for s in sections}
+    try:
+        entries = json.loads(text)
+    except ValueError:
+        return {}
+    if not isinstance(entries, list):
+        return {}
+
+    summaries: dict[int, SectionSummary] = {}
+    for entry in entries:
+        try:
+            item = _BatchSummaryItem.model_validate(entry)
+        except ValidationError:
+            continue
+        if item.index not in section_map or item.index in summaries:
+            continue
+        summaries[item.index] = SectionSummary(
+            section=section_map[item.index],
+            headline=item.headline,
+            key_points=item.key_points,
+            summary=item.summary,
+            visual_suggestions=item.visual_suggestions,
+        )
+    return summaries
+
+
+async def summarize_sections_batch_async(
+    client: genai.Client,
+    sections: list[Section],
+    video_title: str,
+    total_sections: int,
+    max_words: int = 350,
+    model: str = "gemini-2.5-flash",
+    cache: ResponseCache | None = None,
+) -> dict[int, SectionSummary]:
+    """Summarize several sections in a single structured-output request.
+
+    Returns summaries keyed by section index; sections missing from the
+    result should be summarized individually with
+    :func:`summarize_section_async`.
+    """
+    prompt = _build_batch_summary_prompt(sections, video_title, total_sections, max_words)
+
+    def _complete(text: str) -> None:
+        # A partial response still helps this run, but is not worth replaying
+        if len(_parse_batch_summaries(sections, text)) < len(sections):
+            raise ValueError("batched response is missing sections")
+
+    text = await generate_text_async(client, model, prompt, _batch_summary_config(), cache, validate=_complete)
+    return _parse_batch_summaries(sections, text)
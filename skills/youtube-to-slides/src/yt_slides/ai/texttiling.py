@@ -0,0 +1,148 @@
+"""Local lexical-cohesion (TextTiling-style) topic segmentation.
+
+Needs NumPy, installed with the ``local`` extra.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+
+from yt_slides.models import Chapter, Section
+from yt_slides.transcript import Transcript
+from yt_slides.youtube.chapters import assign_transcript_to_sections
+
+_WORD = re.compile(r"[a-z][a-z']+")
+_STOPWORDS = frozenset(
+    """
+    about above after again against all also and any are aren't because been before being
+    below between both but can can't cannot could couldn't did didn't does doesn't doing don't
+    down during each even ever every few for from further get gets getting go goes going gonna
+    got had hadn't has hasn't have haven't having he'd he'll he's her here here's hers herself
+    him himself his how how's i'd i'll i'm i've into isn't it's its itself just know let let's
+    like look lot lots make many maybe more most mustn't myself need now off okay once one only
+    other ought our ours ourselves out over own pretty really right said same say says see she
+    she'd she'll she's should shouldn't some something such sure take than that that's the
+    their theirs them themselves then there there's these they they'd they'll they're they've
+    thing things think this those through too under until very want wanna was wasn't way we'd
+    we'll we're we've well were weren't what what's when when's where where's which while who
+    who's whom why why's will with won't would wouldn't yeah yes you you'd you'll you're you've
+    your yours yourself yourselves music applause laughter actually basically kind sort
+    """.split()
+)
+
+
+def _tokens(text: str) -> list[str]:
+    return [w for w in _WORD.findall(text.lower()) if len(w) > 2 and w not in _STOPWORDS]
+
+
+def _title(counts: Counter, idf: dict[str, float]) -> str:
+    """Title a section after its most distinctive keywords."""
+    ranked = sorted(counts, key=lambda w: counts[w] * idf.get(w, 0.0), reverse=True)[:3]
+    words = [w.capitalize() for w in ranked]
+    if len(words) > 1:
+        return ", ".join(words[:-1]) + " & " + words[-1]
+    return words[0] if words else ""
+
+
+def segment_locally(
+    transcript: Transcript,
+    duration_seconds: float,
+    max_sections: int = 0,
+    bin_seconds: float = 30.0,
+    block_bins: int = 6,
+    min_section_seconds: float = 120.0,
+    max_vocabulary: int = 5000,
+) -> list[Section]:
+    """Split a transcript into topical sections without calling a model.
+
+    The transcript is cut into ``bin_seconds`` bins. At every gap between
+    bins, the TF-IDF vectors of the ``block_bins`` bins on either side are
+    compared, and boundaries are placed where the cosine similarity dips
+    deepest relative to the surrounding peaks. With ``max_sections`` the
+    strongest boundaries are kept; otherwise every dip deeper than the usual
+    TextTiling cutoff (mean minus half a standard deviation) becomes one.
+    Sections are at least ``min_section_seconds`` long and are titled
+    after their top keywords.
+    """
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    n_bins = max(1, int(np.ceil(duration_seconds / bin_seconds)))
+    bin_tokens: list[list[str]] = [[] for _ in range(n_bins)]
+    for start, text in zip(transcript.starts, transcript.texts()):
+        b = min(int(start // bin_seconds), n_bins - 1)
+        bin_tokens[b].extend(_tokens(text))
+
+    # Vocabulary: words in at least two bins and at most half of them
+    document_frequency = Counter(w for tokens in bin_tokens for w in set(tokens))
+    vocabulary = [
+        w
+        for w, df in document_frequency.most_common()
+        if 2 <= df <= max(2, n_bins // 2)
+    ][:max_vocabulary]
+    column = {w: i for i, w in enumerate(vocabulary)}
+    idf = {w: float(np.log(n_bins / document_frequency[w])) for w in document_frequency}
+
+    rows, cols = [], []
+    for b, tokens in enumerate(bin_tokens):
+        for w in tokens:
+            if w in column:
+                rows.append(b)
+                cols.append(column[w])
+    counts = np.zeros((n_bins, len(vocabulary)), dtype=np.float32)
+    np.add.at(counts, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)), 1.0)
+    counts *= np.array([idf[w] for w in vocabulary], dtype=np.float32)
+
+    boundaries: list[int] = []
+    if n_bins > 2 and vocabulary:
+        # Block sums on either side of every gap g (between bins g-1 and g)
+        k = max(1, min(block_bins, n_bins // 2))
+        cumulative = np.vstack([np.zeros((1, counts.shape[1]), dtype=np.float32), np.cumsum(counts, axis=0)])
+        gaps = np.arange(1, n_bins)
+        left = cumulative[gaps] - cumulative[np.maximum(gaps - k, 0)]
+        right = cumulative[np.minimum(gaps + k, n_bins)] - cumulative[gaps]
+        norms = np.linalg.norm(left, axis=1) * np.linalg.norm(right, axis=1)
+        similarity = np.einsum("ij,ij->i", left, right) / np.where(norms > 0, norms, 1.0)
+        similarity = np.convolve(np.pad(similarity, 1, mode="edge"), np.ones(3) / 3, mode="valid")
+
+        # Depth: how far each gap sits below the highest point within k gaps on each side
+        padded = np.pad(similarity, k, mode="edge")
+        windows = sliding_window_view(padded, 2 * k + 1)
+        depth = (windows[:, : k + 1].max(axis=1) - similarity) + (windows[:, k:].max(axis=1) - similarity)
+
+        # Only valleys of the similarity curve can be boundaries
+        edged = np.pad(similarity, 1, mode="constant", constant_values=np.inf)
+        valleys = (similarity <= edged[:-2]) & (similarity <= edged[2:])
+        candidates = np.argsort(-depth, kind="stable")
+        candidates = candidates[valleys[candidates]]
+        if max_sections <= 0:
+            cutoff = depth.mean() - depth.std() / 2
+            candidates = candidates[depth[candidates] > max(cutoff, 0.0)]
+        min_gap = max(1, int(np.ceil(min_section_seconds / bin_seconds)))
+        for c in candidates:
+            gap = int(gaps[c])
+            if gap < min_gap or n_bins - gap < min_gap:
+                continue
+            if any(abs(gap - b) < min_gap for b in boundaries):
+                continue
+            boundaries.append(gap)
+            if max_sections > 0 and len(boundaries) >= max_sections - 1:
+                break
+        boundaries.sort()
+
+    starts = [0.0] + [b * bin_seconds for b in boundaries]
+    ends = starts[1:] + [float(duration_seconds)]
+    bounds = [0] + boundaries + [n_bins]
+    chapters = [
+        Chapter(
+            title=_title(
+                Counter(w for tokens in bin_tokens[bounds[i]:bounds[i + 1]] for w in tokens), idf
+            )
+            or f"Part {i + 1}",
+            start_seconds=start,
+            end_seconds=end,
+        )
+        for i, (start, end) in enumerate(zip(starts, ends))
+    ]
+    return assign_transcript_to_sections(chapters, transcript)
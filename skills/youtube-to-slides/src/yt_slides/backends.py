@@ -0,0 +1,33 @@
+"""External services used by the pipeline, swappable for fakes in benchmarks."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from yt_slides.ai.gemini_client import create_client
+from yt_slides.models import VideoMetadata
+from yt_slides.transcript import Transcript
+from yt_slides.youtube.metadata import fetch_metadata
+from yt_slides.youtube.playlist import expand_collection
+from yt_slides.youtube.transcript import fetch_transcript
+
+
+class Backends:
+    """The YouTube fetchers and Gemini client factory a pipeline run uses.
+
+    ``expand_collection`` lists the video IDs of a playlist or channel URL
+    for batch runs and the work queue. Defaults to the real services; pass
+    replacements to run the pipeline against fake backends.
+    """
+
+    def __init__(
+        self,
+        fetch_metadata: Callable[[str], VideoMetadata] = fetch_metadata,
+        fetch_transcript: Callable[[str, str], Transcript] = fetch_transcript,
+        create_client: Callable = create_client,
+        expand_collection: Callable[[str], list[str]] = expand_collection,
+    ) -> None:
+        self.fetch_metadata = fetch_metadata
+        self.fetch_transcript = fetch_transcript
+        self.create_client = create_client
+        self.expand_collection = expand_collection
@@ -0,0 +1,336 @@
+"""Run many videos through one pipeline scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+from rich.console import Console
+
+from yt_slides.ai.response_cache import open_response_cache
+from yt_slides.backends import Backends
+from yt_slides.export import export_deck
+from yt_slides.image.batch_job import run_image_batch_async
+from yt_slides.image.cache import ImageCache, open_image_cache
+from yt_slides.image.postprocess import ImagePostprocessor
+from yt_slides.models import BatchItemResult, PendingImage
+from yt_slides.pipeline import record_batch_images, run_pipeline_async
+from yt_slides.scheduler import Scheduler
+from yt_slides.youtube.cache import FetchCache, open_fetch_cache
+from yt_slides.youtube.url_parser import collection_url, extract_video_id
+
+if TYPE_CHECKING:
+    from yt_slides.config import Settings
+
+
+def read_urls(lines: Iterable[str]) -> list[str]:
+    """Read URLs one per line, skipping blank lines and ``#`` comments."""
+    urls: list[str] = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            urls.append(line)
+    return urls
+
+
+def dedupe_urls(
+    urls: Iterable[str],
+) -> tuple[list[tuple[str, str]], list[BatchItemResult]]:
+    """Dedupe URLs by video ID.
+
+    Returns ``(video_id, url)`` pairs in first-seen order, plus failure
+    results for URLs that are not valid YouTube video URLs.
+    """
+    seen: set[str] = set()
+    unique: list[tuple[str, str]] = []
+    invalid: list[BatchItemResult] = []
+    for url in urls:
+        try:
+            video_id = extract_video_id(url)
+        except ValueError as e:
+            invalid.append(BatchItemResult(url=url, video_id="", error=str(e).splitlines()[0]))
+            continue
+        if video_id not in seen:
+            seen.add(video_id)
+            unique.append((video_id, url))
+    return unique, invalid
+
+
+def expand_urls(
+    urls: Iterable[str],
+    settings: Settings,
+    backends: Backends | None = None,
+    console: Console | None = None,
+) -> tuple[list[str], list[BatchItemResult]]:
+    """Replace playlist and channel URLs with the URLs of their videos.
+
+    Up to ``settings.fetch_concurrency`` collections are expanded at once.
+    Their videos that already have finished output are left out; video
+    URLs given directly are always kept. Returns the URLs in input order,
+    plus failure results for collections that could not be expanded.
+    """
+    urls = list(urls)
+    backends = backends or Backends()
+    console = console or Console()
+    collections = {url: collection_url(url) for url in urls}
+    pending = list(dict.fromkeys(c for c in collections.values() if c))
+    if not pending:
+        return urls, []
+
+    expanded: dict[str, list[str]] = {}
+    failures: dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=min(max(1, settings.fetch_concurrency), len(pending))) as pool:
+        futures = {c: pool.submit(backends.expand_collection, c) for c in pending}
+        for collection, future in futures.items():
+            try:
+                expanded[collection] = future.result()
+            except Exception as e:
+                failures[collection] = str(e).splitlines()[0] if str(e) else type(e).__name__
+
+    result: list[str] = []
+    invalid: list[BatchItemResult] = []
+    seen: set[str] = set()
+    for url in urls:
+        collection = collections[url]
+        if collection is None:
+            result.append(url)
+            continue
+        if collection in seen:
+            continue
+        seen.add(collection)
+        if collection in failures:
+            console.print(f"[red]Could not list {url}: {failures[collection]}[/red]")
+            invalid.append(BatchItemResult(url=url, video_id="", error=failures[collection]))
+            continue
+        video_ids = expanded[collection]
+        todo = [v for v in video_ids if not has_finished_output(Path(settings.output_dir) / v)]
+        console.print(
+            f"  {url}: {len(video_ids)} videos"
+            + (f", skipping {len(video_ids) - len(todo)} already finished" if len(todo) < len(video_ids) else "")
+        )
+        result.extend(f"https://www.youtube.com/watch?v={v}" for v in todo)
+    return result, invalid
+
+
+def has_finished_output(video_dir: Path) -> bool:
+    """Whether a complete run left ``metadata.json`` and every slide it lists."""
+    try:
+        metadata = json.loads((video_dir / "metadata.json").read_text())
+    except (OSError, ValueError):
+        return False
+    sections = metadata.get("sections") or []
+    return (
+        not metadata.get("incomplete")
+        and bool(sections)
+        and all((video_dir / s.get("image_file", "")).is_file() for s in sections)
+    )
+
+
+def _prefetch(video_id: str, settings: Settings, fetch_cache: FetchCache, backends: Backends) -> None:
+    """Fetch a video's metadata and transcript into the fetch cache.
+
+    Errors are left for the pipeline run, which fetches again and reports them.
+    """
+    language = settings.transcript_language
+    try:
+        if fetch_cache.load_metadata(video_id) is None:
+            fetch_cache.save_metadata(backends.fetch_metadata(video_id))
+        if fetch_cache.load_transcript(video_id, language) is None:
+            fetch_cache.save_transcript(video_id, language, backends.fetch_transcript(video_id, language))
+    except Exception:
+        pass
+
+
+def run_batch(
+    urls: Iterable[str],
+    settings: Settings,
+    style: str = "davinci",
+    dry_run: bool = False,
+    console: Console | None = None,
+    resume: bool = False,
+    refresh: bool = False,
+    image_batch: bool = False,
+) -> list[BatchItemResult]:
+    """Synchronous wrapper around :func:`run_batch_async`."""
+    return asyncio.run(
+        run_batch_async(
+            urls,
+            settings,
+            style=style,
+            dry_run=dry_run,
+            console=console,
+            resume=resume,
+            refresh=refresh,
+            image_batch=image_batch,
+        )
+    )
+
+
+async def run_batch_async(
+    urls: Iterable[str],
+    settings: Settings,
+    style: str = "davinci",
+    dry_run: bool = False,
+    console: Console | None = None,
+    resume: bool = False,
+    refresh: bool = False,
+    image_batch: bool = False,
+    backends: Backends | None = None,
+) -> list[BatchItemResult]:
+    """Process many videos concurrently under one shared Gemini rate budget.
+
+    Up to ``settings.batch_concurrency`` videos run at once; all of them share
+    one client and one :class:`Scheduler`. A failing video is recorded and
+    does not stop the others. Results are returned in input order. Slides
+    of all videos are post-processed in one shared process pool.
+
+    With ``image_batch``, the image prompts of every video are collected and
+    rendered by a single Gemini Batch API job once all text stages are done.
+
+    Playlist and channel URLs are expanded with :func:`expand_urls`. While
+    videos wait for their turn, their metadata and transcripts are fetched
+    into the fetch cache ``settings.fetch_concurrency`` at a time, so the
+    pipeline runs rarely wait on YouTube.
+    """
+    console = console or Console()
+    backends = backends or Backends()
+    urls, unlisted = await asyncio.to_thread(expand_urls, urls, settings, backends, console)
+    unique, invalid = dedupe_urls(urls)
+    invalid = unlisted + invalid
+    client = backends.create_client(settings.gemini_api_key, settings.gemini_base_url)
+    scheduler = Scheduler(settings)
+    response_cache = open_response_cache(settings)
+    image_cache = open_image_cache(settings)
+    postprocessor = ImagePostprocessor.from_settings(settings)
+    videos = asyncio.Semaphore(max(1, settings.batch_concurrency))
+    pending_images: list[PendingImage] | None = [] if image_batch else None
+    fetch_cache = open_fetch_cache(settings)
+    prefetches: dict[str, Future] = {}
+    fetcher = ThreadPoolExecutor(max_workers=max(1, settings.fetch_concurrency))
+    if fetch_cache and not refresh and len(unique) > 1:
+        # Submitted in input order, so the pool works ahead of the pipeline runs
+        for video_id, _ in unique:
+            prefetches[video_id] = fetcher.submit(_prefetch, video_id, settings, fetch_cache, backends)
+
+    async def _run_one(video_id: str, url: str) -> BatchItemResult:
+        async with videos:
+            if video_id in prefetches:
+                await asyncio.wrap_future(prefetches[video_id])
+            console.print(f"[bold]Starting {video_id}[/bold]")
+            try:
+                results = await run_pipeline_async(
+                    url=url,
+                    settings=settings,
+                    style=style,
+                    dry_run=dry_run,
+                    console=console,
+                    client=client,
+                    scheduler=scheduler,
+                    show_progress=False,
+                    resume=resume,
+                    refresh=refresh,
+                    response_cache=response_cache,
+                    image_cache=image_cache,
+                    image_batch=image_batch,
+                    pending_images=pending_images,
+                    backends=backends,
+                    postprocessor=postprocessor,
+                )
+            except Exception as e:
+                console.print(f"[red]Failed {video_id}: {e}[/red]")
+                return BatchItemResult(url=url, video_id=video_id, error=str(e))
+            console.print(f"[green]Finished {video_id}: {len(results)} slides[/green]")
+            return BatchItemResult(
+                url=url,
+                video_id=video_id,
+                slides=len(results),
+                output_dir=str(Path(settings.output_dir) / video_id),
+            )
+
+    try:
+        with postprocessor:
+            outcomes = await asyncio.gather(*(_run_one(vid, url) for vid, url in unique))
+            if pending_images:
+                await _render_batch(
+                    client, pending_images, outcomes, settings, image_cache, postprocessor, console
+                )
+    finally:
+        fetcher.shutdown(wait=False, cancel_futures=True)
+    if response_cache:
+        console.print(
+            f"Response cache: {response_cache.hits} hits, {response_cache.misses} misses"
+        )
+    if image_cache and not dry_run:
+        console.print(f"Image cache: {image_cache.hits} hits, {image_cache.misses} misses")
+    return list(outcomes) + invalid
+
+
+async def _render_batch(
+    client,
+    pending_images: list[PendingImage],
+    outcomes: list[BatchItemResult],
+    settings: Settings,
+    image_cache: ImageCache | None,
+    postprocessor: ImagePostprocessor,
+    console: Console,
+) -> None:
+    """Render all collected images in one batch job and mark failed videos.
+
+    Each video's ``metadata.json`` gets the post-processing details of its
+    slides, and videos whose slides all rendered are exported as decks.
+    """
+    try:
+        failed = await run_image_batch_async(
+            client,
+            pending_images,
+            model=settings.gemini_image_model,
+            aspect_ratio=settings.image_aspect_ratio,
+            poll_seconds=settings.batch_poll_seconds,
+            image_cache=image_cache,
+            console=console,
+            postprocessor=postprocessor,
+        )
+    except Exception as e:
+        console.print(f"[red]Batch image job failed: {e}[/red]")
+        failed = pending_images
+
+    # Videos whose own run failed wrote no metadata for the job's slides
+    crashed = {outcome.video_id for outcome in outcomes if outcome.error}
+    missing: dict[str, int] = {}
+    for image in failed:
+        missing[image.video_id] = missing.get(image.video_id, 0) + 1
+    for outcome in outcomes:
+        if outcome.video_id in missing and not outcome.error:
+            outcome.error = (
+                f"{missing[outcome.video_id]} slides were not produced; "
+                "re-run with --resume to retry them"
+            )
+
+    rendered: dict[str, list[PendingImage]] = {}
+    for image in pending_images:
+        rendered.setdefault(image.video_id, []).append(image)
+    for outcome in outcomes:
+        if outcome.video_id not in rendered or outcome.video_id in crashed:
+            continue
+        try:
+            await asyncio.to_thread(
+                record_batch_images,
+                Path(outcome.output_dir),
+                rendered[outcome.video_id],
+                postprocessor.stats,
+                [image for image in failed if image.video_id == outcome.video_id],
+            )
+        except (OSError, ValueError, KeyError) as e:
+            console.print(f"[red]Updating metadata of {outcome.video_id} failed: {e}[/red]")
+
+    if not settings.export_formats:
+        return
+    for outcome in outcomes:
+        if outcome.video_id in rendered and not outcome.error:
+            try:
+                await asyncio.to_thread(export_deck, Path(outcome.output_dir), settings.export_formats)
+            except Exception as e:
+                console.print(f"[red]Exporting {outcome.video_id} failed: {e}[/red]")
@@ -0,0 +1,332 @@
+"""Fake YouTube and Gemini backends for benchmarking the pipeline offline."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import random
+import re
+import threading
+import time
+
+from google.genai import errors, types
+from PIL import Image
+
+from yt_slides.backends import Backends
+from yt_slides.models import VideoMetadata
+from yt_slides.transcript import Transcript
+
+# Captured before any benchmark patches asyncio.sleep, so fake latency is
+# never counted as pipeline sleep time.
+_real_async_sleep = asyncio.sleep
+
+_TOPICS = [
+    "neural network training data gradient loss model layers weights",
+    "startup funding investors revenue growth market customers pricing",
+    "climate carbon emissions energy solar wind policy temperature",
+    "cooking recipe flavor garlic onion pan heat sauce seasoning",
+    "history empire war treaty kingdom revolution century trade",
+    "fitness workout muscle protein recovery sleep cardio strength",
+    "music chord melody rhythm guitar tempo harmony studio",
+    "space rocket orbit launch satellite mars gravity telescope",
+]
+_FILLERS = ["um", "uh", "so", "like", "you know", "basically", "right"]
+
+
+class LatencyDistribution:
+    """Samples simulated call latencies in seconds."""
+
+    def __init__(self, kind: str = "fixed", a: float = 0.0, b: float = 0.0) -> None:
+        if kind not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {kind}")
+        self.kind = kind
+        self.a = a
+        self.b = b
+
+    @classmethod
+    def fixed(cls, seconds: float) -> LatencyDistribution:
+        return cls("fixed", seconds)
+
+    @classmethod
+    def uniform(cls, low: float, high: float) -> LatencyDistribution:
+        return cls("uniform", low, high)
+
+    @classmethod
+    def lognormal(cls, median: float, sigma: float = 0.5) -> LatencyDistribution:
+        return cls("lognormal", median, sigma)
+
+    @classmethod
+    def parse(cls, spec: str) -> LatencyDistribution:
+        """Parse ``fixed:0.2``, ``uniform:0.1,0.5`` or ``lognormal:0.3,0.6``."""
+        kind, _, args = spec.partition(":")
+        values = [float(v) for v in args.split(",") if v]
+        return cls(kind, *values)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "lognormal":
+            return self.a * rng.lognormvariate(0.0, self.b)
+        return self.a
+
+
+def placeholder_png(width: int = 160, height: int = 90) -> bytes:
+    """A small valid PNG used as the canned image response."""
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 180, 140)).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def synthetic_transcript(
+    duration_seconds: int, seed: int = 0, snippet_seconds: float = 3.0
+) -> Transcript:
+    """Auto-caption-like transcript whose topic changes every few minutes.
+
+    Like rolling auto-captions, many snippets repeat the last few words of
+    the previous one.
+    """
+    rng = random.Random(seed)
+    echo = random.Random(seed + 1)  # separate, so the spoken text does not depend on it
+    texts: list[str] = []
+    starts: list[float] = []
+    start = 0.0
+    topic = rng.choice(_TOPICS).split()
+    topic_end = rng.uniform(180, 600)
+    while start < duration_seconds:
+        if start >= topic_end:
+            topic = rng.choice(_TOPICS).split()
+            topic_end = start + rng.uniform(180, 600)
+        words = [rng.choice(topic) for _ in range(rng.randint(5, 10))]
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words)), rng.choice(_FILLERS))
+        text = "[Music]" if rng.random() < 0.02 else " ".join(words)
+        if texts and echo.random() < 0.4 and text != "[Music]":
+            text = " ".join(texts[-1].split()[-echo.randint(2, 4):] + [text])
+        texts.append(text)
+        starts.append(round(start, 2))
+        start += snippet_seconds
+    return Transcript(texts, starts, [snippet_seconds] * len(starts))
+
+
+class FakeYouTube:
+    """Serves synthetic metadata and transcripts with simulated latency."""
+
+    def __init__(
+        self,
+        duration_seconds: int,
+        latency: LatencyDistribution | None = None,
+        seed: int = 0,
+    ) -> None:
+        self.duration_seconds = duration_seconds
+        self.latency = latency or LatencyDistribution.fixed(0.0)
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def fetch_metadata(self, video_id: str) -> VideoMetadata:
+        self._wait()
+        return VideoMetadata(
+            video_id=video_id,
+            title=f"Synthetic video {video_id}",
+            description="A synthetic video for benchmarking.",
+            channel_title="Benchmark Channel",
+            duration_seconds=self.duration_seconds,
+        )
+
+    def fetch_transcript(self, video_id: str, language: str = "en") -> Transcript:
+        self._wait()
+        return synthetic_transcript(self.duration_seconds, seed=self.seed)
+
+    def _wait(self) -> None:
+        with self._lock:
+            delay = self.latency.sample(self._rng)
+        time.sleep(delay)
+
+
+class CallStats:
+    """Counts fake Gemini calls and records when the first image was returned."""
+
+    def __init__(self) -> None:
+        self.text_calls = 0
+        self.image_calls = 0
+        self.rate_limited = 0
+        self.first_image_at: float | None = None
+
+
+class FakeGenaiClient:
+    """Stand-in for ``genai.Client`` answering the pipeline's prompts.
+
+    Responses are derived from the prompt: segmentation, consolidation,
+    batched and single summaries get plausible JSON, and image models get a
+    canned PNG. A fraction of calls (``error_rate``) fail with a 429
+    ``RESOURCE_EXHAUSTED`` error carrying a ``retry_delay`` hint.
+    """
+
+    def __init__(
+        self,
+        text_latency: LatencyDistribution | None = None,
+        image_latency: LatencyDistribution | None = None,
+        error_rate: float = 0.0,
+        retry_delay: float = 1.0,
+        image_bytes: bytes | None = None,
+        seed: int = 0,
+    ) -> None:
+        self.text_latency = text_latency or LatencyDistribution.fixed(0.0)
+        self.image_latency = image_latency or LatencyDistribution.fixed(0.0)
+        self.error_rate = error_rate
+        self.retry_delay = retry_delay
+        self.image_bytes = image_bytes or placeholder_png()
+        self.stats = CallStats()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.models = _FakeModels(self)
+        self.aio = _FakeAio(self)
+
+    def _prepare(self, model: str) -> float:
+        """Count the call, maybe raise a 429, and return the latency to wait."""
+        is_image = "image" in model
+        with self._lock:
+            if is_image:
+                self.stats.image_calls += 1
+            else:
+                self.stats.text_calls += 1
+            delay = (self.image_latency if is_image else self.text_latency).sample(self._rng)
+            throttled = self._rng.random() < self.error_rate
+            if throttled:
+                self.stats.rate_limited += 1
+        if throttled:
+            raise errors.ClientError(
+                429,
+                {
+                    "error": {
+                        "code": 429,
+                        "message": f"Resource exhausted. Please retry in {self.retry_delay:g}s.",
+                        "status": "RESOURCE_EXHAUSTED",
+                        "details": [
+                            {
+                                "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                                "retryDelay": f"{self.retry_delay:g}s",
+                            }
+                        ],
+                    }
+                },
+            )
+        return delay
+
+    def _respond(self, model: str, contents: list) -> types.GenerateContentResponse:
+        if "image" in model:
+            with self._lock:
+                if self.stats.first_image_at is None:
+                    self.stats.first_image_at = time.perf_counter()
+            part = types.Part(inline_data=types.Blob(data=self.image_bytes, mime_type="image/png"))
+        else:
+            part = types.Part(text=json.dumps(_answer(str(contents[0]))))
+        return types.GenerateContentResponse(
+            candidates=[types.Candidate(content=types.Content(role="model", parts=[part]))],
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=len(str(contents[0])) // 4,
+                candidates_token_count=1290 if "image" in model else 200,
+            ),
+        )
+
+
+class _FakeModels:
+    def __init__(self, client: FakeGenaiClient) -> None:
+        self._client = client
+
+    def generate_content(self, model: str, contents: list, config=None):
+        time.sleep(self._client._prepare(model))
+        return self._client._respond(model, contents)
+
+
+class _FakeAsyncModels:
+    def __init__(self, client: FakeGenaiClient) -> None:
+        self._client = client
+
+    async def generate_content(self, model: str, contents: list, config=None):
+        await _real_async_sleep(self._client._prepare(model))
+        return self._client._respond(model, contents)
+
+
+class _FakeAsyncBatches:
+    """Completes every batch job on the first poll."""
+
+    def __init__(self, client: FakeGenaiClient) -> None:
+        self._client = client
+        self._jobs: dict[str, types.BatchJob] = {}
+
+    async def create(self, model: str, src: list, config=None) -> types.BatchJob:
+        name = f"batches/fake-{len(self._jobs)}"
+        responses = [
+            types.InlinedResponse(response=self._client._respond(model, request.contents))
+            for request in src
+        ]
+        self._jobs[name] = types.BatchJob(
+            name=name,
+            state=types.JobState.JOB_STATE_SUCCEEDED,
+            dest=types.BatchJobDestination(inlined_responses=responses),
+        )
+        return types.BatchJob(name=name, state=types.JobState.JOB_STATE_PENDING)
+
+    async def get(self, name: str) -> types.BatchJob:
+        return self._jobs[name]
+
+
+class _FakeAio:
+    def __init__(self, client: FakeGenaiClient) -> None:
+        self.models = _FakeAsyncModels(client)
+        self.batches = _FakeAsyncBatches(client)
+
+
+def _answer(prompt: str):
+    """Build a plausible JSON answer for one of the pipeline's text prompts."""
+    summary = {
+        "headline": "Synthetic Slide Headline",
+        "key_points": ["First key point", "Second key point", "Third key point"],
+        "summary": "A short synthetic summary of this section.",
+        "visual_suggestions": "A simple diagram with arrows.",
+    }
+    batch = re.findall(r"=== SECTION (\d+)/", prompt)
+    if batch:
+        return [{"index": int(i), **summary} for i in batch]
+
+    consolidate = re.search(r"re-packaging a (\d+)-section YouTube video into exactly (\d+)", prompt)
+    if consolidate:
+        total, target = int(consolidate.group(1)), int(consolidate.group(2))
+        bounds = [round(k * total / target) for k in range(target + 1)]
+        return {
+            "groups": [
+                {"title": f"Theme {k + 1}", "section_indices": list(range(bounds[k] + 1, bounds[k + 1] + 1))}
+                for k in range(target)
+            ]
+        }
+
+    bounds = re.search(r"First section starts at (\d+), last section ends at (\d+)", prompt)
+    if bounds:
+        start, end = int(bounds.group(1)), int(bounds.group(2))
+        count = max(2, min(60, round((end - start) / 360)))
+        step = (end - start) / count
+        return {
+            "sections": [
+                {
+                    "title": f"Topic at {round(start + k * step)}s",
+                    "start_seconds": round(start + k * step),
+                    "end_seconds": round(start + (k + 1) * step),
+                }
+                for k in range(count)
+            ]
+        }
+
+    return summary
+
+
+def fake_backends(
+    youtube: FakeYouTube, client: FakeGenaiClient
+) -> Backends:
+    """Backends that route every external call to the given fakes."""
+    return Backends(
+        fetch_metadata=youtube.fetch_metadata,
+        fetch_transcript=youtube.fetch_transcript,
+        create_client=lambda *args, **kwargs: client,
+    )
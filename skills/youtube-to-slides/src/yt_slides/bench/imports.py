@@ -0,0 +1,136 @@
+"""Startup benchmark: how long importing the CLI takes, and what it pulls in."""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+import time
+
+from pydantic import BaseModel
+from rich.console import Console
+from rich.table import Table
+
+CLI_MODULE = "yt_slides.cli"
+DEFAULT_BUDGET_MS = 300.0
+
+# Dependencies that only some stages need; importing the CLI must not load them
+HEAVY_MODULES = (
+    "google.genai",
+    "yt_dlp",
+    "youtube_transcript_api",
+    "pydantic_settings",
+    "rich.progress",
+    "httpx",
+    "PIL",
+    "numpy",
+)
+
+
+class ImportBenchResult(BaseModel):
+    module: str
+    runs: int
+    import_ms: float  # median cumulative import time from -X importtime
+    help_ms: float  # median wall time of `python -m yt_slides.cli --help`
+    budget_ms: float
+    heavy_modules: list[str]  # HEAVY_MODULES imported along with the CLI
+    slowest: list[tuple[str, float]]  # the module's own imports by cumulative ms
+
+    @property
+    def ok(self) -> bool:
+        return self.import_ms <= self.budget_ms and not self.heavy_modules
+
+
+def _import_times(module: str) -> list[tuple[str, float, int]]:
+    """Name, cumulative ms and nesting depth of each import, in -X importtime order.
+
+    A module is listed after everything it imported, one level deeper.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times.append((name.strip(), int(cumulative) / 1000, depth))
+    return times
+
+
+def _direct_imports(times: list[tuple[str, float, int]], module: str) -> list[tuple[str, float]]:
+    """The modules ``module`` imported itself, with their cumulative ms."""
+    end = next(i for i, (name, _, depth) in enumerate(times) if name == module and depth == 0)
+    direct = []
+    for name, ms, depth in reversed(times[:end]):
+        if depth == 0:
+            break
+        if depth == 1:
+            direct.append((name, ms))
+    return direct
+
+
+def _help_ms() -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", CLI_MODULE, "--help"], capture_output=True, check=True
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def run_import_benchmark(
+    budget_ms: float = DEFAULT_BUDGET_MS, runs: int = 5, module: str = CLI_MODULE
+) -> ImportBenchResult:
+    """Import ``module`` in ``runs`` fresh interpreters and check the budget.
+
+    A first, untimed run warms the bytecode cache. Each run also records
+    which of :data:`HEAVY_MODULES` were imported. The medians of the import
+    time and of the wall time of ``--help`` are reported.
+    """
+    _import_times(module)
+    samples = [_import_times(module) for _ in range(runs)]
+    help_samples = [_help_ms() for _ in range(runs)]
+    last = samples[-1]
+    heavy = sorted(
+        m for m in HEAVY_MODULES if any(n == m or n.startswith(m + ".") for n, _, _ in last)
+    )
+    slowest = sorted(_direct_imports(last, module), key=lambda item: item[1], reverse=True)
+    return ImportBenchResult(
+        module=module,
+        runs=runs,
+        import_ms=round(
+            statistics.median(ms for s in samples for n, ms, d in s if n == module and d == 0), 1
+        ),
+        help_ms=round(statistics.median(help_samples), 1),
+        budget_ms=budget_ms,
+        heavy_modules=heavy,
+        slowest=[(name, round(ms, 1)) for name, ms in slowest[:8]],
+    )
+
+
+def render_import_result(result: ImportBenchResult, console: Console) -> None:
+    table = Table(title=f"Import time of {result.module} (median of {result.runs})")
+    table.add_column("Import (ms)", justify="right")
+    table.add_column("Budget (ms)", justify="right")
+    table.add_column("--help (ms)", justify="right")
+    table.add_column("Heavy modules")
+    table.add_row(
+        f"[green]{result.import_ms:.1f}[/green]"
+        if result.import_ms <= result.budget_ms
+        else f"[red]{result.import_ms:.1f}[/red]",
+        f"{result.budget_ms:.0f}",
+        f"{result.help_ms:.1f}",
+        f"[red]{', '.join(result.heavy_modules)}[/red]" if result.heavy_modules else "[green]none[/green]",
+    )
+    console.print(table)
+
+    table = Table(title=f"Slowest imports of {result.module}")
+    table.add_column("Module")
+    table.add_column("Cumulative (ms)", justify="right")
+    for name, ms in result.slowest:
+        table.add_row(name, f"{ms:.1f}")
+    console.print(table)
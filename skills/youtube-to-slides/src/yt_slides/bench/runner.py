@@ -0,0 +1,160 @@
+"""End-to-end pipeline benchmarks against fake backends."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+from unittest import mock
+
+from pydantic import BaseModel
+from rich.console import Console
+from rich.table import Table
+
+from yt_slides.bench.fakes import FakeGenaiClient, FakeYouTube, LatencyDistribution, fake_backends
+from yt_slides.config import Settings
+from yt_slides.pipeline import run_pipeline_async
+
+DEFAULT_DURATIONS_MINUTES = [5, 60, 300]
+
+
+class BenchResult(BaseModel):
+    scenario: str
+    duration_minutes: int
+    slides: int
+    wall_seconds: float
+    first_slide_seconds: Optional[float]
+    sleep_seconds: float
+    text_calls: int
+    image_calls: int
+    rate_limited: int
+    calls_per_slide: float
+
+
+class _SleepMeter:
+    """Wraps ``asyncio.sleep`` to total the time the pipeline spends sleeping.
+
+    The fakes sleep through the original function, so simulated API latency
+    is not counted. Sleeps in concurrent tasks overlap, so the total can
+    exceed wall time.
+    """
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self._sleep = asyncio.sleep
+
+    async def __call__(self, delay: float, result=None):
+        start = time.perf_counter()
+        try:
+            return await self._sleep(delay, result)
+        finally:
+            self.total += time.perf_counter() - start
+
+
+def bench_settings(workdir: Path, **overrides) -> Settings:
+    """Settings isolated from the user's environment, with all caches off."""
+    values = dict(
+        gemini_api_key="fake",
+        output_dir=workdir / "output",
+        cache_dir=workdir / "cache",
+        response_cache_max_mb=0,
+        image_cache=False,
+        fetch_cache_ttl_hours=0,
+    )
+    values.update(overrides)
+    return Settings(_env_file=None, **values)
+
+
+async def run_scenario_async(
+    duration_minutes: int,
+    settings: Settings,
+    youtube_latency: LatencyDistribution | None = None,
+    text_latency: LatencyDistribution | None = None,
+    image_latency: LatencyDistribution | None = None,
+    error_rate: float = 0.0,
+    retry_delay: float = 1.0,
+    seed: int = 0,
+) -> BenchResult:
+    """Run the pipeline once on a synthetic video and measure it."""
+    youtube = FakeYouTube(duration_minutes * 60, latency=youtube_latency, seed=seed)
+    client = FakeGenaiClient(
+        text_latency=text_latency,
+        image_latency=image_latency,
+        error_rate=error_rate,
+        retry_delay=retry_delay,
+        seed=seed,
+    )
+    meter = _SleepMeter()
+    video_id = f"bench{duration_minutes:06d}"
+
+    start = time.perf_counter()
+    with mock.patch("asyncio.sleep", meter):
+        results = await run_pipeline_async(
+            url=video_id,
+            settings=settings,
+            console=Console(quiet=True),
+            show_progress=False,
+            backends=fake_backends(youtube, client),
+        )
+    wall = time.perf_counter() - start
+
+    stats = client.stats
+    slides = len(results)
+    return BenchResult(
+        scenario=f"{duration_minutes}-minute video",
+        duration_minutes=duration_minutes,
+        slides=slides,
+        wall_seconds=round(wall, 3),
+        first_slide_seconds=round(stats.first_image_at - start, 3) if stats.first_image_at else None,
+        sleep_seconds=round(meter.total, 3),
+        text_calls=stats.text_calls,
+        image_calls=stats.image_calls,
+        rate_limited=stats.rate_limited,
+        calls_per_slide=round((stats.text_calls + stats.image_calls) / slides, 2) if slides else 0.0,
+    )
+
+
+def run_benchmarks(
+    durations_minutes: list[int] | None = None,
+    workdir: Path | None = None,
+    settings_overrides: dict | None = None,
+    **scenario_options,
+) -> list[BenchResult]:
+    """Run one benchmark scenario per video duration.
+
+    Each scenario gets a fresh output directory. ``settings_overrides`` are
+    applied on top of :func:`bench_settings`; ``scenario_options`` are passed
+    to :func:`run_scenario_async`.
+    """
+    durations_minutes = durations_minutes or DEFAULT_DURATIONS_MINUTES
+    with tempfile.TemporaryDirectory(prefix="yt-slides-bench-") as tmp:
+        base = workdir or Path(tmp)
+        results = []
+        for minutes in durations_minutes:
+            settings = bench_settings(base / f"{minutes}m", **(settings_overrides or {}))
+            results.append(asyncio.run(run_scenario_async(minutes, settings, **scenario_options)))
+        return results
+
+
+def render_results(results: list[BenchResult], console: Console) -> None:
+    table = Table(title="Pipeline benchmark")
+    table.add_column("Scenario")
+    table.add_column("Slides", justify="right")
+    table.add_column("Wall (s)", justify="right")
+    table.add_column("First slide (s)", justify="right")
+    table.add_column("Sleep (s)", justify="right")
+    table.add_column("Calls/slide", justify="right")
+    table.add_column("429s", justify="right")
+    for r in results:
+        table.add_row(
+            r.scenario,
+            str(r.slides),
+            f"{r.wall_seconds:.2f}",
+            f"{r.first_slide_seconds:.2f}" if r.first_slide_seconds is not None else "-",
+            f"{r.sleep_seconds:.2f}",
+            f"{r.calls_per_slide:.2f}",
+            str(r.rate_limited),
+        )
+    console.print(table)
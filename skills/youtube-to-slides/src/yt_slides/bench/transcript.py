@@ -0,0 +1,128 @@
+"""Micro-benchmark of building a long transcript and mapping it onto sections."""
+
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+
+from pydantic import BaseModel
+from rich.console import Console
+from rich.table import Table
+
+from yt_slides.models import Chapter, TranscriptSnippet
+from yt_slides.transcript import Transcript
+from yt_slides.youtube.chapters import assign_transcript_to_sections
+
+DEFAULT_SNIPPETS = 100_000
+
+
+class TranscriptBenchResult(BaseModel):
+    snippets: int
+    sections: int
+    objects_build_seconds: float  # one TranscriptSnippet per caption line
+    objects_mb: float
+    columnar_build_seconds: float  # Transcript
+    columnar_mb: float
+    scan_seconds: float
+    indexed_seconds: float
+    speedup: float
+    identical: bool
+
+
+def _assign_by_scan(chapters: list[Chapter], transcript: list[TranscriptSnippet]) -> list[str]:
+    """The per-section full scan the index replaces, kept as a reference."""
+    return [
+        " ".join(s.text for s in transcript if c.start_seconds <= s.start < c.end_seconds)
+        for c in chapters
+    ]
+
+
+def _measure(build):
+    """Run ``build()``, returning its result, seconds taken and MB allocated."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = build()
+        elapsed = time.perf_counter() - start
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, size / 2**20
+
+
+def run_transcript_benchmark(
+    snippets: int = DEFAULT_SNIPPETS, sections: int = 200, seed: int = 0
+) -> TranscriptBenchResult:
+    """Compare transcript representations and section assignment strategies.
+
+    Builds ``snippets`` two-second caption lines both as pydantic objects and
+    as a columnar :class:`Transcript`, then splits them into ``sections``
+    chapters of random length with a full scan per section and with the
+    start-time lookup, checking that both produce the same section text.
+    Build times include tracing allocations, so compare them with each other
+    only.
+    """
+    rng = random.Random(seed)
+    raw = [(f"word{i % 977} word{i % 101} {i}", i * 2.0, 2.0) for i in range(snippets)]
+    objects, objects_seconds, objects_mb = _measure(
+        lambda: [TranscriptSnippet(text=t, start=s, duration=d) for t, s, d in raw]
+    )
+    transcript, columnar_seconds, columnar_mb = _measure(
+        lambda: Transcript((r[0] for r in raw), (r[1] for r in raw), (r[2] for r in raw))
+    )
+    duration = snippets * 2.0
+    cuts = sorted(rng.uniform(0, duration) for _ in range(sections - 1))
+    bounds = [0.0] + cuts + [duration]
+    chapters = [
+        Chapter(title=f"Part {i + 1}", start_seconds=bounds[i], end_seconds=bounds[i + 1])
+        for i in range(sections)
+    ]
+
+    start = time.perf_counter()
+    expected = _assign_by_scan(chapters, objects)
+    scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [s.transcript_text for s in assign_transcript_to_sections(chapters, transcript)]
+    indexed = time.perf_counter() - start
+
+    return TranscriptBenchResult(
+        snippets=snippets,
+        sections=sections,
+        objects_build_seconds=round(objects_seconds, 4),
+        objects_mb=round(objects_mb, 1),
+        columnar_build_seconds=round(columnar_seconds, 4),
+        columnar_mb=round(columnar_mb, 1),
+        scan_seconds=round(scan, 4),
+        indexed_seconds=round(indexed, 4),
+        speedup=round(scan / indexed, 1) if indexed else 0.0,
+        identical=actual == expected,
+    )
+
+
+def render_transcript_result(result: TranscriptBenchResult, console: Console) -> None:
+    table = Table(title=f"Transcript of {result.snippets:,} snippets")
+    table.add_column("Representation")
+    table.add_column("Build (s)", justify="right")
+    table.add_column("Memory (MB)", justify="right")
+    table.add_row("TranscriptSnippet list", f"{result.objects_build_seconds:.3f}", f"{result.objects_mb:.1f}")
+    table.add_row("Transcript (columnar)", f"{result.columnar_build_seconds:.3f}", f"{result.columnar_mb:.1f}")
+    console.print(table)
+
+    table = Table(title="Transcript-to-section assignment")
+    table.add_column("Snippets", justify="right")
+    table.add_column("Sections", justify="right")
+    table.add_column("Full scan (s)", justify="right")
+    table.add_column("Indexed (s)", justify="right")
+    table.add_column("Speedup", justify="right")
+    table.add_column("Identical")
+    table.add_row(
+        f"{result.snippets:,}",
+        str(result.sections),
+        f"{result.scan_seconds:.3f}",
+        f"{result.indexed_seconds:.3f}",
+        f"{result.speedup:.1f}x",
+        "[green]yes[/green]" if result.identical else "[red]no[/red]",
+    )
+    console.print(table)
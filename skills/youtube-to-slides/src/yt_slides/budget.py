@@ -0,0 +1,179 @@
+"""Token and image budgets for a pipeline run."""
+
+from __future__ import annotations
+
+import threading
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from yt_slides.models import VideoMetadata
+from yt_slides.transcript import Transcript
+
+if TYPE_CHECKING:
+    from yt_slides.config import Settings
+
+# Rough per-slide costs used when planning a run, in tokens. Summary prompts
+# carry their share of the transcript on top of the instructions; summary
+# output includes an allowance for the model's thinking tokens.
+_SUMMARY_PROMPT_TOKENS = 350
+_IMAGE_PROMPT_TOKENS = 900
+_IMAGE_OUTPUT_TOKENS = 1290  # one 1024px image
+_SEGMENT_PROMPT_TOKENS = 400
+_SEGMENT_TIMESTAMP_TOKENS = 4  # one "[m:ss]" marker per 15 seconds
+_SEGMENT_OUTPUT_TOKENS_PER_SECTION = 40
+_CONSOLIDATE_TOKENS_PER_SECTION = 30
+
+_active: ContextVar[TokenBudget | None] = ContextVar("yt_slides_budget", default=None)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (about four characters per token)."""
+    return len(text) // 4 + 1
+
+
+class BudgetExceededError(Exception):
+    """Raised when a run would exceed, or has exceeded, its token or image budget."""
+
+
+class TokenBudget:
+    """Input/output token and image limits for one run; 0 means unlimited.
+
+    Use as ``with budget:`` around the run so that Gemini calls made below it
+    are charged through :func:`charge`.
+    """
+
+    def __init__(self, max_input_tokens: int = 0, max_output_tokens: int = 0, max_images: int = 0) -> None:
+        self.max_input_tokens = max_input_tokens
+        self.max_output_tokens = max_output_tokens
+        self.max_images = max_images
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.images = 0
+        self._lock = threading.Lock()
+        self._tokens: list = []
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> TokenBudget:
+        return cls(settings.max_input_tokens, settings.max_output_tokens, settings.max_images)
+
+    @property
+    def limited(self) -> bool:
+        return bool(self.max_input_tokens or self.max_output_tokens or self.max_images)
+
+    def __enter__(self) -> TokenBudget:
+        self._tokens.append(_active.set(self))
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _active.reset(self._tokens.pop())
+
+    @property
+    def exceeded(self) -> str:
+        """Why the token budget is used up, or an empty string."""
+        if self.max_input_tokens and self.input_tokens >= self.max_input_tokens:
+            return f"input tokens {self.input_tokens:,}/{self.max_input_tokens:,}"
+        if self.max_output_tokens and self.output_tokens >= self.max_output_tokens:
+            return f"output tokens {self.output_tokens:,}/{self.max_output_tokens:,}"
+        return ""
+
+    def check(self) -> None:
+        """Raise :class:`BudgetExceededError` if no further calls may start."""
+        reason = self.exceeded
+        if reason:
+            raise BudgetExceededError(f"Token budget exhausted ({reason})")
+
+    def reserve_image(self) -> None:
+        """Claim one image from the budget before rendering it."""
+        self.check()
+        with self._lock:
+            if self.max_images and self.images >= self.max_images:
+                raise BudgetExceededError(f"Image budget exhausted ({self.images}/{self.max_images})")
+            self.images += 1
+
+    def add_usage(self, response) -> None:
+        usage = response.usage_metadata
+        if not usage:
+            return
+        with self._lock:
+            self.input_tokens += usage.prompt_token_count or 0
+            self.output_tokens += (usage.candidates_token_count or 0) + (usage.thoughts_token_count or 0)
+
+    def usage(self) -> dict:
+        return {
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "images": self.images,
+            "max_input_tokens": self.max_input_tokens,
+            "max_output_tokens": self.max_output_tokens,
+            "max_images": self.max_images,
+        }
+
+    def plan_sections(
+        self,
+        metadata: VideoMetadata,
+        transcript: Transcript,
+        settings: Settings,
+        segmented_locally: bool,
+        with_images: bool = True,
+    ) -> int:
+        """Estimate the run's usage locally and return how many slides fit.
+
+        ``segmented_locally`` means sections come from chapters or the local
+        segmenter, without a segmentation call. Returns 0 when the budget
+        imposes no limit, including when it allows at least one slide per
+        transcript snippet, more than any run produces. Raises
+        :class:`BudgetExceededError` if not even one slide fits.
+        """
+        if not self.limited:
+            return 0
+        transcript_tokens = estimate_tokens(transcript.text)
+        guess = max(4, metadata.duration_seconds // 300)
+
+        fixed_in = transcript_tokens  # every snippet is summarized once
+        fixed_out = 0
+        if not segmented_locally:
+            fixed_in += (
+                _SEGMENT_PROMPT_TOKENS
+                + transcript_tokens
+                + metadata.duration_seconds // 15 * _SEGMENT_TIMESTAMP_TOKENS
+            )
+            fixed_out += guess * _SEGMENT_OUTPUT_TOKENS_PER_SECTION
+        fixed_in += guess * _CONSOLIDATE_TOKENS_PER_SECTION  # in case sections are merged
+        per_in = _SUMMARY_PROMPT_TOKENS + (_IMAGE_PROMPT_TOKENS if with_images else 0)
+        per_out = int(settings.max_words_per_infographic * 2) + (_IMAGE_OUTPUT_TOKENS if with_images else 0)
+
+        limits = []
+        if self.max_input_tokens:
+            limits.append((self.max_input_tokens - fixed_in) // per_in)
+        if self.max_output_tokens:
+            limits.append((self.max_output_tokens - fixed_out) // per_out)
+        if self.max_images and with_images:
+            limits.append(self.max_images)
+        if not limits:
+            return 0
+        slides = min(limits)
+        if slides < 1:
+            raise BudgetExceededError(
+                f"Budget too small for this video: about {fixed_in + per_in:,} input and "
+                f"{fixed_out + per_out:,} output tokens are needed for a single slide"
+            )
+        return slides if slides < len(transcript) else 0
+
+
+def clamp_sections(max_sections: int, planned: int) -> int:
+    """Lower a ``max_sections`` setting (0 = unlimited) to a planned slide count.
+
+    ``planned`` is a :meth:`TokenBudget.plan_sections` result, where 0 means
+    the budget sets no limit. The setting is returned unchanged unless
+    ``planned`` is tighter.
+    """
+    if planned > 0 and (max_sections == 0 or planned < max_sections):
+        return planned
+    return max_sections
+
+
+def charge(response) -> None:
+    """Add a Gemini response's reported token usage to the active budget."""
+    budget = _active.get()
+    if budget is not None:
+        budget.add_usage(response)
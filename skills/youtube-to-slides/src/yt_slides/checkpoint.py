@@ -0,0 +1,125 @@
+"""Per-stage checkpoints so interrupted runs can resume where they stopped."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import uuid
+from pathlib import Path
+
+from yt_slides.models import ImageStats, Section, SectionSummary, VideoMetadata
+from yt_slides.transcript import Transcript
+
+
+def fingerprint(*parts) -> str:
+    """Stable short hash of the inputs that produced a stage's output."""
+    raw = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+class CheckpointStore:
+    """Stage outputs stored under ``<video_dir>/.checkpoints/``.
+
+    Every derived checkpoint records the fingerprint of the inputs it was
+    built from; it is only reused when ``resume`` is set and the fingerprint
+    still matches. Without ``resume`` checkpoints are written but never read,
+    so a normal run always starts fresh.
+    """
+
+    def __init__(self, video_dir: Path, resume: bool = False) -> None:
+        self.root = video_dir / ".checkpoints"
+        self.resume = resume
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    # -- metadata and transcript ------------------------------------------
+
+    def load_metadata(self) -> VideoMetadata | None:
+        data = self._read("metadata.json")
+        return VideoMetadata(**data["value"]) if data else None
+
+    def save_metadata(self, metadata: VideoMetadata) -> None:
+        self._write("metadata.json", "", metadata.model_dump())
+
+    def load_transcript(self, language: str) -> Transcript | None:
+        data = self._read("transcript.json", fingerprint(language))
+        if not data:
+            return None
+        rows = data["value"]
+        return Transcript((r[0] for r in rows), (r[1] for r in rows), (r[2] for r in rows))
+
+    def save_transcript(self, language: str, transcript: Transcript) -> None:
+        self._write(
+            "transcript.json",
+            fingerprint(language),
+            [list(row) for row in zip(transcript.texts(), transcript.starts, transcript.durations)],
+        )
+
+    # -- sections, summaries and prompts ----------------------------------
+
+    def load_sections(self, key: str) -> list[Section] | None:
+        data = self._read("sections.json", key)
+        return [Section(**s) for s in data["value"]] if data else None
+
+    def save_sections(self, key: str, sections: list[Section]) -> None:
+        self._write("sections.json", key, [s.model_dump() for s in sections])
+
+    def load_summary(self, slide: int, key: str) -> SectionSummary | None:
+        data = self._read(f"summaries/{slide:02d}.json", key)
+        return SectionSummary(**data["value"]) if data else None
+
+    def save_summary(self, slide: int, key: str, summary: SectionSummary) -> None:
+        self._write(f"summaries/{slide:02d}.json", key, summary.model_dump())
+
+    def save_prompt(self, slide: int, prompt: str) -> None:
+        self._write(f"prompts/{slide:02d}.json", fingerprint(prompt), prompt)
+
+    # -- images -------------------------------------------------------------
+
+    def has_image(self, slide: int, key: str, image_path: Path) -> bool:
+        """True if the image was completed with the same prompt and model."""
+        data = self._read(f"images/{slide:02d}.json", key)
+        return bool(
+            data
+            and isinstance(data["value"], dict)
+            and data["value"]["file"] == image_path.name
+            and image_path.exists()
+            and image_path.stat().st_size > 0
+        )
+
+    def load_image_stats(self, slide: int, key: str) -> ImageStats | None:
+        data = self._read(f"images/{slide:02d}.json", key)
+        if not data or not isinstance(data["value"], dict) or not data["value"].get("stats"):
+            return None
+        return ImageStats(**data["value"]["stats"])
+
+    def save_image(
+        self, slide: int, key: str, image_path: Path, stats: ImageStats | None = None
+    ) -> None:
+        self._write(
+            f"images/{slide:02d}.json",
+            key,
+            {"file": image_path.name, "stats": stats.model_dump() if stats else None},
+        )
+
+    # -- internals ----------------------------------------------------------
+
+    def _read(self, name: str, key: str = "") -> dict | None:
+        if not self.resume:
+            return None
+        path = self.root / name
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        if data.get("key") != key:
+            return None
+        return data
+
+    def _write(self, name: str, key: str, value) -> None:
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per writer: queue workers on other hosts may save the same checkpoint
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp.write_text(json.dumps({"key": key, "value": value}))
+        os.replace(tmp, path)
@@ -3,14 +3,39 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
+from typer.core import TyperGroup
 
-from yt_slides.config import Settings
-from yt_slides.pipeline import run_pipeline
+from yt_slides.export import EXPORT_FORMATS, export_deck, parse_export_formats
 
-app = typer.Typer(name="yt-slides", help="Convert YouTube videos into infographic slides")
+# Commands import the pipeline and its dependencies (google-genai, yt-dlp,
+# pydantic-settings, ...) when they run, so --help and usage errors stay fast.
+# `yt-slides bench --imports` checks that they stay out of this module's imports.
+if TYPE_CHECKING:
+    from yt_slides.config import Settings
+
+
+class _GenerateByDefault(TyperGroup):
+    """Runs ``generate`` when the first argument is not a command, e.g. ``yt-slides URL``."""
+
+    def parse_args(self, ctx, args: list[str]) -> list[str]:
+        own_options = {opt for param in self.get_params(ctx) for opt in param.opts}
+        if args and args[0] not in self.commands and args[0] not in own_options:
+            args = ["generate", *args]
+        return super().parse_args(ctx, args)
+
+
+# Plain help and usage errors: Typer's rich formatter imports rich.markdown and
+# markdown-it, which take longer than the rest of the CLI to load.
+app = typer.Typer(
+    name="yt-slides",
+    help="Convert YouTube videos into infographic slides",
+    rich_markup_mode=None,
+    cls=_GenerateByDefault,
+)
 console = Console()
 
 
@@ -21,22 +46,27 @@ def generate(
     aspect_ratio: str = typer.Option("16:9", "--ar", help="Aspect ratio (16:9, 4:3, 1:1)"),
     style: str = typer.Option("davinci", "--style", help="Style: davinci, magazine, comic, geek, chalkboard, collage, newspaper"),
     max_sections: int = typer.Option(0, "--max-sections", help="Max sections (0=unlimited)"),
+    segmenter: str = typer.Option(None, "--segmenter", help="Segmenter for videos without chapters: gemini or local"),
     gemini_key: str = typer.Option(None, "--gemini-key", envvar="GEMINI_API_KEY"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show prompts without generating images"),
+    resume: bool = typer.Option(False, "--resume", help="Reuse valid checkpoints from a previous run"),
+    regenerate: str = typer.Option("", "--regenerate", help="Comma-separated slide numbers to re-render (e.g. 3,5)"),
+    refresh: bool = typer.Option(False, "--refresh", help="Re-fetch metadata and transcript instead of using the cache"),
+    image_batch: bool = typer.Option(False, "--image-batch", help="Render images with one offline Gemini Batch API job"),
+    max_input_tokens: int = typer.Option(0, "--max-input-tokens", help="Input token budget (0=unlimited)"),
+    max_output_tokens: int = typer.Option(0, "--max-output-tokens", help="Output token budget (0=unlimited)"),
+    max_images: int = typer.Option(0, "--max-images", help="Image budget (0=unlimited)"),
 ) -> None:
     """Generate infographic slides from a YouTube video."""
-    # Load from .env first, then override with CLI flags if provided
-    overrides: dict = {
-        "output_dir": output_dir,
-        "image_aspect_ratio": aspect_ratio,
-        "max_sections": max_sections,
-    }
-    if gemini_key:
-        overrides["gemini_api_key"] = gemini_key
-    settings = Settings(**overrides)
+    from yt_slides.pipeline import run_pipeline
 
-    if not settings.gemini_api_key:
-        console.print("[red]Error: GEMINI_API_KEY is required. Set via --gemini-key or .env file.[/red]")
+    settings = _load_settings(
+        output_dir, aspect_ratio, max_sections, gemini_key, max_input_tokens, max_output_tokens, max_images, segmenter
+    )
+    try:
+        slides = {int(n) for n in regenerate.split(",") if n.strip()}
+    except ValueError:
+        console.print(f"[red]Error: --regenerate expects slide numbers like 3,5 (got {regenerate!r}).[/red]")
         raise typer.Exit(1)
 
     results = run_pipeline(
@@ -45,6 +75,10 @@ def generate(
         style=style,
         dry_run=dry_run,
         console=console,
+        resume=resume,
+        regenerate=slides,
+        refresh=refresh,
+        image_batch=image_batch,
     )
 
     console.print()
@@ -52,7 +86,350 @@ def generate(
         console.print(f"[green]Dry run complete. Generated {len(results)} prompts.[/green]")
     else:
         console.print(f"[green]Done! Generated {len(results)} infographic slides.[/green]")
-        console.print(f"[dim]Output: {results[0].image_path.rsplit('/', 1)[0]}[/dim]")
+        if results:
+            console.print(f"[dim]Output: {results[0].image_path.rsplit('/', 1)[0]}[/dim]")
+
+
+@app.command()
+def batch(
+    urls_file: typer.FileText = typer.Argument(..., help="File with one video, playlist or channel URL per line ('-' for stdin)"),
+    output_dir: Path = typer.Option(Path("./output"), "--output", "-o", help="Output directory"),
+    aspect_ratio: str = typer.Option("16:9", "--ar", help="Aspect ratio (16:9, 4:3, 1:1)"),
+    style: str = typer.Option("davinci", "--style", help="Style: davinci, magazine, comic, geek, chalkboard, collage, newspaper"),
+    max_sections: int = typer.Option(0, "--max-sections", help="Max sections per video (0=unlimited)"),
+    segmenter: str = typer.Option(None, "--segmenter", help="Segmenter for videos without chapters: gemini or local"),
+    gemini_key: str = typer.Option(None, "--gemini-key", envvar="GEMINI_API_KEY"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show prompts without generating images"),
+    resume: bool = typer.Option(False, "--resume", help="Reuse valid checkpoints from previous runs"),
+    refresh: bool = typer.Option(False, "--refresh", help="Re-fetch metadata and transcripts instead of using the cache"),
+    image_batch: bool = typer.Option(False, "--image-batch", help="Render all images with one offline Gemini Batch API job"),
+    max_input_tokens: int = typer.Option(0, "--max-input-tokens", help="Input token budget per video (0=unlimited)"),
+    max_output_tokens: int = typer.Option(0, "--max-output-tokens", help="Output token budget per video (0=unlimited)"),
+    max_images: int = typer.Option(0, "--max-images", help="Image budget per video (0=unlimited)"),
+) -> None:
+    """Generate slides for many videos under one shared Gemini rate budget."""
+    from rich.table import Table
+
+    from yt_slides.batch import read_urls, run_batch
+
+    settings = _load_settings(
+        output_dir, aspect_ratio, max_sections, gemini_key, max_input_tokens, max_output_tokens, max_images, segmenter
+    )
+    urls = read_urls(urls_file)
+    if not urls:
+        console.print("[red]Error: no URLs given.[/red]")
+        raise typer.Exit(1)
+
+    outcomes = run_batch(
+        urls,
+        settings=settings,
+        style=style,
+        dry_run=dry_run,
+        console=console,
+        resume=resume,
+        refresh=refresh,
+        image_batch=image_batch,
+    )
+
+    table = Table(title="Batch summary")
+    table.add_column("Video")
+    table.add_column("Status")
+    table.add_column("Slides", justify="right")
+    table.add_column("Details")
+    for o in outcomes:
+        if o.error:
+            table.add_row(o.video_id or o.url, "[red]failed[/red]", "-", o.error)
+        else:
+            table.add_row(o.video_id, "[green]ok[/green]", str(o.slides), o.output_dir)
+    console.print()
+    console.print(table)
+
+    failed = sum(1 for o in outcomes if o.error)
+    console.print(f"{len(outcomes) - failed} succeeded, {failed} failed.")
+    if failed:
+        raise typer.Exit(1)
+
+
+@app.command()
+def export(
+    video_id: str = typer.Argument(..., help="Video ID (a directory under the output directory)"),
+    output_dir: Path = typer.Option(Path("./output"), "--output", "-o", help="Output directory"),
+    formats: str = typer.Option(",".join(EXPORT_FORMATS), "--formats", help="Comma-separated deck formats: pdf, html"),
+) -> None:
+    """Export a generated video's slides as a PDF and a single-file HTML slideshow."""
+    video_dir = output_dir / video_id
+    if not (video_dir / "metadata.json").exists():
+        console.print(f"[red]Error: no metadata.json in {video_dir}; run generate first.[/red]")
+        raise typer.Exit(1)
+    try:
+        decks = export_deck(video_dir, parse_export_formats(formats))
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    for deck in decks:
+        console.print(f"[green]Wrote {deck}[/green]")
+
+
+@app.command()
+def serve(
+    host: str = typer.Option(None, "--host", help="Address to listen on (default SERVE_HOST or 127.0.0.1)"),
+    port: int = typer.Option(None, "--port", help="Port to listen on (default SERVE_PORT or 8765)"),
+    output_dir: Path = typer.Option(Path("./output"), "--output", "-o", help="Output directory"),
+    concurrency: int = typer.Option(None, "--concurrency", help="Jobs run at once (default BATCH_CONCURRENCY)"),
+    segmenter: str = typer.Option(None, "--segmenter", help="Segmenter for videos without chapters: gemini or local"),
+    gemini_key: str = typer.Option(None, "--gemini-key", envvar="GEMINI_API_KEY"),
+) -> None:
+    """Run a local HTTP server that queues and runs jobs with warm clients."""
+    from yt_slides.server import serve as run_server
+
+    settings = _load_settings(output_dir, "16:9", 0, gemini_key, segmenter=segmenter)
+    run_server(settings, host or settings.serve_host, port or settings.serve_port, concurrency, console)
+
+
+@app.command()
+def enqueue(
+    urls_file: typer.FileText = typer.Argument(..., help="File with one video, playlist or channel URL per line ('-' for stdin)"),
+    output_dir: Path = typer.Option(Path("./output"), "--output", "-o", help="Output directory shared by all workers"),
+    queue_path: Path = typer.Option(None, "--queue", help="Queue file (default QUEUE_PATH or <output>/queue.sqlite3)"),
+    aspect_ratio: str = typer.Option(None, "--ar", help="Aspect ratio (16:9, 4:3, 1:1)"),
+    style: str = typer.Option("davinci", "--style", help="Style: davinci, magazine, comic, geek, chalkboard, collage, newspaper"),
+    max_sections: int = typer.Option(None, "--max-sections", help="Max sections per video (0=unlimited)"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Build prompts without generating images"),
+    refresh: bool = typer.Option(False, "--refresh", help="Re-fetch metadata and transcripts instead of using the cache"),
+) -> None:
+    """Add videos to the work queue that `yt-slides worker` processes drain."""
+    from yt_slides.ai.prompt_builder import STYLE_PRESETS
+    from yt_slides.batch import expand_urls, read_urls
+    from yt_slides.models import JobRequest
+    from yt_slides.workqueue import WorkQueue
+
+    if style not in STYLE_PRESETS:
+        console.print(f"[red]Error: unknown style {style!r}; use one of {', '.join(STYLE_PRESETS)}.[/red]")
+        raise typer.Exit(1)
+    urls = read_urls(urls_file)
+    if not urls:
+        console.print("[red]Error: no URLs given.[/red]")
+        raise typer.Exit(1)
+    settings = _load_queue_settings(output_dir, queue_path)
+    urls, unlisted = expand_urls(urls, settings, console=console)
+    requests = [
+        JobRequest(
+            url=url, style=style, max_sections=max_sections, aspect_ratio=aspect_ratio, dry_run=dry_run, refresh=refresh
+        )
+        for url in urls
+    ]
+    try:
+        with WorkQueue.from_settings(settings) as queue:
+            outcomes = queue.enqueue(requests)
+    except ValueError as e:
+        console.print(f"[red]Error: {str(e).splitlines()[0]}[/red]")
+        raise typer.Exit(1)
+    for video_id, outcome in outcomes:
+        console.print(f"  {video_id}: {outcome}")
+    added = sum(1 for _, outcome in outcomes if outcome in ("added", "retried"))
+    console.print(f"Queued {added} of {len(outcomes)} videos.")
+    if unlisted:
+        raise typer.Exit(1)
+
+
+@app.command()
+def worker(
+    output_dir: Path = typer.Option(Path("./output"), "--output", "-o", help="Output directory shared by all workers"),
+    queue_path: Path = typer.Option(None, "--queue", help="Queue file (default QUEUE_PATH or <output>/queue.sqlite3)"),
+    concurrency: int = typer.Option(None, "--concurrency", help="Items run at once (default BATCH_CONCURRENCY)"),
+    exit_when_idle: bool = typer.Option(False, "--exit-when-idle", help="Stop once the queue has no pending or running items"),
+    segmenter: str = typer.Option(None, "--segmenter", help="Segmenter for videos without chapters: gemini or local"),
+    gemini_key: str = typer.Option(None, "--gemini-key", envvar="GEMINI_API_KEY"),
+) -> None:
+    """Process items from the work queue; run one per process or machine.
+
+    Token and image budgets from the environment cover each video as a
+    whole, summed over every worker that works on it.
+    """
+    from yt_slides.worker import run_worker
+
+    settings = _load_settings(output_dir, "16:9", 0, gemini_key, segmenter=segmenter)
+    if queue_path:
+        settings = settings.model_copy(update={"queue_path": queue_path})
+    result = run_worker(settings, concurrency, exit_when_idle, console)
+    console.print(f"{result.processed['done']} items finished, {result.processed['failed']} failed.")
+
+
+@app.command("queue")
+def queue_status(
+    output_dir: Path = typer.Option(Path("./output"), "--output", "-o", help="Output directory shared by all workers"),
+    queue_path: Path = typer.Option(None, "--queue", help="Queue file (default QUEUE_PATH or <output>/queue.sqlite3)"),
+) -> None:
+    """Show how many work queue items are pending, running, done or failed."""
+    from rich.table import Table
+
+    from yt_slides.workqueue import KINDS, WorkQueue
+
+    statuses = ("pending", "leased", "done", "failed")
+    with WorkQueue.from_settings(_load_queue_settings(output_dir, queue_path)) as queue:
+        counts = queue.counts()
+        failed = queue.failed()
+    table = Table(title=f"Work queue {queue.path}")
+    table.add_column("Kind")
+    for status in statuses:
+        table.add_column(status.capitalize(), justify="right")
+    for kind in KINDS:
+        table.add_row(kind, *(str(counts[kind].get(status, 0)) for status in statuses))
+    console.print(table)
+    for item in failed:
+        label = f"slide {item.slide}" if item.kind == "slide" else item.kind
+        console.print(f"[red]  {item.video_id} {label}: {item.error}[/red]")
+    if failed:
+        console.print("Re-run `yt-slides enqueue` with these videos to retry them.")
+
+
+@app.command()
+def bench(
+    durations: str = typer.Option("5,60,300", "--durations", help="Synthetic video lengths in minutes (e.g. 5,60,300)"),
+    text_concurrency: int = typer.Option(1, "--text-concurrency", help="Concurrent text requests"),
+    image_concurrency: int = typer.Option(1, "--image-concurrency", help="Concurrent image requests"),
+    text_rpm: int = typer.Option(0, "--text-rpm", help="Text requests per minute (0=unlimited)"),
+    image_rpm: int = typer.Option(0, "--image-rpm", help="Image requests per minute (0=unlimited)"),
+    text_latency: str = typer.Option("lognormal:0.05,0.5", "--text-latency", help="Fake text latency: fixed:S, uniform:LO,HI or lognormal:MEDIAN,SIGMA"),
+    image_latency: str = typer.Option("lognormal:0.2,0.5", "--image-latency", help="Fake image latency (same format)"),
+    youtube_latency: str = typer.Option("fixed:0.05", "--youtube-latency", help="Fake YouTube fetch latency (same format)"),
+    error_rate: float = typer.Option(0.0, "--error-rate", help="Fraction of Gemini calls failing with 429"),
+    retry_delay: float = typer.Option(1.0, "--retry-delay", help="Retry delay advertised by injected 429s"),
+    batch_summaries: bool = typer.Option(False, "--batch-summaries", help="Summarize many sections per request"),
+    json_output: Path = typer.Option(None, "--json", help="Also write the results to this JSON file"),
+    transcript_snippets: int = typer.Option(0, "--transcript-snippets", help="Also benchmark section assignment on a transcript this long (e.g. 100000)"),
+    imports: bool = typer.Option(False, "--imports", help="Only check CLI startup: import time and heavy dependencies"),
+    import_budget_ms: float = typer.Option(None, "--import-budget-ms", help="Import time budget for --imports (default 300)"),
+) -> None:
+    """Benchmark the pipeline end to end against fake YouTube and Gemini backends."""
+    if imports:
+        from yt_slides.bench.imports import DEFAULT_BUDGET_MS, render_import_result, run_import_benchmark
+
+        result = run_import_benchmark(import_budget_ms or DEFAULT_BUDGET_MS)
+        render_import_result(result, console)
+        if json_output:
+            json_output.write_text(result.model_dump_json(indent=2) + "\n")
+        if result.heavy_modules:
+            console.print(f"[red]Importing the CLI loads {', '.join(result.heavy_modules)}; import them where they are used.[/red]")
+        if result.import_ms > result.budget_ms:
+            console.print(f"[red]CLI import took {result.import_ms:.0f} ms, over the {result.budget_ms:.0f} ms budget.[/red]")
+        if not result.ok:
+            raise typer.Exit(1)
+        return
+
+    from yt_slides.bench.fakes import LatencyDistribution
+    from yt_slides.bench.runner import render_results, run_benchmarks
+
+    try:
+        minutes = [int(d) for d in durations.split(",") if d.strip()]
+        latencies = {
+            "text_latency": LatencyDistribution.parse(text_latency),
+            "image_latency": LatencyDistribution.parse(image_latency),
+            "youtube_latency": LatencyDistribution.parse(youtube_latency),
+        }
+    except (TypeError, ValueError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    results = run_benchmarks(
+        minutes,
+        settings_overrides={
+            "text_concurrency": text_concurrency,
+            "image_concurrency": image_concurrency,
+            "text_rpm": text_rpm,
+            "image_rpm": image_rpm,
+            "text_tpm": 0,
+            "batch_summaries": batch_summaries,
+        },
+        error_rate=error_rate,
+        retry_delay=retry_delay,
+        **latencies,
+    )
+    render_results(results, console)
+    if json_output:
+        json_output.write_text(
+            "[\n" + ",\n".join(r.model_dump_json(indent=2) for r in results) + "\n]\n"
+        )
+        console.print(f"[dim]Results written to {json_output}[/dim]")
+
+    if transcript_snippets:
+        from yt_slides.bench.transcript import render_transcript_result, run_transcript_benchmark
+
+        result = run_transcript_benchmark(transcript_snippets)
+        render_transcript_result(result, console)
+        if not result.identical:
+            console.print("[red]Indexed section assignment differs from a full scan.[/red]")
+            raise typer.Exit(1)
+
+
+def _load_queue_settings(output_dir: Path, queue_path: Path | None) -> Settings:
+    """Settings for commands that only touch the work queue; no API key needed."""
+    from yt_slides.config import Settings
+
+    overrides: dict = {"output_dir": output_dir}
+    if queue_path:
+        overrides["queue_path"] = queue_path
+    return Settings(**overrides)
+
+
+def _load_settings(
+    output_dir: Path,
+    aspect_ratio: str,
+    max_sections: int,
+    gemini_key: str | None,
+    max_input_tokens: int = 0,
+    max_output_tokens: int = 0,
+    max_images: int = 0,
+    segmenter: str | None = None,
+) -> Settings:
+    """Load settings from .env, overriding them with CLI flags if provided."""
+    from yt_slides.config import Settings
+    from yt_slides.image.postprocess import available_formats
+
+    overrides: dict = {
+        "output_dir": output_dir,
+        "image_aspect_ratio": aspect_ratio,
+        "max_sections": max_sections,
+    }
+    if gemini_key:
+        overrides["gemini_api_key"] = gemini_key
+    # Budget flags only override .env when given
+    for key, value in (
+        ("max_input_tokens", max_input_tokens),
+        ("max_output_tokens", max_output_tokens),
+        ("max_images", max_images),
+    ):
+        if value:
+            overrides[key] = value
+    if segmenter:
+        overrides["segmenter"] = segmenter
+    settings = Settings(**overrides)
+
+    if not settings.gemini_api_key:
+        console.print("[red]Error: GEMINI_API_KEY is required. Set via --gemini-key or .env file.[/red]")
+        raise typer.Exit(1)
+    formats = available_formats()
+    if settings.image_format.lower() not in formats:
+        console.print(
+            f"[red]Error: IMAGE_FORMAT {settings.image_format!r} is not supported here "
+            f"(use one of {', '.join(formats)}).[/red]"
+        )
+        raise typer.Exit(1)
+    try:
+        parse_export_formats(settings.export_formats)
+    except ValueError as e:
+        console.print(f"[red]Error: EXPORT_FORMATS: {e}.[/red]")
+        raise typer.Exit(1)
+    if settings.segmenter not in ("gemini", "local"):
+        console.print(f"[red]Error: unknown segmenter {settings.segmenter!r} (use gemini or local).[/red]")
+        raise typer.Exit(1)
+    if settings.segmenter == "local":
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            console.print("[red]Error: the local segmenter needs NumPy: pip install 'yt-slides\\[local]'[/red]")
+            raise typer.Exit(1)
+    return settings
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 """Configuration management via environment variables and .env file."""
 
 from pathlib import Path
+from typing import Optional
 
 from pydantic_settings import BaseSettings
 
@@ -10,16 +11,70 @@ class Settings(BaseSettings):
     # Gemini model settings
     gemini_text_model: str = "gemini-2.5-flash"
     gemini_image_model: str = "gemini-2.5-flash-image"
+    gemini_base_url: str = ""  # override the API endpoint (e.g. a local stand-in)
 
     # Image generation settings
     image_aspect_ratio: str = "16:9"
 
+    # Batch API settings (offline image generation)
+    batch_poll_seconds: float = 30.0
+
     # Output settings
     output_dir: Path = Path("./output")
-    image_format: str = "png"
+    image_format: str = "png"  # png, webp, jpeg or avif (transcoded with Pillow)
+    image_max_width: int = 0  # downscale wider slides; 0 = keep the model's size
+    image_quality: int = 85  # for webp, jpeg and avif
+    thumbnail_width: int = 0  # also write thumbnails/ this wide; 0 = none
+    postprocess_workers: int = 2  # processes; 0 = a thread in this process
+    export_formats: str = "pdf,html"  # decks written as slides finish; "" = none
 
     # Pipeline settings
+    transcript_language: str = "en"
     max_sections: int = 0  # 0 = unlimited
     max_words_per_infographic: int = 350
+    compact_transcript: bool = True  # dedupe captions, drop [Music] markers and fillers
+    strip_fillers: bool = True  # um, uh, ... (only when compacting)
+    segmenter: str = "gemini"  # or "local" (TextTiling, needs the local extra)
+    segment_window_minutes: int = 40  # longer videos are segmented in windows; 0 = one call
+    segment_overlap_minutes: float = 4
+    batch_summaries: bool = False  # summarize many sections per request
+    summary_batch_max_tokens: int = 30000  # transcript tokens per batched request
+
+    # Budget settings (per video; 0 = unlimited)
+    max_input_tokens: int = 0
+    max_output_tokens: int = 0
+    max_images: int = 0
+
+    # Rate limits per model (0 = unlimited); the defaults fit the free tier
+    text_concurrency: int = 1
+    image_concurrency: int = 1
+    text_rpm: int = 10  # requests per minute
+    text_tpm: int = 250000  # prompt tokens per minute
+    image_rpm: int = 10
+    image_tpm: int = 0
+    max_retries: int = 5  # for throttled and transient failures
+
+    # Cache settings
+    cache_dir: Path = Path.home() / ".cache" / "yt-slides"
+    response_cache_max_mb: int = 100  # 0 = disabled
+    image_cache: bool = True
+    fetch_cache_ttl_hours: float = 168  # metadata/transcripts; 0 = disabled
+
+    # Batch settings
+    batch_concurrency: int = 2  # videos processed at once, also by `yt-slides serve`; items by `yt-slides worker`
+    fetch_concurrency: int = 8  # playlist/channel expansions and metadata/transcript prefetches at once
+
+    # Server settings (yt-slides serve)
+    serve_host: str = "127.0.0.1"
+    serve_port: int = 8765
+
+    # Work queue settings (yt-slides enqueue / worker)
+    queue_path: Optional[Path] = None  # default: <output_dir>/queue.sqlite3
+    queue_lease_seconds: float = 600  # a crashed worker's items are retried after this
+    queue_max_attempts: int = 3
+    queue_poll_seconds: float = 5.0  # idle workers check for new items this often
+
+    # Tracing settings (run_report.json is always written)
+    otel_export: bool = False  # also export spans to OpenTelemetry
 
     model_config = {"env_file": ".env", "env_prefix": "", "extra": "ignore"}
@@ -0,0 +1,323 @@
+"""Export a deck of slides as one PDF and one self-contained HTML slideshow."""
+
+from __future__ import annotations
+
+import base64
+import html
+import io
+import json
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Iterable
+
+EXPORT_FORMATS = ("pdf", "html")
+DECK_NAME = "slides"
+
+_MIME_TYPES = {
+    "PNG": "image/png",
+    "JPEG": "image/jpeg",
+    "WEBP": "image/webp",
+    "AVIF": "image/avif",
+    "GIF": "image/gif",
+}
+_BASE64_CHUNK = 3 * 64 * 1024  # a multiple of 3, so chunks encode without padding
+
+
+def parse_export_formats(value: str | Iterable[str]) -> list[str]:
+    """Turn ``"pdf,html"`` into a list of formats, rejecting unknown ones."""
+    names = value.split(",") if isinstance(value, str) else list(value)
+    formats = [n.strip().lower() for n in names if n.strip()]
+    unknown = [f for f in formats if f not in EXPORT_FORMATS]
+    if unknown:
+        raise ValueError(
+            f"Unknown export format {', '.join(unknown)}; use {' and/or '.join(EXPORT_FORMATS)}"
+        )
+    return formats
+
+
+def _part(path: Path) -> Path:
+    return path.with_name(path.name + ".part")
+
+
+def _png_data(image) -> bytes:
+    """The zlib stream of ``image`` saved as PNG, rows prefixed by PNG filters.
+
+    PDF's FlateDecode with ``/Predictor 15`` undoes those filters, so the
+    page gets PNG-sized data without a second compression pass.
+    """
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    png = buffer.getvalue()
+    chunks = []
+    offset = 8  # PNG signature
+    while offset < len(png):
+        length, kind = struct.unpack_from(">I4s", png, offset)
+        if kind == b"IDAT":
+            chunks.append(png[offset + 8 : offset + 8 + length])
+        offset += 12 + length
+    return b"".join(chunks)
+
+
+class _PdfWriter:
+    """Writes a PDF page by page, holding at most one encoded image in memory.
+
+    Each slide becomes one page sized to the image at ``dpi``. JPEG slides
+    are embedded as they are; other formats are stored losslessly as
+    Flate-compressed pixels, with transparency flattened onto white.
+    """
+
+    def __init__(self, path: Path, title: str, dpi: int = 144) -> None:
+        self.path = path
+        self.dpi = dpi
+        self._file = open(_part(path), "wb")
+        self._offsets: dict[int, int] = {}
+        self._pages: list[int] = []
+        self._next_id = 4  # 1 = catalog, 2 = page tree, 3 = document info
+        self._file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        title_hex = ("\ufeff" + title).encode("utf-16-be").hex().upper()
+        self._write_object(3, f"<< /Title <{title_hex}> /Producer (yt-slides) >>".encode())
+
+    def _new_id(self) -> int:
+        self._next_id += 1
+        return self._next_id - 1
+
+    def _write_object(self, number: int, body: bytes, stream: bytes | None = None) -> None:
+        self._offsets[number] = self._file.tell()
+        self._file.write(f"{number} 0 obj\n".encode())
+        self._file.write(body)
+        if stream is not None:
+            self._file.write(b"\nstream\n")
+            self._file.write(stream)
+            self._file.write(b"\nendstream")
+        self._file.write(b"\nendobj\n")
+
+    def _encode(self, image_path: Path) -> tuple[bytes, int, int, str]:
+        """Image data and the XObject entries describing it, minus /Length."""
+        from PIL import Image
+
+        with Image.open(image_path) as image:
+            width, height = image.size
+            if image.format == "JPEG" and image.mode in ("RGB", "L"):
+                colorspace = "/DeviceRGB" if image.mode == "RGB" else "/DeviceGray"
+                return image_path.read_bytes(), width, height, f"/ColorSpace {colorspace} /Filter /DCTDecode"
+            if image.mode in ("RGBA", "LA", "P", "PA"):
+                rgba = image.convert("RGBA")
+                flat = Image.new("RGB", image.size, (255, 255, 255))
+                flat.paste(rgba, mask=rgba.getchannel("A"))
+            elif image.mode in ("RGB", "L"):
+                flat = image.copy()
+            else:
+                flat = image.convert("RGB")
+        colors, colorspace = (1, "/DeviceGray") if flat.mode == "L" else (3, "/DeviceRGB")
+        return (
+            _png_data(flat),
+            width,
+            height,
+            f"/ColorSpace {colorspace} /Filter /FlateDecode "
+            f"/DecodeParms << /Predictor 15 /Colors {colors} /BitsPerComponent 8 /Columns {width} >>",
+        )
+
+    def add(self, image_path: Path, title: str) -> None:
+        data, width, height, entries = self._encode(image_path)
+        image_id, content_id, page_id = self._new_id(), self._new_id(), self._new_id()
+        self._write_object(
+            image_id,
+            (
+                f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height} "
+                f"/BitsPerComponent 8 {entries} /Length {len(data)} >>"
+            ).encode(),
+            data,
+        )
+        del data
+        page_width = width * 72 / self.dpi
+        page_height = height * 72 / self.dpi
+        content = f"q {page_width:.2f} 0 0 {page_height:.2f} 0 0 cm /Im0 Do Q".encode()
+        self._write_object(content_id, f"<< /Length {len(content)} >>".encode(), content)
+        self._write_object(
+            page_id,
+            (
+                f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_width:.2f} {page_height:.2f}] "
+                f"/Resources << /XObject << /Im0 {image_id} 0 R >> >> /Contents {content_id} 0 R >>"
+            ).encode(),
+        )
+        self._pages.append(page_id)
+
+    def close(self) -> None:
+        kids = " ".join(f"{p} 0 R" for p in self._pages)
+        self._write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self._pages)} >>".encode())
+        xref = self._file.tell()
+        size = self._next_id
+        self._file.write(f"xref\n0 {size}\n0000000000 65535 f \n".encode())
+        for number in range(1, size):
+            self._file.write(f"{self._offsets[number]:010d} 00000 n \n".encode())
+        self._file.write(
+            f"trailer\n<< /Size {size} /Root 1 0 R /Info 3 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+        )
+        self._file.close()
+        os.replace(_part(self.path), self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        _part(self.path).unlink(missing_ok=True)
+
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>
+body {{ margin: 0; background: #111; color: #eee; font-family: system-ui, sans-serif; }}
+h1 {{ font-size: 1.2rem; font-weight: 500; margin: 1rem; }}
+.slide {{ margin: 0 auto 2rem; max-width: 1280px; }}
+.slide img {{ width: 100%; display: block; }}
+body.show h1 {{ display: none; }}
+body.show .slide {{ display: none; margin: 0; max-width: none; }}
+body.show .slide.active {{ display: flex; height: 100vh; align-items: center; justify-content: center; }}
+body.show .slide img {{ width: auto; max-width: 100vw; max-height: 100vh; }}
+#counter {{ display: none; position: fixed; right: 1rem; bottom: 1rem; opacity: 0.6; }}
+body.show #counter {{ display: block; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+"""
+
+_HTML_TAIL = """<div id="counter"></div>
+<script>
+(function () {
+  var slides = document.querySelectorAll(".slide");
+  var counter = document.getElementById("counter");
+  var current = 0;
+  function show(n) {
+    if (!slides.length) return;
+    slides[current].classList.remove("active");
+    current = Math.max(0, Math.min(slides.length - 1, n));
+    slides[current].classList.add("active");
+    counter.textContent = (current + 1) + " / " + slides.length;
+    history.replaceState(null, "", "#" + (current + 1));
+  }
+  document.body.classList.add("show");
+  show(parseInt(location.hash.slice(1), 10) - 1 || 0);
+  document.addEventListener("keydown", function (e) {
+    if (["ArrowRight", "PageDown", " "].indexOf(e.key) >= 0) show(current + 1);
+    else if (["ArrowLeft", "PageUp", "Backspace"].indexOf(e.key) >= 0) show(current - 1);
+    else if (e.key === "Home") show(0);
+    else if (e.key === "End") show(slides.length - 1);
+    else if (e.key === "f" && document.documentElement.requestFullscreen) document.documentElement.requestFullscreen();
+    else return;
+    e.preventDefault();
+  });
+  document.addEventListener("click", function (e) {
+    show(current + (e.clientX < window.innerWidth / 3 ? -1 : 1));
+  });
+})();
+</script>
+</body>
+</html>
+"""
+
+
+class _HtmlWriter:
+    """Writes a single-file slideshow with every slide inlined as base64.
+
+    Images are copied in fixed-size chunks, so memory does not grow with
+    slide size. Without JavaScript the slides are shown one below another.
+    """
+
+    def __init__(self, path: Path, title: str) -> None:
+        self.path = path
+        self._file = open(_part(path), "w", encoding="utf-8")
+        self._file.write(_HTML_HEAD.format(title=html.escape(title)))
+
+    def add(self, image_path: Path, title: str) -> None:
+        from PIL import Image
+
+        with Image.open(image_path) as image:
+            mime = _MIME_TYPES.get(image.format or "", "application/octet-stream")
+        self._file.write(f'<section class="slide"><img alt="{html.escape(title)}" src="data:{mime};base64,')
+        with open(image_path, "rb") as f:
+            while chunk := f.read(_BASE64_CHUNK):
+                self._file.write(base64.b64encode(chunk).decode("ascii"))
+        self._file.write('"></section>\n')
+
+    def close(self) -> None:
+        self._file.write(_HTML_TAIL)
+        self._file.close()
+        os.replace(_part(self.path), self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        _part(self.path).unlink(missing_ok=True)
+
+
+class DeckExporter:
+    """Builds ``slides.pdf`` and/or ``slides.html`` while slides finish.
+
+    Slides may be added in any order and from any thread; each is written
+    as soon as every slide before it is in, so only file paths are held
+    while waiting. :meth:`finish` writes whatever is left, in order,
+    skipping missing slides. Until then the decks are ``.part`` files.
+    """
+
+    def __init__(
+        self,
+        video_dir: Path,
+        title: str,
+        formats: Iterable[str] = EXPORT_FORMATS,
+    ) -> None:
+        self.paths = [video_dir / f"{DECK_NAME}.{fmt}" for fmt in parse_export_formats(formats)]
+        self._writers = [
+            _PdfWriter(path, title) if path.suffix == ".pdf" else _HtmlWriter(path, title)
+            for path in self.paths
+        ]
+        self._ready: dict[int, tuple[Path, str]] = {}
+        self._next = 1
+        self._lock = threading.Lock()
+
+    def add(self, slide: int, image_path: Path, title: str = "") -> None:
+        """Queue slide ``slide`` (1-based) and write every slide now in order."""
+        with self._lock:
+            self._ready[slide] = (Path(image_path), title)
+            while self._next in self._ready:
+                self._write(self._ready.pop(self._next))
+                self._next += 1
+
+    def _write(self, slide: tuple[Path, str]) -> None:
+        for writer in self._writers:
+            writer.add(*slide)
+
+    def finish(self) -> list[Path]:
+        """Write the remaining slides, skipping gaps, and publish the decks."""
+        with self._lock:
+            for slide in sorted(self._ready):
+                self._write(self._ready.pop(slide))
+            for writer in self._writers:
+                writer.close()
+        return self.paths
+
+    def abort(self) -> None:
+        """Discard the partial decks."""
+        with self._lock:
+            for writer in self._writers:
+                writer.abort()
+
+
+def export_deck(video_dir: Path, formats: Iterable[str] = EXPORT_FORMATS) -> list[Path]:
+    """Export the slides listed in ``video_dir/metadata.json``."""
+    metadata = json.loads((video_dir / "metadata.json").read_text())
+    sections = metadata.get("sections", [])
+    exporter = DeckExporter(video_dir, metadata.get("video_title", video_dir.name), formats)
+    try:
+        for n, section in enumerate(sections, start=1):
+            image_path = video_dir / section["image_file"]
+            if image_path.exists():
+                exporter.add(n, image_path, section.get("title", ""))
+        return exporter.finish()
+    except BaseException:
+        exporter.abort()
+        raise
@@ -0,0 +1,178 @@
+"""Quota-aware pacing and retrying of Gemini calls."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Awaitable, Callable, TypeVar
+
+from rich.console import Console
+
+from yt_slides import tracing
+
+if TYPE_CHECKING:
+    from google.genai import errors
+
+T = TypeVar("T")
+
+_RETRYABLE_CODES = {408, 429, 500, 502, 503, 504}
+_MAX_BACKOFF_SECONDS = 60.0
+
+
+def _api_error() -> type[errors.APIError]:
+    # Only needed once a call has failed, so google-genai is imported here
+    from google.genai import errors
+
+    return errors.APIError
+
+
+def _error_body(error: errors.APIError) -> dict:
+    details = error.details if isinstance(error.details, dict) else {}
+    return details.get("error", details)
+
+
+def retry_delay(error: BaseException) -> float | None:
+    """The retry delay the API asked for in a ``RetryInfo`` detail, in seconds."""
+    if not isinstance(error, _api_error()):
+        return None
+    for detail in _error_body(error).get("details") or []:
+        if detail.get("@type", "").endswith("google.rpc.RetryInfo"):
+            match = re.fullmatch(r"([\d.]+)s", str(detail.get("retryDelay", "")))
+            if match:
+                return float(match.group(1))
+    return None
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    return isinstance(error, _api_error()) and (
+        error.code == 429 or error.status == "RESOURCE_EXHAUSTED"
+    )
+
+
+def _is_daily_quota(error: BaseException) -> bool:
+    """Whether a 429 is for a per-day quota, which no short wait will fix."""
+    if not is_rate_limited(error):
+        return False
+    for detail in _error_body(error).get("details") or []:
+        for violation in detail.get("violations") or []:
+            if "PerDay" in str(violation.get("quotaId", "")):
+                return True
+    return False
+
+
+def _is_retryable(error: BaseException) -> bool:
+    import httpx
+
+    if isinstance(error, _api_error()):
+        return error.code in _RETRYABLE_CODES and not _is_daily_quota(error)
+    return isinstance(error, (httpx.TransportError, asyncio.TimeoutError))
+
+
+class _Window:
+    """Amounts admitted during the last ``period`` seconds, capped at ``limit``."""
+
+    def __init__(self, limit: int, period: float = 60.0) -> None:
+        self.limit = limit
+        self.period = period
+        self._entries: deque[tuple[float, int]] = deque()
+        self._total = 0
+
+    def wait_time(self, amount: int, now: float) -> float:
+        """Seconds until ``amount`` fits in the window (0 if it fits now)."""
+        if self.limit <= 0:
+            return 0.0
+        while self._entries and self._entries[0][0] + self.period <= now:
+            self._total -= self._entries.popleft()[1]
+        excess = self._total + min(amount, self.limit) - self.limit
+        if excess <= 0:
+            return 0.0
+        for started, admitted in self._entries:
+            excess -= admitted
+            if excess <= 0:
+                return started + self.period - now
+        return self.period
+
+    def add(self, amount: int, now: float) -> None:
+        if self.limit > 0:
+            self._entries.append((now, amount))
+            self._total += amount
+
+
+class RateGovernor:
+    """Paces and retries the calls made to one Gemini model.
+
+    Call starts are admitted so that no 60-second window holds more than
+    ``rpm`` requests or ``tpm`` estimated tokens (0 disables either limit),
+    and at most ``concurrency`` calls run at once. Throttling (429) and
+    transient server or network errors are retried after the delay the API
+    asks for in its ``RetryInfo``, or with exponential backoff; a 429 also
+    pauses every other call to the model for that delay.
+    """
+
+    def __init__(
+        self, name: str, concurrency: int = 1, rpm: int = 0, tpm: int = 0, max_retries: int = 5
+    ) -> None:
+        self.name = name
+        self.max_retries = max_retries
+        self._slots = asyncio.Semaphore(max(1, concurrency))
+        self._requests = _Window(rpm)
+        self._tokens = _Window(tpm)
+        self._paused_until = 0.0
+        self._admission = asyncio.Lock()
+
+    async def _admit(self, tokens: int) -> None:
+        async with self._admission:
+            while True:
+                now = time.monotonic()
+                wait = max(
+                    self._paused_until - now,
+                    self._requests.wait_time(1, now),
+                    self._tokens.wait_time(tokens, now),
+                )
+                if wait <= 0:
+                    self._requests.add(1, now)
+                    self._tokens.add(tokens, now)
+                    return
+                await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every new call to this model for ``seconds``."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def call(
+        self,
+        func: Callable[[], Awaitable[T]],
+        tokens: int = 0,
+        console: Console | None = None,
+        retry_on: tuple[type[BaseException], ...] = (),
+    ) -> T:
+        """Await ``func()`` once admitted, retrying throttled and transient failures.
+
+        ``tokens`` is the estimated prompt size charged against the TPM limit.
+        Exceptions of the types in ``retry_on`` are retried as well.
+        """
+        attempt = 0
+        while True:
+            start = time.monotonic()
+            async with self._slots:
+                await self._admit(tokens)
+                tracing.record_queue(time.monotonic() - start)
+                try:
+                    return await func()
+                except Exception as e:
+                    error = e
+            if attempt >= self.max_retries or not (_is_retryable(error) or isinstance(error, retry_on)):
+                raise error
+            wait = retry_delay(error)
+            if wait is None:
+                wait = min(_MAX_BACKOFF_SECONDS, 2.0 * 2**attempt) * random.uniform(0.8, 1.2)
+            if is_rate_limited(error):
+                self.pause(wait)
+                if console:
+                    console.print(f"    [yellow]Rate limited on {self.name}. Waiting {wait:.0f}s...[/yellow]")
+            tracing.record_retry(wait)
+            await asyncio.sleep(wait)
+            attempt += 1
@@ -0,0 +1,128 @@
+"""Offline image generation through the Gemini Batch API."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from rich.console import Console
+
+from yt_slides import budget, tracing
+from yt_slides.checkpoint import CheckpointStore
+from yt_slides.image.cache import ImageCache
+from yt_slides.image.generator import _image_config, _image_contents, _save_image
+from yt_slides.image.postprocess import ImagePostprocessor
+from yt_slides.models import PendingImage
+
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
+
+# types.JobState members are str enums, so they compare equal to their names
+_TERMINAL_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_PARTIALLY_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+
+class BatchJobError(Exception):
+    """Raised when a batch job ends without producing results."""
+
+
+def _inlined_requests(
+    images: list[PendingImage], aspect_ratio: str
+) -> list[types.InlinedRequest]:
+    from google.genai import types
+
+    return [
+        types.InlinedRequest(
+            contents=_image_contents(image.prompt, aspect_ratio),
+            config=_image_config(),
+            metadata={"slide": f"{image.video_id}/{image.slide}"},
+        )
+        for image in images
+    ]
+
+
+async def run_image_batch_async(
+    client: genai.Client,
+    images: list[PendingImage],
+    model: str,
+    aspect_ratio: str,
+    poll_seconds: float = 30.0,
+    image_cache: ImageCache | None = None,
+    console: Console | None = None,
+    postprocessor: ImagePostprocessor | None = None,
+) -> list[PendingImage]:
+    """Render ``images`` as one batch job and write them to their output paths.
+
+    Submits every prompt in a single job, polls until the job reaches a
+    terminal state, then writes each returned image, post-processes it with
+    ``postprocessor`` and records its checkpoint. Returns the images that
+    were not produced.
+    """
+    from google.genai import types
+
+    console = console or Console()
+    if not images:
+        return []
+
+    with tracing.span("image_batch_job", images=len(images), model=model) as job_span:
+        job = await client.aio.batches.create(
+            model=model,
+            src=_inlined_requests(images, aspect_ratio),
+            config=types.CreateBatchJobConfig(display_name=f"yt-slides-{len(images)}-images"),
+        )
+        console.print(f"  Submitted batch job {job.name} with {len(images)} images")
+        tracing.set_attribute("job", job.name)
+
+        while job.state not in _TERMINAL_STATES:
+            await asyncio.sleep(poll_seconds)
+            job = await client.aio.batches.get(name=job.name)
+            console.print(f"    [dim]Batch job {job.name}: {job.state.value}[/dim]")
+        tracing.set_attribute("state", job.state.value)
+
+        if not job.dest or not job.dest.inlined_responses:
+            raise BatchJobError(f"Batch job {job.name} finished as {job.state.value} without results")
+        for image, result in zip(images, job.dest.inlined_responses):
+            if result.response:
+                tracing.record_response(job_span, len(image.prompt.encode("utf-8")), result.response)
+                budget.charge(result.response)
+
+    failed: list[PendingImage] = []
+    saved: list[PendingImage] = []
+    for image, result in zip(images, job.dest.inlined_responses):
+        output_path = Path(image.output_path)
+        try:
+            if result.error:
+                raise BatchJobError(str(result.error))
+            _save_image(result.response, output_path)
+        except Exception as e:
+            console.print(f"  [red]Slide {image.slide} of {image.video_id} failed: {e}[/red]")
+            failed.append(image)
+            continue
+        if image_cache:
+            image_cache.store(ImageCache.key(image.prompt, model, aspect_ratio), output_path)
+        saved.append(image)
+
+    stats: list = [None] * len(saved)
+    if postprocessor:
+        stats = await asyncio.gather(
+            *(postprocessor.process(Path(image.output_path)) for image in saved),
+            return_exceptions=True,
+        )
+    for image, image_stats in zip(saved, stats):
+        output_path = Path(image.output_path)
+        if isinstance(image_stats, Exception):
+            console.print(f"  [red]Post-processing slide {image.slide} of {image.video_id} failed: {image_stats}[/red]")
+            failed.append(image)
+            continue
+        CheckpointStore(output_path.parent).save_image(
+            image.slide, image.checkpoint_key, output_path, image_stats
+        )
+    failed.extend(images[len(job.dest.inlined_responses):])
+    return failed
@@ -0,0 +1,71 @@
+"""Content-addressed cache of generated infographic images."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from yt_slides.config import Settings
+
+
+class ImageCache:
+    """Stores image bytes keyed by a hash of (prompt, model, aspect ratio).
+
+    Cached files are hard-linked into the output directory when possible and
+    copied otherwise (e.g. across filesystems), so reusing a slide costs no
+    API call and, usually, no extra disk space.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(prompt: str, model: str, aspect_ratio: str) -> str:
+        raw = json.dumps([prompt, model, aspect_ratio]).encode()
+        return hashlib.sha256(raw).hexdigest()
+
+    def fetch(self, key: str, output_path: Path) -> bool:
+        """Place the cached image for ``key`` at ``output_path`` if present."""
+        cached = self._path(key)
+        if not cached.exists():
+            self.misses += 1
+            return False
+        _link_or_copy(cached, output_path)
+        self.hits += 1
+        return True
+
+    def store(self, key: str, image_path: Path) -> None:
+        """Add a freshly generated image to the cache."""
+        _link_or_copy(image_path, self._path(key))
+
+    def _path(self, key: str) -> Path:
+        path = self.directory / key[:2] / f"{key}.img"
+        path.parent.mkdir(exist_ok=True)
+        return path
+
+
+def _link_or_copy(source: Path, dest: Path) -> None:
+    """Hard-link ``source`` to ``dest``, falling back to a copy."""
+    # Unique per writer, so another process never unlinks or replaces this one's file
+    tmp = dest.with_name(f"{dest.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        os.link(source, tmp)
+    except OSError:
+        shutil.copyfile(source, tmp)
+    os.replace(tmp, dest)
+
+
+def open_image_cache(settings: Settings) -> ImageCache | None:
+    """Open the image cache configured in settings, if enabled."""
+    if not settings.image_cache:
+        return None
+    return ImageCache(Path(settings.cache_dir).expanduser() / "images")
@@ -2,50 +2,112 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 import time
+import uuid
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from google import genai
-from google.genai import types
+from yt_slides import budget, tracing
+from yt_slides.image.cache import ImageCache
+
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
 
 
 class ImageGenerationError(Exception):
-    """Raised when image generation fails after retries."""
+    """Raised when a response carries no image."""
 
 
-def generate_infographic(
+def _image_contents(prompt: str, aspect_ratio: str) -> list[str]:
+    return [prompt + f"\n\nGenerate this as an image with {aspect_ratio} aspect ratio."]
+
+
+def _image_config() -> types.GenerateContentConfig:
+    from google.genai import types
+
+    return types.GenerateContentConfig(
+        response_modalities=["IMAGE", "TEXT"],
+    )
+
+
+def _save_image(response: types.GenerateContentResponse, output_path: Path) -> Path:
+    """Write the first inline image in the response to ``output_path``.
+
+    The file is replaced rather than rewritten in place, so an older copy
+    hard-linked from the image cache is never modified.
+    """
+    candidate = response.candidates[0] if response.candidates else None
+    parts = candidate.content.parts if candidate and candidate.content else None
+    for part in parts or ():
+        if part.inline_data is not None:
+            image_bytes = part.inline_data.data
+            tmp = output_path.with_name(f"{output_path.name}.{uuid.uuid4().hex}.tmp")
+            tmp.write_bytes(image_bytes)
+            os.replace(tmp, output_path)
+            return output_path
+
+    raise ImageGenerationError("No image data in response")
+
+
+async def generate_infographic_async(
     client: genai.Client,
     prompt: str,
     output_path: Path,
     model: str = "gemini-2.5-flash-image",
     aspect_ratio: str = "16:9",
-    max_retries: int = 2,
+    cache: ImageCache | None = None,
+    refresh: bool = False,
 ) -> Path:
-    """Generate an infographic image and save it to disk.
+    """Generate an infographic image with ``client.aio`` and save it to disk.
 
-    Uses exponential backoff on failure. Returns the path to the saved image.
+    Returns the path to the saved image. With a ``cache``, an image
+    previously rendered from the same prompt, model and aspect ratio is
+    reused unless ``refresh`` is set. Makes a single attempt; retries and
+    pacing are left to the caller's :class:`~yt_slides.governor.RateGovernor`.
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    key = ImageCache.key(prompt, model, aspect_ratio) if cache else ""
+    if cache and not refresh and cache.fetch(key, output_path):
+        return output_path
+
+    contents = _image_contents(prompt, aspect_ratio)
+    with tracing.span("gemini.generate_content", model=model) as call:
+        response = await client.aio.models.generate_content(
+            model=model,
+            contents=contents,
+            config=_image_config(),
+        )
+        tracing.record_response(call, len(contents[0].encode("utf-8")), response)
+    budget.charge(response)
+    _save_image(response, output_path)
+    if cache:
+        cache.store(key, output_path)
+    return output_path
 
+
+def generate_infographic(
+    client: genai.Client,
+    prompt: str,
+    output_path: Path,
+    model: str = "gemini-2.5-flash-image",
+    aspect_ratio: str = "16:9",
+    max_retries: int = 2,
+    cache: ImageCache | None = None,
+) -> Path:
+    """Blocking :func:`generate_infographic_async` with exponential backoff.
+
+    For callers without an event loop or a rate governor. Returns the path
+    to the saved image.
+    """
     last_error: Exception | None = None
     for attempt in range(max_retries + 1):
         try:
-            response = client.models.generate_content(
-                model=model,
-                contents=[prompt + f"\n\nGenerate this as an image with {aspect_ratio} aspect ratio."],
-                config=types.GenerateContentConfig(
-                    response_modalities=["IMAGE", "TEXT"],
-                ),
+            return asyncio.run(
+                generate_infographic_async(client, prompt, output_path, model, aspect_ratio, cache)
             )
-
-            for part in response.candidates[0].content.parts:
-                if part.inline_data is not None:
-                    image_bytes = part.inline_data.data
-                    output_path.write_bytes(image_bytes)
-                    return output_path
-
-            raise ImageGenerationError("No image data in response")
-
         except Exception as e:
             last_error = e
             if attempt < max_retries:
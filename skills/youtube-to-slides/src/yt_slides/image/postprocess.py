@@ -0,0 +1,156 @@
+"""Transcode, resize and thumbnail rendered slides with Pillow."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from PIL import Image
+
+from yt_slides.models import ImageStats
+
+if TYPE_CHECKING:
+    from yt_slides.config import Settings
+
+# Settings.image_format -> Pillow format name
+_FORMATS = {"png": "PNG", "webp": "WEBP", "jpg": "JPEG", "jpeg": "JPEG", "avif": "AVIF"}
+
+THUMBNAIL_DIR = "thumbnails"
+
+
+def available_formats() -> list[str]:
+    """The ``image_format`` values this Pillow build can write."""
+    Image.init()
+    return [name for name, fmt in _FORMATS.items() if fmt in Image.SAVE]
+
+
+def _save(image: Image.Image, path: Path, fmt: str, quality: int) -> None:
+    """Encode ``image`` to ``path`` atomically, without touching hard-linked copies."""
+    if fmt == "JPEG" and image.mode not in ("RGB", "L"):
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        rgba = image.convert("RGBA")
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        image = background
+    options: dict = {"PNG": {"optimize": True}, "JPEG": {"optimize": True, "progressive": True}}.get(fmt, {})
+    if fmt in ("WEBP", "JPEG", "AVIF"):
+        options["quality"] = quality
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    image.save(tmp, format=fmt, **options)
+    os.replace(tmp, path)
+
+
+def postprocess_image(
+    path: str,
+    image_format: str = "png",
+    max_width: int = 0,
+    quality: int = 85,
+    thumbnail_width: int = 0,
+) -> ImageStats:
+    """Make the file at ``path`` match ``image_format`` and the size limits.
+
+    The model's bytes are kept as they are when they already have the right
+    format and width; otherwise the image is re-encoded (and downscaled to
+    ``max_width``). A thumbnail ``thumbnail_width`` pixels wide is written
+    to ``thumbnails/`` next to the image. Runs in worker processes, so it
+    takes and returns only picklable values.
+    """
+    src = Path(path)
+    fmt = _FORMATS[image_format.lower()]
+    original_bytes = src.stat().st_size
+    with Image.open(src) as image:
+        image.load()
+        out = image
+        if max_width and image.width > max_width:
+            height = max(1, round(image.height * max_width / image.width))
+            out = image.resize((max_width, height), Image.Resampling.LANCZOS)
+        if out is not image or image.format != fmt:
+            _save(out, src, fmt, quality)
+        thumbnail = None
+        if thumbnail_width:
+            thumb = out.copy()
+            thumb.thumbnail((thumbnail_width, thumbnail_width * 4), Image.Resampling.LANCZOS)
+            thumb_dir = src.parent / THUMBNAIL_DIR
+            thumb_dir.mkdir(exist_ok=True)
+            _save(thumb, thumb_dir / src.name, fmt, quality)
+            thumbnail = src.name
+        return ImageStats(
+            format=image_format.lower(),
+            width=out.width,
+            height=out.height,
+            original_bytes=original_bytes,
+            bytes=src.stat().st_size,
+            thumbnail=thumbnail,
+        )
+
+
+class ImagePostprocessor:
+    """Post-processes slides in a process pool while other slides render.
+
+    Pass one instance to every pipeline of a batch so they share the pool.
+    Use as a context manager to shut the pool down. Stats of every image
+    processed are kept in :attr:`stats`, keyed by path.
+    """
+
+    def __init__(
+        self,
+        image_format: str = "png",
+        max_width: int = 0,
+        quality: int = 85,
+        thumbnail_width: int = 0,
+        workers: int = 2,
+    ) -> None:
+        if image_format.lower() not in _FORMATS:
+            raise ValueError(f"Unsupported image format {image_format!r}; use one of {', '.join(_FORMATS)}")
+        self.image_format = image_format.lower()
+        self.max_width = max_width
+        self.quality = quality
+        self.thumbnail_width = thumbnail_width
+        self.workers = workers
+        self.stats: dict[str, ImageStats] = {}
+        self._pool: ProcessPoolExecutor | None = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> ImagePostprocessor:
+        return cls(
+            settings.image_format,
+            max_width=settings.image_max_width,
+            quality=settings.image_quality,
+            thumbnail_width=settings.thumbnail_width,
+            workers=settings.postprocess_workers,
+        )
+
+    @property
+    def options(self) -> tuple:
+        """Everything that affects the output, for checkpoint fingerprints."""
+        return (self.image_format, self.max_width, self.quality, self.thumbnail_width)
+
+    async def process(self, path: Path) -> ImageStats:
+        args = (str(path), self.image_format, self.max_width, self.quality, self.thumbnail_width)
+        if self.workers <= 0:
+            stats = await asyncio.to_thread(postprocess_image, *args)
+        else:
+            if self._pool is None:
+                # Forked children inherit the locks of the caller's other threads
+                # (e.g. asyncio.to_thread workers) and can hang on them
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            stats = await asyncio.get_running_loop().run_in_executor(self._pool, postprocess_image, *args)
+        self.stats[str(path)] = stats
+        return stats
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> ImagePostprocessor:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,5 +1,7 @@
 """Shared data models for the yt-slides pipeline."""
 
+from typing import Optional, Union
+
 from pydantic import BaseModel
 
 
@@ -45,3 +47,87 @@ class InfographicResult(BaseModel):
     section_title: str
     image_path: str
     prompt_used: str
+
+
+class ImageStats(BaseModel):
+    format: str
+    width: int
+    height: int
+    original_bytes: int  # as returned by the model
+    bytes: int
+    thumbnail: Optional[str] = None  # file name under thumbnails/
+
+
+class BatchItemResult(BaseModel):
+    url: str
+    video_id: str
+    slides: int = 0
+    output_dir: str = ""
+    error: str = ""
+
+
+class PendingImage(BaseModel):
+    video_id: str
+    slide: int
+    prompt: str
+    output_path: str
+    checkpoint_key: str
+
+
+class TraceSpan(BaseModel):
+    span_id: int
+    parent_id: Optional[int] = None
+    name: str
+    start_seconds: float  # offset from the start of the run
+    duration_seconds: float = 0.0
+    status: str = "ok"
+    error: str = ""
+    retries: int = 0
+    backoff_seconds: float = 0.0
+    queue_seconds: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    attributes: dict[str, Union[str, int, float, bool]] = {}
+
+
+class JobRequest(BaseModel):
+    url: str
+    style: str = "davinci"
+    max_sections: Optional[int] = None  # None = the server's setting
+    aspect_ratio: Optional[str] = None
+    dry_run: bool = False
+    resume: bool = False
+    refresh: bool = False
+    regenerate: list[int] = []
+
+
+class Job(BaseModel):
+    id: str
+    video_id: str
+    request: JobRequest
+    status: str = "queued"  # queued, running, done, failed, cancelled
+    stage: str = ""  # last stage the pipeline reported
+    summaries_done: int = 0
+    slides_done: int = 0
+    slides_total: int = 0
+    submitted_at: float  # Unix time
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    output_dir: str = ""
+    slides: list[str] = []  # image paths, once done
+    error: str = ""
+
+
+class WorkItem(BaseModel):
+    id: int
+    kind: str  # video, slide or assemble
+    video_id: str
+    slide: int = 0  # for slide items
+    request: JobRequest
+    status: str = "pending"  # pending, leased, done, failed
+    attempts: int = 0
+    owner: str = ""  # worker holding the lease
+    lease_expires: Optional[float] = None  # Unix time
+    error: str = ""
@@ -2,31 +2,63 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 import time
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from yt_slides.ai.gemini_client import create_client
+from yt_slides import tracing
 from yt_slides.ai.prompt_builder import build_infographic_prompt
-from yt_slides.ai.segmenter import consolidate_sections, segment_transcript
-from yt_slides.ai.summarizer import summarize_section
-from yt_slides.config import Settings
-from yt_slides.image.generator import generate_infographic
-from yt_slides.models import InfographicResult, Section
+from yt_slides.ai.response_cache import ResponseCache, open_response_cache
+from yt_slides.ai.segmenter import (
+    consolidate_sections_async,
+    merge_window_segments,
+    segment_transcript_async,
+    segment_window_async,
+    transcript_windows,
+)
+from yt_slides.ai.summarizer import (
+    group_sections_by_tokens,
+    summarize_section_async,
+    summarize_sections_batch_async,
+)
+from yt_slides.ai.texttiling import segment_locally
+from yt_slides.backends import Backends
+from yt_slides.budget import BudgetExceededError, TokenBudget, clamp_sections, estimate_tokens
+from yt_slides.checkpoint import CheckpointStore, fingerprint
+from yt_slides.export import DeckExporter, parse_export_formats
+from yt_slides.image.batch_job import BatchJobError, run_image_batch_async
+from yt_slides.image.cache import ImageCache, open_image_cache
+from yt_slides.image.generator import ImageGenerationError, generate_infographic_async
+from yt_slides.image.postprocess import THUMBNAIL_DIR, ImagePostprocessor
+from yt_slides.models import (
+    ImageStats,
+    InfographicResult,
+    PendingImage,
+    Section,
+    SectionSummary,
+    VideoMetadata,
+)
+from yt_slides.scheduler import Scheduler
+from yt_slides.transcript import Transcript
+from yt_slides.youtube.cache import FetchCache, open_fetch_cache
 from yt_slides.youtube.chapters import (
     assign_transcript_to_sections,
     parse_chapters_from_description,
     split_by_time,
 )
-from yt_slides.youtube.metadata import fetch_metadata
-from yt_slides.youtube.transcript import fetch_transcript
+from yt_slides.youtube.compaction import compact_transcript
 from yt_slides.youtube.url_parser import extract_video_id
 
+if TYPE_CHECKING:
+    from yt_slides.config import Settings
+
 
 def _slugify(text: str) -> str:
     """Convert text to a filename-safe slug."""
@@ -42,196 +74,779 @@ def run_pipeline(
     style: str = "modern",
     dry_run: bool = False,
     console: Console | None = None,
+    resume: bool = False,
+    regenerate: set[int] | None = None,
+    refresh: bool = False,
+    image_batch: bool = False,
+) -> list[InfographicResult]:
+    """Run the full YouTube-to-Slides pipeline.
+
+    Synchronous wrapper around :func:`run_pipeline_async`.
+    """
+    return asyncio.run(
+        run_pipeline_async(
+            url=url,
+            settings=settings,
+            style=style,
+            dry_run=dry_run,
+            console=console,
+            resume=resume,
+            regenerate=regenerate,
+            refresh=refresh,
+            image_batch=image_batch,
+        )
+    )
+
+
+async def run_pipeline_async(
+    url: str,
+    settings: Settings,
+    style: str = "modern",
+    dry_run: bool = False,
+    console: Console | None = None,
+    client=None,
+    scheduler: Scheduler | None = None,
+    show_progress: bool = True,
+    resume: bool = False,
+    response_cache: ResponseCache | None = None,
+    image_cache: ImageCache | None = None,
+    regenerate: set[int] | None = None,
+    refresh: bool = False,
+    image_batch: bool = False,
+    pending_images: list[PendingImage] | None = None,
+    backends: Backends | None = None,
+    postprocessor: ImagePostprocessor | None = None,
+    on_progress: Callable[[str, int, int], None] | None = None,
+    slides: set[int] | None = None,
+    token_budget: TokenBudget | None = None,
 ) -> list[InfographicResult]:
-    """Run the full YouTube-to-Slides pipeline."""
+    """Run the full YouTube-to-Slides pipeline on the running event loop.
+
+    ``client``, ``scheduler`` and the caches may be shared between concurrent
+    runs so that they reuse one connection pool, one Gemini rate budget and
+    one set of caches. Slide numbers in ``regenerate`` (1-based) always get a
+    fresh image, bypassing checkpoints and the image cache. ``refresh``
+    re-fetches metadata and transcript from YouTube even if cached or
+    checkpointed.
+
+    With ``image_batch``, images are rendered by one Gemini Batch API job
+    instead of interactive calls. If ``pending_images`` is given, the images
+    are appended to it for the caller to submit (e.g. across many videos);
+    otherwise this run submits and waits for its own job. ``backends``
+    replaces the YouTube and Gemini services, e.g. with fakes. Rendered
+    slides are transcoded, resized and thumbnailed by ``postprocessor``
+    (shared between runs like the scheduler) while later slides render. Every
+    stage is checkpointed under ``output_dir/<video_id>/``; with ``resume``
+    valid checkpoints are reused and only missing or stale work is redone.
+    ``on_progress(stage, done, total)`` is called as the run advances, e.g.
+    ``("slides", 3, 10)`` once the third slide is finished.
+
+    With ``slides``, only those slide numbers are produced, and
+    ``metadata.json``, the decks and ``run_report.json`` are left to a full
+    run; an empty set stops after section detection. Queue workers use this
+    to split one video across processes, passing a ``token_budget`` that
+    already holds what the video's other items spent.
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     console = console or Console()
+    backends = backends or Backends()
+    client = client or backends.create_client(settings.gemini_api_key, settings.gemini_base_url)
+    owns_cache = response_cache is None
+    if owns_cache:
+        response_cache = open_response_cache(settings)
+        image_cache = open_image_cache(settings)
+    fetch_cache = open_fetch_cache(settings)
+    tracer = tracing.Tracer(otel=settings.otel_export, console=console, url=url)
+    token_budget = token_budget or TokenBudget.from_settings(settings)
+    # A postprocessor created here is closed (and its pool shut down) with the run
+    postprocessing = nullcontext() if postprocessor else ImagePostprocessor.from_settings(settings)
+    postprocessor = postprocessor or postprocessing
 
-    with Progress(
+    with tracer, token_budget, postprocessing, Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        disable=not show_progress,
     ) as progress:
-        client = None
-
         # Step 1: Parse URL
         task = progress.add_task("[cyan]Parsing YouTube URL...", total=None)
-        video_id = extract_video_id(url)
+        with tracing.span("url_parse"):
+            video_id = extract_video_id(url)
         console.print(f"  Video ID: [bold]{video_id}[/bold]")
+        output_dir = Path(settings.output_dir) / video_id
+        output_dir.mkdir(parents=True, exist_ok=True)
+        tracer.root.attributes["video_id"] = video_id
+        if slides is None:
+            tracer.report_path = output_dir / "run_report.json"
+        run = _Run(
+            settings=settings,
+            console=console,
+            client=client,
+            scheduler=scheduler or Scheduler(settings),
+            response_cache=response_cache,
+            image_cache=image_cache,
+            postprocessor=postprocessor,
+            token_budget=token_budget,
+            checkpoints=CheckpointStore(output_dir, resume=resume),
+            report=on_progress or (lambda stage, done, total: None),
+        )
         progress.remove_task(task)
 
         # Step 2: Fetch metadata
         task = progress.add_task("[cyan]Fetching video metadata...", total=None)
-        metadata = fetch_metadata(video_id)
-        console.print(f"  Title: [bold]{metadata.title}[/bold]")
-        console.print(f"  Duration: {metadata.duration_seconds // 60}m {metadata.duration_seconds % 60}s")
+        metadata = await _fetch_metadata(run, video_id, backends, fetch_cache, refresh)
         progress.remove_task(task)
 
         # Step 3: Fetch transcript
         task = progress.add_task("[cyan]Fetching transcript...", total=None)
-        transcript = fetch_transcript(video_id)
-        console.print(f"  Transcript: {len(transcript)} snippets")
+        transcript = await _fetch_transcript(run, video_id, backends, fetch_cache, refresh)
         progress.remove_task(task)
 
+        # Compact the captions before anything is sent to Gemini
+        if settings.compact_transcript:
+            transcript = _compact(transcript, settings, console)
+
+        # Fit the slide count to the budget before making any Gemini calls
+        if token_budget.limited:
+            run.settings = _fit_to_budget(run, metadata, transcript, with_images=not dry_run)
+
         # Step 4: Detect sections
         task = progress.add_task("[cyan]Detecting sections...", total=None)
-        sections = _detect_sections(
-            metadata, transcript, settings, console
+        sections = await _load_or_detect_sections(run, metadata, transcript)
+        progress.remove_task(task)
+
+        # Step 5: Summarize, build prompts and generate images. Each section
+        # flows into prompt building and image generation as soon as its
+        # summary is ready instead of waiting for every summary first.
+        deck = _Deck(
+            run,
+            video_id,
+            metadata.title,
+            sections,
+            output_dir,
+            selected=[i for i in range(len(sections)) if slides is None or i + 1 in slides],
+            style=style,
+            dry_run=dry_run,
+            regenerate=regenerate or set(),
+            image_batch=image_batch,
+            batch_images=pending_images if pending_images is not None else [],
         )
-        if settings.max_sections > 0 and len(sections) > settings.max_sections:
-            console.print(f"  [yellow]Consolidating {len(sections)} sections into {settings.max_sections} slides...[/yellow]")
-            client = create_client(settings.gemini_api_key)
-            sections = _call_with_rate_limit(
-                lambda: consolidate_sections(
-                    client=client,
-                    sections=sections,
-                    target_count=settings.max_sections,
-                    video_title=metadata.title,
-                    model=settings.gemini_text_model,
-                ),
-                console=console,
-            )
-        console.print(f"  Sections: {len(sections)}")
-        for s in sections:
-            m, sec = divmod(int(s.start_seconds), 60)
-            console.print(f"    [{m}:{sec:02d}] {s.title}")
+        # Decks are written as slides finish; a cross-video batch job exports them afterwards
+        export_formats = parse_export_formats(settings.export_formats)
+        if export_formats and not dry_run and pending_images is None and slides is None:
+            deck.exporter = DeckExporter(output_dir, metadata.title, export_formats)
+        run.report("slides", 0, len(sections))
+        label = "[yellow]Dry run — building prompts..." if dry_run else "[cyan]Generating slides..."
+        task = progress.add_task(label, total=None)
+        await _produce_slides(run, deck)
         progress.remove_task(task)
+        if deck.reused_images:
+            console.print(f"  [green]Reused {deck.reused_images} checkpointed slides[/green]")
 
-        # Step 5: Summarize sections
-        task = progress.add_task("[cyan]Summarizing sections...", total=None)
-        if not client:
-            client = create_client(settings.gemini_api_key)
-        summaries = []
-        for i, section in enumerate(sections):
-            summary = _call_with_rate_limit(
-                lambda s=section: summarize_section(
-                    client=client,
-                    section=s,
-                    video_title=metadata.title,
-                    total_sections=len(sections),
+        if image_batch and pending_images is None and deck.batch_images:
+            task = progress.add_task("[cyan]Waiting for batch image job...", total=None)
+            await _render_batch(run, deck)
+            progress.remove_task(task)
+        if deck.exporter:
+            run.report("export", 0, 0)
+            with tracing.span("export", formats=settings.export_formats):
+                try:
+                    decks = await asyncio.to_thread(deck.exporter.finish)
+                except BaseException:
+                    deck.exporter.abort()
+                    raise
+            console.print(f"  Deck: {', '.join(d.name for d in decks)}")
+
+        results = deck.results()
+        if deck.skipped:
+            console.print(
+                f"  [yellow]Stopped at the budget: {len(results)} of {len(sections)} slides produced. "
+                "Raise the budget and re-run with --resume to finish.[/yellow]"
+            )
+
+        if slides is not None:
+            return results
+
+        # Step 6: Save metadata
+        meta_path = _write_metadata(run, deck, results, url, metadata)
+        console.print(f"\n  Metadata saved to {meta_path}")
+        console.print(f"  Run report: {tracer.report_path}")
+        if owns_cache and response_cache:
+            console.print(
+                f"  Response cache: {response_cache.hits} hits, {response_cache.misses} misses"
+            )
+        if owns_cache and image_cache and not dry_run:
+            console.print(f"  Image cache: {image_cache.hits} hits, {image_cache.misses} misses")
+
+    return results
+
+
+class _Run:
+    """The settings and shared services every stage of one run works with."""
+
+    def __init__(
+        self,
+        settings: Settings,
+        console: Console,
+        client,
+        scheduler: Scheduler,
+        response_cache: ResponseCache | None,
+        image_cache: ImageCache | None,
+        postprocessor: ImagePostprocessor,
+        token_budget: TokenBudget,
+        checkpoints: CheckpointStore,
+        report: Callable[[str, int, int], None],
+    ) -> None:
+        self.settings = settings
+        self.console = console
+        self.client = client
+        self.scheduler = scheduler
+        self.response_cache = response_cache
+        self.image_cache = image_cache
+        self.postprocessor = postprocessor
+        self.token_budget = token_budget
+        self.checkpoints = checkpoints
+        self.report = report
+
+
+class _Deck:
+    """The slides of one run and how far each has got.
+
+    Indexes are 0-based positions in ``sections``; checkpoints and file
+    names use the 1-based slide number.
+    """
+
+    def __init__(
+        self,
+        run: _Run,
+        video_id: str,
+        video_title: str,
+        sections: list[Section],
+        output_dir: Path,
+        selected: list[int],
+        style: str,
+        dry_run: bool,
+        regenerate: set[int],
+        image_batch: bool,
+        batch_images: list[PendingImage],
+    ) -> None:
+        settings = run.settings
+        self.video_id = video_id
+        self.video_title = video_title
+        self.sections = sections
+        self.selected = selected
+        self.style = style
+        self.dry_run = dry_run
+        self.regenerate = regenerate
+        self.image_batch = image_batch
+        self.batch_images = batch_images
+        self.output_dir = output_dir
+        self.exporter: DeckExporter | None = None
+        self.output_paths = [
+            output_dir / f"{i + 1:02d}_{_slugify(section.title)}.{settings.image_format}"
+            for i, section in enumerate(sections)
+        ]
+        self.summary_keys = [
+            fingerprint(
+                section.model_dump(),
+                len(sections),
+                settings.gemini_text_model,
+                settings.max_words_per_infographic,
+            )
+            for section in sections
+        ]
+        self.summaries = [run.checkpoints.load_summary(i + 1, key) for i, key in enumerate(self.summary_keys)]
+        self.prompts: list[str] = [""] * len(sections)
+        self.image_stats: list[ImageStats | None] = [None] * len(sections)
+        # Batched summary requests, by the section index of each member
+        self.group_tasks: dict[int, asyncio.Task] = {}
+        self.summarized = 0
+        self.finished = 0
+        self.reused_images = 0
+        self.skipped: set[int] = set()
+
+    def results(self) -> list[InfographicResult]:
+        return [
+            InfographicResult(
+                section_index=self.sections[i].index,
+                section_title=self.sections[i].title,
+                image_path=str(self.output_paths[i]),
+                prompt_used=self.prompts[i],
+            )
+            for i in self.selected
+            if i not in self.skipped
+        ]
+
+
+async def _fetch_metadata(
+    run: _Run, video_id: str, backends: Backends, fetch_cache: FetchCache | None, refresh: bool
+) -> VideoMetadata:
+    """Metadata from the checkpoint, the fetch cache or YouTube, in that order."""
+    run.report("metadata", 0, 0)
+    with tracing.span("metadata", source="checkpoint"):
+        metadata = None if refresh else run.checkpoints.load_metadata()
+        if metadata is None and fetch_cache and not refresh:
+            metadata = fetch_cache.load_metadata(video_id)
+            tracing.set_attribute("source", "cache")
+        if metadata is None:
+            tracing.set_attribute("source", "youtube")
+            metadata = await asyncio.to_thread(backends.fetch_metadata, video_id)
+            if fetch_cache:
+                fetch_cache.save_metadata(metadata)
+        run.checkpoints.save_metadata(metadata)
+    run.console.print(f"  Title: [bold]{metadata.title}[/bold]")
+    run.console.print(f"  Duration: {metadata.duration_seconds // 60}m {metadata.duration_seconds % 60}s")
+    return metadata
+
+
+async def _fetch_transcript(
+    run: _Run, video_id: str, backends: Backends, fetch_cache: FetchCache | None, refresh: bool
+) -> Transcript:
+    """The transcript from the checkpoint, the fetch cache or YouTube, in that order."""
+    run.report("transcript", 0, 0)
+    language = run.settings.transcript_language
+    with tracing.span("transcript", source="checkpoint", language=language):
+        transcript = None if refresh else run.checkpoints.load_transcript(language)
+        if transcript is None and fetch_cache and not refresh:
+            transcript = fetch_cache.load_transcript(video_id, language)
+            tracing.set_attribute("source", "cache")
+        if transcript is None:
+            tracing.set_attribute("source", "youtube")
+            transcript = await asyncio.to_thread(backends.fetch_transcript, video_id, language)
+            if fetch_cache:
+                fetch_cache.save_transcript(video_id, language, transcript)
+        run.checkpoints.save_transcript(language, transcript)
+        tracing.set_attribute("snippets", len(transcript))
+    run.console.print(f"  Transcript: {len(transcript)} snippets")
+    return transcript
+
+
+def _compact(transcript: Transcript, settings: Settings, console: Console) -> Transcript:
+    with tracing.span("compaction"):
+        tokens_before = estimate_tokens(transcript.text)
+        transcript = compact_transcript(transcript, strip_fillers=settings.strip_fillers)
+        tokens_after = estimate_tokens(transcript.text)
+        tracing.set_attribute("tokens_before", tokens_before)
+        tracing.set_attribute("tokens_after", tokens_after)
+        tracing.set_attribute("snippets", len(transcript))
+    saved = 1 - tokens_after / tokens_before if tokens_before else 0.0
+    console.print(
+        f"  Compacted transcript: {tokens_before:,} -> {tokens_after:,} tokens "
+        f"({saved:.0%} smaller, {len(transcript)} snippets)"
+    )
+    return transcript
+
+
+def _fit_to_budget(run: _Run, metadata: VideoMetadata, transcript: Transcript, with_images: bool) -> Settings:
+    """The run's settings with ``max_sections`` lowered to what the budget allows."""
+    settings = run.settings
+    segmented_locally = settings.segmenter == "local" or parse_chapters_from_description(
+        metadata.description, metadata.duration_seconds
+    ) is not None
+    planned = run.token_budget.plan_sections(
+        metadata, transcript, settings, segmented_locally, with_images=with_images
+    )
+    max_sections = clamp_sections(settings.max_sections, planned)
+    if max_sections != settings.max_sections:
+        settings = settings.model_copy(update={"max_sections": max_sections})
+        run.console.print(f"  Budget allows up to {max_sections} slides")
+    return settings
+
+
+async def _load_or_detect_sections(run: _Run, metadata: VideoMetadata, transcript: Transcript) -> list[Section]:
+    settings = run.settings
+    run.report("sections", 0, 0)
+    sections_key = fingerprint(
+        settings.gemini_text_model,
+        settings.max_sections,
+        settings.segmenter,
+        settings.compact_transcript,
+        settings.strip_fillers,
+    )
+    sections = run.checkpoints.load_sections(sections_key)
+    if sections is not None:
+        run.console.print("  [green]Reusing checkpointed sections[/green]")
+    else:
+        sections = await _detect_and_consolidate(
+            run.client, run.scheduler, run.response_cache, metadata, transcript, settings, run.console
+        )
+        run.checkpoints.save_sections(sections_key, sections)
+    run.console.print(f"  Sections: {len(sections)}")
+    for s in sections:
+        m, sec = divmod(int(s.start_seconds), 60)
+        run.console.print(f"    [{m}:{sec:02d}] {s.title}")
+    return sections
+
+
+async def _produce_slides(run: _Run, deck: _Deck) -> None:
+    """Produce every selected slide concurrently, stopping new ones at the budget."""
+    # In batch mode, sections without a checkpoint are summarized in
+    # token-budgeted groups; each group is one request whose results feed
+    # the per-slide tasks as soon as it completes.
+    if run.settings.batch_summaries:
+        pending = [deck.sections[i] for i in deck.selected if deck.summaries[i] is None]
+        for group in group_sections_by_tokens(pending, run.settings.summary_batch_max_tokens):
+            group_task = asyncio.ensure_future(
+                _summarize_group(
+                    run.client,
+                    run.scheduler,
+                    run.response_cache,
+                    group,
+                    deck.video_title,
+                    len(deck.sections),
+                    run.settings,
+                    run.console,
+                )
+            )
+            for section in group:
+                deck.group_tasks[section.index] = group_task
+    try:
+        await _gather_or_cancel(_produce_within_budget(run, deck, i) for i in deck.selected)
+    except BaseException:
+        if deck.exporter:
+            deck.exporter.abort()
+        raise
+    finally:
+        for group_task in set(deck.group_tasks.values()):
+            group_task.cancel()
+
+
+async def _produce_within_budget(run: _Run, deck: _Deck, i: int) -> None:
+    try:
+        await _produce_slide(run, deck, i)
+    except BudgetExceededError as e:
+        if not deck.skipped:
+            run.console.print(f"  [yellow]{e}; finishing slides already in progress[/yellow]")
+        deck.skipped.add(i)
+
+
+def _slides_finished(run: _Run, deck: _Deck, count: int = 1) -> None:
+    deck.finished += count
+    run.report("slides", deck.finished, len(deck.sections))
+
+
+async def _summarize_slide(run: _Run, deck: _Deck, i: int) -> SectionSummary:
+    """The slide's summary: checkpointed, from its batched group, or a call of its own."""
+    section = deck.sections[i]
+    summary = deck.summaries[i]
+    if summary is None and section.index in deck.group_tasks:
+        summary = (await deck.group_tasks[section.index]).get(section.index)
+        if summary is None:
+            run.console.print(f"    [yellow]Batched summary missing for section {section.index}; retrying alone[/yellow]")
+        else:
+            run.checkpoints.save_summary(i + 1, deck.summary_keys[i], summary)
+    if summary is None:
+        run.token_budget.check()
+        settings = run.settings
+        with tracing.span("summary", slide=i + 1):
+            summary = await run.scheduler.text.call(
+                lambda: summarize_section_async(
+                    client=run.client,
+                    section=section,
+                    video_title=deck.video_title,
+                    total_sections=len(deck.sections),
                     max_words=settings.max_words_per_infographic,
                     model=settings.gemini_text_model,
+                    cache=run.response_cache,
                 ),
-                console=console,
+                tokens=estimate_tokens(section.transcript_text),
+                console=run.console,
             )
-            summaries.append(summary)
-            console.print(f"    [dim]Summarized ({i+1}/{len(sections)}): {section.title}[/dim]")
-            # Pace requests to stay within free-tier rate limits
-            if i < len(sections) - 1:
-                time.sleep(13)
-        progress.remove_task(task)
+        run.checkpoints.save_summary(i + 1, deck.summary_keys[i], summary)
+    deck.summarized += 1
+    run.report("summaries", deck.summarized, len(deck.sections))
+    run.console.print(f"    [dim]Summarized ({deck.summarized}/{len(deck.sections)}): {section.title}[/dim]")
+    return summary
+
 
-        # Step 6: Build prompts
-        task = progress.add_task("[cyan]Building infographic prompts...", total=None)
-        prompts: list[str] = []
-        for summary in summaries:
-            prompt = build_infographic_prompt(
-                summary=summary,
-                video_title=metadata.title,
-                total_sections=len(sections),
-                style=style,
+async def _produce_slide(run: _Run, deck: _Deck, i: int) -> None:
+    """Summarize one section, build its prompt and render, reuse or queue its image."""
+    settings = run.settings
+    section = deck.sections[i]
+    output_path = deck.output_paths[i]
+    summary = await _summarize_slide(run, deck, i)
+    prompt = build_infographic_prompt(
+        summary=summary,
+        video_title=deck.video_title,
+        total_sections=len(deck.sections),
+        style=deck.style,
+    )
+    deck.prompts[i] = prompt
+    run.checkpoints.save_prompt(i + 1, prompt)
+    if deck.dry_run:
+        run.console.print(f"\n[bold]--- Slide {i + 1}: {section.title} ---[/bold]")
+        run.console.print(prompt)
+        _slides_finished(run, deck)
+        return
+
+    image_key = fingerprint(
+        prompt, settings.gemini_image_model, settings.image_aspect_ratio, run.postprocessor.options
+    )
+    force = (i + 1) in deck.regenerate
+    if not force and run.checkpoints.has_image(i + 1, image_key, output_path):
+        deck.reused_images += 1
+        deck.image_stats[i] = run.checkpoints.load_image_stats(i + 1, image_key)
+        if deck.exporter:
+            await asyncio.to_thread(deck.exporter.add, i + 1, output_path, section.title)
+        _slides_finished(run, deck)
+        return
+    # Check the image cache before going through the governor so cache hits are not paced
+    cache_key = ImageCache.key(prompt, settings.gemini_image_model, settings.image_aspect_ratio)
+    if run.image_cache and not force and run.image_cache.fetch(cache_key, output_path):
+        run.console.print(f"  Reused cached image for slide {i + 1}/{len(deck.sections)}: {section.title}")
+    elif deck.image_batch:
+        run.token_budget.reserve_image()
+        deck.batch_images.append(
+            PendingImage(
+                video_id=deck.video_id,
+                slide=i + 1,
+                prompt=prompt,
+                output_path=str(output_path),
+                checkpoint_key=image_key,
             )
-            prompts.append(prompt)
-        progress.remove_task(task)
+        )
+        return
+    else:
+        run.token_budget.reserve_image()
+        with tracing.span("image", slide=i + 1):
+            run.console.print(f"  Generating slide {i + 1}/{len(deck.sections)}: {section.title}")
+            await run.scheduler.image.call(
+                lambda: generate_infographic_async(
+                    client=run.client,
+                    prompt=prompt,
+                    output_path=output_path,
+                    model=settings.gemini_image_model,
+                    aspect_ratio=settings.image_aspect_ratio,
+                    cache=run.image_cache,
+                    refresh=True,  # cache lookup already done above
+                ),
+                tokens=estimate_tokens(prompt),
+                console=run.console,
+                retry_on=(ImageGenerationError,),
+            )
+    with tracing.span("postprocess", slide=i + 1):
+        stats = await run.postprocessor.process(output_path)
+        deck.image_stats[i] = stats
+        tracing.set_attribute("original_bytes", stats.original_bytes)
+        tracing.set_attribute("bytes", stats.bytes)
+    run.checkpoints.save_image(i + 1, image_key, output_path, stats)
+    if deck.exporter:
+        await asyncio.to_thread(deck.exporter.add, i + 1, output_path, section.title)
+    _slides_finished(run, deck)
 
-        # Step 7: Generate images (or dry-run)
-        output_dir = Path(settings.output_dir) / video_id
-        output_dir.mkdir(parents=True, exist_ok=True)
-        results: list[InfographicResult] = []
-
-        if dry_run:
-            task = progress.add_task("[yellow]Dry run — printing prompts...", total=None)
-            for i, (section, prompt) in enumerate(zip(sections, prompts)):
-                console.print(f"\n[bold]--- Slide {i + 1}: {section.title} ---[/bold]")
-                console.print(prompt)
-                results.append(
-                    InfographicResult(
-                        section_index=section.index,
-                        section_title=section.title,
-                        image_path=str(output_dir / f"{i + 1:02d}_{_slugify(section.title)}.{settings.image_format}"),
-                        prompt_used=prompt,
-                    )
-                )
-            progress.remove_task(task)
-        else:
-            task = progress.add_task("[cyan]Generating infographics...", total=None)
-            for i, (section, prompt) in enumerate(zip(sections, prompts)):
-                filename = f"{i + 1:02d}_{_slugify(section.title)}.{settings.image_format}"
-                output_path = output_dir / filename
-                console.print(f"  Generating slide {i + 1}/{len(sections)}: {section.title}")
-                _call_with_rate_limit(
-                    lambda p=prompt, o=output_path: generate_infographic(
-                        client=client,
-                        prompt=p,
-                        output_path=o,
-                        model=settings.gemini_image_model,
-                        aspect_ratio=settings.image_aspect_ratio,
-                    ),
-                    console=console,
-                )
-                results.append(
-                    InfographicResult(
-                        section_index=section.index,
-                        section_title=section.title,
-                        image_path=str(output_path),
-                        prompt_used=prompt,
-                    )
-                )
-                # Pace requests for rate limits
-                if i < len(sections) - 1:
-                    time.sleep(13)
-            progress.remove_task(task)
 
-        # Step 8: Save metadata
-        meta_path = output_dir / "metadata.json"
-        meta_path.write_text(
-            json.dumps(
-                {
-                    "video_id": video_id,
-                    "video_title": metadata.title,
-                    "video_url": url,
-                    "channel": metadata.channel_title,
-                    "generated_at": datetime.now(timezone.utc).isoformat(),
-                    "style": style,
-                    "sections": [
-                        {
-                            "index": r.section_index,
-                            "title": r.section_title,
-                            "image_file": Path(r.image_path).name,
-                        }
-                        for r in results
-                    ],
-                },
-                indent=2,
+async def _render_batch(run: _Run, deck: _Deck) -> None:
+    """Render the run's queued images in one Batch API job and add them to the deck."""
+    settings = run.settings
+    run.report("image_batch", 0, len(deck.batch_images))
+    failed = await run_image_batch_async(
+        run.client,
+        deck.batch_images,
+        model=settings.gemini_image_model,
+        aspect_ratio=settings.image_aspect_ratio,
+        poll_seconds=settings.batch_poll_seconds,
+        image_cache=run.image_cache,
+        console=run.console,
+        postprocessor=run.postprocessor,
+    )
+    for image in deck.batch_images:
+        deck.image_stats[image.slide - 1] = run.postprocessor.stats.get(image.output_path)
+    _slides_finished(run, deck, len(deck.batch_images) - len(failed))
+    if failed:
+        if deck.exporter:
+            deck.exporter.abort()
+        raise BatchJobError(
+            f"{len(failed)} slides were not produced; re-run with --resume to retry them"
+        )
+    if deck.exporter:
+        for image in deck.batch_images:
+            await asyncio.to_thread(
+                deck.exporter.add, image.slide, Path(image.output_path), deck.sections[image.slide - 1].title
             )
+
+
+def _write_metadata(
+    run: _Run,
+    deck: _Deck,
+    results: list[InfographicResult],
+    url: str,
+    metadata: VideoMetadata,
+) -> Path:
+    """Write ``metadata.json`` for a finished run and return its path."""
+    postprocessor = run.postprocessor
+    stats_by_index = {s.index: deck.image_stats[i] for i, s in enumerate(deck.sections)}
+    known_stats = [stats_by_index[r.section_index] for r in results if stats_by_index[r.section_index]]
+    original_bytes = sum(s.original_bytes for s in known_stats)
+    final_bytes = sum(s.bytes for s in known_stats)
+    if known_stats:
+        run.console.print(
+            f"  Images: {original_bytes / 1024:,.0f} KiB -> {final_bytes / 1024:,.0f} KiB "
+            f"as {postprocessor.image_format}"
         )
-        console.print(f"\n  Metadata saved to {meta_path}")
+    meta_path = deck.output_dir / "metadata.json"
+    meta_path.write_text(
+        json.dumps(
+            {
+                "video_id": deck.video_id,
+                "video_title": metadata.title,
+                "video_url": url,
+                "channel": metadata.channel_title,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "style": deck.style,
+                "usage": run.token_budget.usage(),
+                "incomplete": bool(deck.skipped),
+                "images": {
+                    "format": postprocessor.image_format,
+                    "original_bytes": original_bytes,
+                    "bytes": final_bytes,
+                    "saved_bytes": original_bytes - final_bytes,
+                },
+                "sections": [
+                    {
+                        "index": r.section_index,
+                        "title": r.section_title,
+                        "image_file": Path(r.image_path).name,
+                        **_image_entry(stats_by_index[r.section_index]),
+                    }
+                    for r in results
+                ],
+            },
+            indent=2,
+        )
+    )
+    return meta_path
 
-    return results
 
+def _image_entry(stats: ImageStats | None) -> dict:
+    """Per-slide size details for metadata.json."""
+    if stats is None:
+        return {}
+    entry = {"width": stats.width, "height": stats.height, "bytes": stats.bytes, "original_bytes": stats.original_bytes}
+    if stats.thumbnail:
+        entry["thumbnail_file"] = f"{THUMBNAIL_DIR}/{stats.thumbnail}"
+    return entry
 
-def _call_with_rate_limit(func, console: Console, max_retries: int = 3):
-    """Call a function with automatic retry on rate limit (429) errors."""
-    for attempt in range(max_retries + 1):
-        try:
-            return func()
-        except Exception as e:
-            error_str = str(e)
-            if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
-                if attempt < max_retries:
-                    # Extract retry delay from error if available
-                    wait = 60
-                    import re as _re
-                    delay_match = _re.search(r"retry in (\d+)", error_str, _re.IGNORECASE)
-                    if delay_match:
-                        wait = int(delay_match.group(1)) + 5
-                    console.print(f"    [yellow]Rate limited. Waiting {wait}s...[/yellow]")
-                    time.sleep(wait)
-                    continue
-            raise
-
-
-def _detect_sections(
-    metadata, transcript, settings: Settings, console: Console
+
+def record_batch_images(
+    video_dir: Path,
+    images: list[PendingImage],
+    stats: dict[str, ImageStats],
+    failed: list[PendingImage],
+) -> None:
+    """Add the outcome of a cross-video batch job to ``metadata.json``.
+
+    The run wrote the metadata before the job rendered its slides, so those
+    slides have no size details yet. Slides the job did not produce are
+    marked ``failed`` and the video ``incomplete``.
+    """
+    meta_path = video_dir / "metadata.json"
+    metadata = json.loads(meta_path.read_text())
+    failed_files = {Path(image.output_path).name for image in failed}
+    rendered = {Path(image.output_path).name: stats.get(image.output_path) for image in images}
+    for entry in metadata["sections"]:
+        if entry["image_file"] in failed_files:
+            entry["failed"] = True
+        elif entry["image_file"] in rendered:
+            entry.update(_image_entry(rendered[entry["image_file"]]))
+    sized = [e for e in metadata["sections"] if "bytes" in e and not e.get("failed")]
+    original_bytes = sum(e["original_bytes"] for e in sized)
+    final_bytes = sum(e["bytes"] for e in sized)
+    metadata["images"].update(
+        original_bytes=original_bytes, bytes=final_bytes, saved_bytes=original_bytes - final_bytes
+    )
+    metadata["incomplete"] = metadata.get("incomplete", False) or bool(failed_files)
+    meta_path.write_text(json.dumps(metadata, indent=2))
+
+
+async def _gather_or_cancel(coros) -> list:
+    """Run coroutines concurrently; cancel the rest if any of them fails."""
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _summarize_group(
+    client,
+    scheduler: Scheduler,
+    cache: ResponseCache | None,
+    group: list[Section],
+    video_title: str,
+    total_sections: int,
+    settings: Settings,
+    console: Console,
+) -> dict[int, SectionSummary]:
+    """Summarize a group of sections in one request.
+
+    A failed request yields no summaries, so every section in the group
+    falls back to an individual call.
+    """
+    try:
+        with tracing.span("summary_batch", sections=len(group)):
+            return await scheduler.text.call(
+                lambda: summarize_sections_batch_async(
+                    client=client,
+                    sections=group,
+                    video_title=video_title,
+                    total_sections=total_sections,
+                    max_words=settings.max_words_per_infographic,
+                    model=settings.gemini_text_model,
+                    cache=cache,
+                ),
+                tokens=sum(estimate_tokens(s.transcript_text) for s in group),
+                console=console,
+            )
+    except Exception as e:
+        console.print(f"    [yellow]Batched summarization failed ({e}); summarizing sections individually[/yellow]")
+        return {}
+
+
+async def _detect_and_consolidate(
+    client,
+    scheduler: Scheduler,
+    cache: ResponseCache | None,
+    metadata,
+    transcript,
+    settings: Settings,
+    console: Console,
+) -> list[Section]:
+    """Detect sections, then consolidate them down to ``max_sections`` if needed."""
+    with tracing.span("section_detection"):
+        sections = await _detect_sections(
+            client, scheduler, cache, metadata, transcript, settings, console
+        )
+        tracing.set_attribute("sections", len(sections))
+    if settings.max_sections > 0 and len(sections) > settings.max_sections:
+        console.print(f"  [yellow]Consolidating {len(sections)} sections into {settings.max_sections} slides...[/yellow]")
+        with tracing.span("consolidation", sections=len(sections), target=settings.max_sections):
+            sections = await scheduler.text.call(
+                lambda: consolidate_sections_async(
+                    client=client,
+                    sections=sections,
+                    target_count=settings.max_sections,
+                    video_title=metadata.title,
+                    model=settings.gemini_text_model,
+                    cache=cache,
+                ),
+                tokens=estimate_tokens(" ".join(s.title for s in sections)),
+                console=console,
+            )
+    return sections
+
+
+async def _detect_sections(
+    client,
+    scheduler: Scheduler,
+    cache: ResponseCache | None,
+    metadata,
+    transcript,
+    settings: Settings,
+    console: Console,
 ) -> list[Section]:
     """Detect sections via chapters, AI segmentation, or time-based fallback."""
     # Try parsing chapters from description
@@ -242,17 +857,79 @@ def _detect_sections(
         console.print("  [green]Found chapters in video description[/green]")
         return assign_transcript_to_sections(chapters, transcript)
 
+    if settings.segmenter == "local":
+        start = time.perf_counter()
+        sections = segment_locally(transcript, metadata.duration_seconds, max_sections=settings.max_sections)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        console.print(f"  [yellow]No chapters found — segmented locally in {elapsed_ms:.0f} ms[/yellow]")
+        return sections
+
     # Try AI segmentation
     console.print("  [yellow]No chapters found — using AI segmentation...[/yellow]")
+    window_seconds = settings.segment_window_minutes * 60
+    if window_seconds and metadata.duration_seconds > 1.5 * window_seconds:
+        return await _segment_in_windows(
+            client, scheduler, cache, metadata, transcript, settings, console
+        )
     try:
-        client = create_client(settings.gemini_api_key)
-        return segment_transcript(
-            client=client,
-            transcript=transcript,
-            metadata=metadata,
-            model=settings.gemini_text_model,
+        return await scheduler.text.call(
+            lambda: segment_transcript_async(
+                client=client,
+                transcript=transcript,
+                metadata=metadata,
+                model=settings.gemini_text_model,
+                cache=cache,
+            ),
+            tokens=estimate_tokens(transcript.text),
+            console=console,
         )
     except Exception as e:
         console.print(f"  [red]AI segmentation failed: {e}[/red]")
         console.print("  [yellow]Falling back to time-based splitting...[/yellow]")
         return split_by_time(transcript, metadata.duration_seconds)
+
+
+async def _segment_in_windows(
+    client,
+    scheduler: Scheduler,
+    cache: ResponseCache | None,
+    metadata,
+    transcript,
+    settings: Settings,
+    console: Console,
+) -> list[Section]:
+    """Segment a long transcript as overlapping windows in parallel, then merge.
+
+    A window whose call fails is split by time instead of failing the run.
+    """
+    windows = transcript_windows(
+        transcript,
+        metadata.duration_seconds,
+        window_seconds=settings.segment_window_minutes * 60,
+        overlap_seconds=settings.segment_overlap_minutes * 60,
+    )
+    console.print(f"  Segmenting {len(windows)} overlapping windows in parallel...")
+
+    async def _segment_window(k: int):
+        window = windows[k]
+        try:
+            with tracing.span("segment_window", window=k + 1):
+                return await scheduler.text.call(
+                    lambda: segment_window_async(
+                        client=client,
+                        window=window,
+                        part=k + 1,
+                        parts=len(windows),
+                        metadata=metadata,
+                        model=settings.gemini_text_model,
+                        cache=cache,
+                    ),
+                    tokens=estimate_tokens(window.snippets.text),
+                    console=console,
+                )
+        except Exception as e:
+            console.print(f"  [red]Segmenting window {k + 1} failed: {e}; splitting it by time[/red]")
+            return None
+
+    results = await _gather_or_cancel(_segment_window(k) for k in range(len(windows)))
+    return merge_window_segments(windows, results, transcript, metadata.duration_seconds)
@@ -0,0 +1,37 @@
+"""Shared scheduling of Gemini calls across one or many pipeline runs."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from yt_slides.governor import RateGovernor
+
+if TYPE_CHECKING:
+    from yt_slides.config import Settings
+
+
+class Scheduler:
+    """Rate budget for the text and image models, shared by every run using it.
+
+    A single pipeline creates its own scheduler; batch runs pass one scheduler
+    to all pipelines so that concurrent videos draw from the same budget.
+    Every Gemini call goes through ``scheduler.text.call(...)`` or
+    ``scheduler.image.call(...)``. Must be created inside the event loop that
+    will use it.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.text = RateGovernor(
+            settings.gemini_text_model,
+            concurrency=settings.text_concurrency,
+            rpm=settings.text_rpm,
+            tpm=settings.text_tpm,
+            max_retries=settings.max_retries,
+        )
+        self.image = RateGovernor(
+            settings.gemini_image_model,
+            concurrency=settings.image_concurrency,
+            rpm=settings.image_rpm,
+            tpm=settings.image_tpm,
+            max_retries=settings.max_retries,
+        )
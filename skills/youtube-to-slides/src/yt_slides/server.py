@@ -0,0 +1,374 @@
+"""Long-lived local HTTP server that runs pipeline jobs from a queue."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from collections import deque
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from pydantic import ValidationError
+from rich.console import Console
+
+from yt_slides.ai.prompt_builder import STYLE_PRESETS
+from yt_slides.ai.response_cache import open_response_cache
+from yt_slides.backends import Backends
+from yt_slides.image.cache import open_image_cache
+from yt_slides.image.postprocess import ImagePostprocessor
+from yt_slides.models import Job, JobRequest
+from yt_slides.pipeline import run_pipeline_async
+from yt_slides.scheduler import Scheduler
+from yt_slides.youtube.url_parser import extract_video_id
+
+if TYPE_CHECKING:
+    from yt_slides.config import Settings
+
+MAX_FINISHED_JOBS = 1000  # finished jobs kept for status queries
+_MAX_BODY_BYTES = 1 << 20
+_REQUEST_TIMEOUT_SECONDS = 30.0
+_ACTIVE = ("queued", "running")
+_REASONS = {
+    200: "OK",
+    202: "Accepted",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class _Histogram:
+    """A Prometheus histogram with fixed bucket bounds, in seconds."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def render(self, name: str, help_text: str) -> list[str]:
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for bound, count in zip(self.buckets, self.counts):
+            lines.append(f'{name}_bucket{{le="{bound:g}"}} {count}')
+        lines.append(f'{name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum {self.sum:.6f}")
+        lines.append(f"{name}_count {self.count}")
+        return lines
+
+
+class JobServer:
+    """Runs jobs submitted over HTTP with one warm set of clients.
+
+    Every job shares one Gemini client (and its connection pool), one
+    :class:`Scheduler`, the response and image caches and one image
+    post-processing pool, as a batch run does. Up to ``concurrency`` jobs
+    run at once; the rest wait in a FIFO queue.
+
+    Endpoints (JSON unless noted):
+
+    - ``POST /jobs`` with a :class:`JobRequest` body queues a job (202). A
+      video that is already queued or running returns that job instead (200).
+    - ``GET /jobs`` lists jobs; ``GET /jobs/<id>`` shows one with its
+      progress; ``DELETE /jobs/<id>`` cancels it.
+    - ``GET /metrics`` returns Prometheus text; ``GET /healthz`` returns ok.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        concurrency: int | None = None,
+        backends: Backends | None = None,
+        console: Console | None = None,
+    ) -> None:
+        self.settings = settings
+        self.concurrency = max(1, concurrency or settings.batch_concurrency)
+        self.backends = backends or Backends()
+        self.console = console or Console()
+        self.jobs: dict[str, Job] = {}
+        # Created in run(): before Python 3.10, asyncio primitives bind to
+        # the loop that is current when they are created
+        self._queue: asyncio.Queue[str] | None = None
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._finished: deque[str] = deque()
+        self._started_at = time.time()
+        self._counters = {
+            "submitted": 0,
+            "done": 0,
+            "failed": 0,
+            "cancelled": 0,
+            "slides": 0,
+            "http_requests": 0,
+        }
+        self._job_seconds = _Histogram((10, 30, 60, 120, 300, 600, 1200, 1800, 3600))
+        self._queue_seconds = _Histogram((0.1, 1, 5, 15, 60, 300, 900, 3600))
+        # Shared by all jobs; created when the server starts
+        self.client = None
+        self.scheduler: Scheduler | None = None
+        self.response_cache = None
+        self.image_cache = None
+        self.postprocessor: ImagePostprocessor | None = None
+
+    async def run(self, host: str, port: int) -> None:
+        """Serve until cancelled."""
+        self._queue = asyncio.Queue()
+        self.client = self.backends.create_client(self.settings.gemini_api_key, self.settings.gemini_base_url)
+        self.scheduler = Scheduler(self.settings)
+        self.response_cache = open_response_cache(self.settings)
+        self.image_cache = open_image_cache(self.settings)
+        self.postprocessor = ImagePostprocessor.from_settings(self.settings)
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        server = await asyncio.start_server(self._handle, host, port)
+        self.console.print(
+            f"[green]Serving on http://{host}:{port} with {self.concurrency} concurrent jobs[/green]"
+        )
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for task in [*workers, *self._tasks.values()]:
+                task.cancel()
+            await asyncio.gather(*workers, *self._tasks.values(), return_exceptions=True)
+            self.postprocessor.close()
+
+    # Jobs
+
+    def submit(self, request: JobRequest) -> tuple[Job, bool]:
+        """Queue ``request``; returns the job and whether it is new."""
+        video_id = extract_video_id(request.url)
+        for job in self.jobs.values():
+            if job.video_id == video_id and job.status in _ACTIVE:
+                return job, False
+        job = Job(id=uuid.uuid4().hex[:12], video_id=video_id, request=request, submitted_at=time.time())
+        self.jobs[job.id] = job
+        self._counters["submitted"] += 1
+        self._queue.put_nowait(job.id)
+        return job, True
+
+    def cancel(self, job: Job) -> None:
+        if job.status == "queued":
+            self._finish(job, "cancelled")
+        elif job.status == "running":
+            self._tasks[job.id].cancel()
+
+    async def _worker(self) -> None:
+        while True:
+            job = self.jobs.get(await self._queue.get())
+            if job is None or job.status != "queued":
+                continue
+            task = asyncio.create_task(self._run(job))
+            self._tasks[job.id] = task
+            try:
+                await task
+            except asyncio.CancelledError:
+                if not task.cancelled():
+                    raise  # the worker itself is shutting down
+            finally:
+                self._tasks.pop(job.id, None)
+
+    async def _run(self, job: Job) -> None:
+        job.status = "running"
+        job.started_at = time.time()
+        self._queue_seconds.observe(job.started_at - job.submitted_at)
+        request = job.request
+        overrides: dict = {}
+        if request.max_sections is not None:
+            overrides["max_sections"] = request.max_sections
+        if request.aspect_ratio:
+            overrides["image_aspect_ratio"] = request.aspect_ratio
+        settings = self.settings.model_copy(update=overrides)
+        job.output_dir = str(settings.output_dir / job.video_id)
+
+        def on_progress(stage: str, done: int, total: int) -> None:
+            job.stage = stage
+            if stage == "summaries":
+                job.summaries_done = done
+            elif stage == "slides":
+                self._counters["slides"] += done - job.slides_done
+                job.slides_done, job.slides_total = done, total
+
+        self.console.print(f"[bold]Starting job {job.id}: {job.video_id}[/bold]")
+        try:
+            results = await run_pipeline_async(
+                url=request.url,
+                settings=settings,
+                style=request.style,
+                dry_run=request.dry_run,
+                console=Console(quiet=True),
+                client=self.client,
+                scheduler=self.scheduler,
+                show_progress=False,
+                resume=request.resume,
+                response_cache=self.response_cache,
+                image_cache=self.image_cache,
+                regenerate=set(request.regenerate),
+                refresh=request.refresh,
+                backends=self.backends,
+                postprocessor=self.postprocessor,
+                on_progress=on_progress,
+            )
+        except asyncio.CancelledError:
+            self._finish(job, "cancelled")
+            self.console.print(f"[yellow]Cancelled job {job.id}: {job.video_id}[/yellow]")
+            raise
+        except Exception as e:
+            job.error = str(e) or type(e).__name__
+            self._finish(job, "failed")
+            self.console.print(f"[red]Failed job {job.id}: {job.video_id}: {job.error}[/red]")
+            return
+        job.slides = [r.image_path for r in results]
+        self._finish(job, "done")
+        self.console.print(f"[green]Finished job {job.id}: {job.video_id}, {len(results)} slides[/green]")
+
+    def _finish(self, job: Job, status: str) -> None:
+        job.status = status
+        job.finished_at = time.time()
+        self._counters[status] += 1
+        if job.started_at is not None:
+            self._job_seconds.observe(job.finished_at - job.started_at)
+        self._finished.append(job.id)
+        while len(self._finished) > MAX_FINISHED_JOBS:
+            self.jobs.pop(self._finished.popleft(), None)
+
+    # HTTP
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one request per connection (HTTP/1.1 with ``Connection: close``)."""
+        try:
+            try:
+                method, path, body = await asyncio.wait_for(_read_request(reader), _REQUEST_TIMEOUT_SECONDS)
+                status, content_type, payload = self._route(method, path, body)
+            except _HttpError as e:
+                status, content_type, payload = e.status, "application/json", _json({"error": e.message})
+            except (ValueError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+                status, content_type, payload = 400, "application/json", _json({"error": "malformed request"})
+            except Exception as e:
+                status, content_type, payload = 500, "application/json", _json({"error": str(e)})
+            writer.write(
+                (
+                    f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode("latin-1")
+                + payload
+            )
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def _route(self, method: str, path: str, body: bytes) -> tuple[int, str, bytes]:
+        self._counters["http_requests"] += 1
+        parts = [p for p in path.split("/") if p]
+        if parts == ["healthz"] and method == "GET":
+            return 200, "application/json", _json({"status": "ok"})
+        if parts == ["metrics"] and method == "GET":
+            return 200, "text/plain; version=0.0.4", self.metrics().encode()
+        if parts == ["jobs"]:
+            if method == "GET":
+                return 200, "application/json", _json([j.model_dump() for j in self.jobs.values()])
+            if method == "POST":
+                return self._post_job(body)
+        elif len(parts) == 2 and parts[0] == "jobs":
+            job = self.jobs.get(parts[1])
+            if job is None:
+                raise _HttpError(404, f"no job {parts[1]}")
+            if method == "GET":
+                return 200, "application/json", _json(job.model_dump())
+            if method == "DELETE":
+                if job.status not in _ACTIVE:
+                    raise _HttpError(409, f"job {job.id} is already {job.status}")
+                self.cancel(job)
+                return 202, "application/json", _json(job.model_dump())
+        else:
+            raise _HttpError(404, f"no such endpoint: {path}")
+        raise _HttpError(405, f"{method} is not allowed on {path}")
+
+    def _post_job(self, body: bytes) -> tuple[int, str, bytes]:
+        try:
+            request = JobRequest.model_validate_json(body)
+        except ValidationError as e:
+            raise _HttpError(400, str(e)) from e
+        if request.style not in STYLE_PRESETS:
+            raise _HttpError(400, f"unknown style {request.style!r}; use one of {', '.join(STYLE_PRESETS)}")
+        try:
+            job, created = self.submit(request)
+        except ValueError as e:
+            raise _HttpError(400, str(e).splitlines()[0]) from e
+        return (202 if created else 200), "application/json", _json(job.model_dump())
+
+    def metrics(self) -> str:
+        """Throughput and latency counters in the Prometheus text format."""
+        statuses = [j.status for j in self.jobs.values()]
+        c = self._counters
+        lines = [
+            "# HELP yt_slides_jobs_submitted_total Jobs accepted.",
+            "# TYPE yt_slides_jobs_submitted_total counter",
+            f"yt_slides_jobs_submitted_total {c['submitted']}",
+            "# HELP yt_slides_jobs_finished_total Jobs finished, by outcome.",
+            "# TYPE yt_slides_jobs_finished_total counter",
+            *(f'yt_slides_jobs_finished_total{{status="{s}"}} {c[s]}' for s in ("done", "failed", "cancelled")),
+            "# HELP yt_slides_jobs Jobs currently queued or running.",
+            "# TYPE yt_slides_jobs gauge",
+            *(f'yt_slides_jobs{{status="{s}"}} {statuses.count(s)}' for s in _ACTIVE),
+            "# HELP yt_slides_slides_total Slides finished across all jobs.",
+            "# TYPE yt_slides_slides_total counter",
+            f"yt_slides_slides_total {c['slides']}",
+            *self._queue_seconds.render(
+                "yt_slides_job_queue_seconds", "Time jobs waited in the queue before starting."
+            ),
+            *self._job_seconds.render("yt_slides_job_duration_seconds", "Time from job start to finish."),
+            "# HELP yt_slides_http_requests_total HTTP requests served.",
+            "# TYPE yt_slides_http_requests_total counter",
+            f"yt_slides_http_requests_total {c['http_requests']}",
+            "# HELP yt_slides_start_time_seconds Unix time the server started.",
+            "# TYPE yt_slides_start_time_seconds gauge",
+            f"yt_slides_start_time_seconds {self._started_at:.3f}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class _HttpError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _json(value) -> bytes:
+    return json.dumps(value).encode()
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, bytes]:
+    method, target, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+    headers: dict[str, str] = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length") or 0)
+    if length > _MAX_BODY_BYTES:
+        raise _HttpError(413, "request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), urlsplit(target).path, body
+
+
+def serve(settings: Settings, host: str, port: int, concurrency: int | None = None, console: Console | None = None) -> None:
+    """Run a :class:`JobServer` until interrupted."""
+    server = JobServer(settings, concurrency=concurrency, console=console)
+    try:
+        asyncio.run(server.run(host, port))
+    except KeyboardInterrupt:
+        pass
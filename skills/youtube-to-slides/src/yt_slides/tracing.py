@@ -0,0 +1,247 @@
+"""Per-stage and per-call tracing of pipeline runs."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+from rich.console import Console
+
+from yt_slides.models import TraceSpan
+
+_tracer: ContextVar[Tracer | None] = ContextVar("yt_slides_tracer", default=None)
+_span: ContextVar[TraceSpan | None] = ContextVar("yt_slides_span", default=None)
+
+
+class Tracer:
+    """Collects the spans of one pipeline run.
+
+    Use as ``with tracer:`` around the run; the root span covers the whole
+    block and :func:`span` opens child spans anywhere below it, including in
+    tasks and threads started from it. On exit the report is written to
+    ``report_path`` (if set) and, with ``otel``, the spans are exported to
+    OpenTelemetry.
+    """
+
+    def __init__(
+        self,
+        name: str = "pipeline",
+        report_path: Path | None = None,
+        otel: bool = False,
+        console: Console | None = None,
+        **attributes,
+    ) -> None:
+        self.name = name
+        self.report_path = report_path
+        self.otel = otel
+        self.console = console or Console()
+        self.spans: list[TraceSpan] = []
+        self.root: TraceSpan | None = None
+        self._attributes = attributes
+        self._ids = itertools.count(1)
+        self._origin = time.perf_counter()
+        self._started_at = datetime.now(timezone.utc)
+        self._tokens: list = []
+        self._root_cm = None
+
+    def __enter__(self) -> Tracer:
+        self._tokens.append(_tracer.set(self))
+        self._root_cm = self._open(self.name, self._attributes)
+        self.root = self._root_cm.__enter__()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        try:
+            self._root_cm.__exit__(*exc)
+        finally:
+            _tracer.reset(self._tokens.pop())
+        if self.report_path:
+            self.write_report(self.report_path)
+        if self.otel:
+            export_otel(self, self.console)
+
+    @contextmanager
+    def _open(self, name: str, attributes: dict) -> Iterator[TraceSpan]:
+        parent = _span.get()
+        span = TraceSpan(
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent else None,
+            name=name,
+            start_seconds=round(time.perf_counter() - self._origin, 6),
+            attributes={k: v for k, v in attributes.items() if v is not None},
+        )
+        self.spans.append(span)
+        token = _span.set(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.error = str(e) or type(e).__name__
+            raise
+        finally:
+            span.duration_seconds = round(time.perf_counter() - start, 6)
+            _span.reset(token)
+
+    def report(self) -> dict:
+        """Summarize the spans as a JSON-serializable run report."""
+        totals: dict[str, dict] = {}
+        for s in self.spans:
+            t = totals.setdefault(
+                s.name,
+                {
+                    "count": 0,
+                    "seconds": 0.0,
+                    "errors": 0,
+                    "retries": 0,
+                    "backoff_seconds": 0.0,
+                    "queue_seconds": 0.0,
+                    "prompt_tokens": 0,
+                    "output_tokens": 0,
+                },
+            )
+            t["count"] += 1
+            t["seconds"] = round(t["seconds"] + s.duration_seconds, 6)
+            t["errors"] += s.status != "ok"
+            t["retries"] += s.retries
+            t["backoff_seconds"] = round(t["backoff_seconds"] + s.backoff_seconds, 6)
+            t["queue_seconds"] = round(t["queue_seconds"] + s.queue_seconds, 6)
+            t["prompt_tokens"] += s.prompt_tokens
+            t["output_tokens"] += s.output_tokens
+        return {
+            "started_at": self._started_at.isoformat(),
+            "wall_seconds": self.root.duration_seconds if self.root else 0.0,
+            "status": self.root.status if self.root else "ok",
+            "totals": totals,
+            "spans": [s.model_dump() for s in self.spans],
+        }
+
+    def write_report(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per writer: concurrent runs of the same video may report at once
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp.write_text(json.dumps(self.report(), indent=2))
+        os.replace(tmp, path)
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[TraceSpan | None]:
+    """Open a child span of the current span; yields None when not tracing."""
+    tracer = _tracer.get()
+    if tracer is None:
+        yield None
+        return
+    with tracer._open(name, attributes) as s:
+        yield s
+
+
+def set_attribute(key: str, value) -> None:
+    """Set an attribute on the current span."""
+    s = _span.get()
+    if s is not None:
+        s.attributes[key] = value
+
+
+def record_retry(backoff_seconds: float) -> None:
+    """Count a retry and its backoff sleep on the current span."""
+    s = _span.get()
+    if s is not None:
+        s.retries += 1
+        s.backoff_seconds = round(s.backoff_seconds + backoff_seconds, 6)
+
+
+def record_queue(seconds: float) -> None:
+    """Add time spent waiting for a scheduler slot or pacing to the current span."""
+    s = _span.get()
+    if s is not None:
+        s.queue_seconds = round(s.queue_seconds + seconds, 6)
+
+
+def record_response(s: TraceSpan | None, request_bytes: int, response) -> None:
+    """Record payload sizes and token usage of a Gemini response on ``s``."""
+    if s is None:
+        return
+    s.request_bytes += request_bytes
+    for candidate in response.candidates or []:
+        for part in (candidate.content.parts if candidate.content else None) or []:
+            if part.text:
+                s.response_bytes += len(part.text.encode("utf-8"))
+            if part.inline_data and part.inline_data.data:
+                s.response_bytes += len(part.inline_data.data)
+    usage = response.usage_metadata
+    if usage:
+        s.prompt_tokens += usage.prompt_token_count or 0
+        s.output_tokens += (usage.candidates_token_count or 0) + (usage.thoughts_token_count or 0)
+
+
+def export_otel(tracer: Tracer, console: Console) -> None:
+    """Replay the tracer's spans as OpenTelemetry spans.
+
+    Uses the globally configured tracer provider. If none is configured and
+    the OpenTelemetry SDK and OTLP exporter are installed, spans are sent to
+    the endpoint given by the standard ``OTEL_EXPORTER_OTLP_*`` variables.
+    """
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        console.print("  [yellow]OpenTelemetry export skipped: install yt-slides\\[otel][/yellow]")
+        return
+
+    provider = trace.get_tracer_provider()
+    if isinstance(provider, trace.ProxyTracerProvider):
+        provider = _default_provider() or provider
+    otel_tracer = provider.get_tracer("yt_slides")
+
+    origin_ns = int(tracer._started_at.timestamp() * 1e9)
+    opened = {}
+    for s in tracer.spans:
+        parent = opened.get(s.parent_id)
+        otel_span = otel_tracer.start_span(
+            s.name,
+            context=trace.set_span_in_context(parent) if parent else None,
+            start_time=origin_ns + int(s.start_seconds * 1e9),
+            attributes={
+                **s.attributes,
+                "retries": s.retries,
+                "backoff_seconds": s.backoff_seconds,
+                "queue_seconds": s.queue_seconds,
+                "request_bytes": s.request_bytes,
+                "response_bytes": s.response_bytes,
+                "gen_ai.usage.input_tokens": s.prompt_tokens,
+                "gen_ai.usage.output_tokens": s.output_tokens,
+            },
+        )
+        if s.status != "ok":
+            otel_span.set_status(trace.Status(trace.StatusCode.ERROR, s.error))
+        opened[s.span_id] = otel_span
+    for s in reversed(tracer.spans):
+        opened[s.span_id].end(end_time=origin_ns + int((s.start_seconds + s.duration_seconds) * 1e9))
+    if hasattr(provider, "force_flush"):
+        provider.force_flush()
+
+
+_otel_provider = None
+
+
+def _default_provider():
+    """An SDK tracer provider exporting over OTLP/HTTP, if those are installed."""
+    global _otel_provider
+    if _otel_provider is None:
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        except ImportError:
+            return None
+        _otel_provider = TracerProvider(resource=Resource.create({"service.name": "yt-slides"}))
+        _otel_provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    return _otel_provider
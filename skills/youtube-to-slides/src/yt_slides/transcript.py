@@ -0,0 +1,153 @@
+"""Compact, columnar storage for timestamped transcripts."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from typing import Iterable, Iterator
+
+from pydantic import BaseModel, ConfigDict
+
+from yt_slides.models import TranscriptSnippet
+
+
+class Transcript:
+    """A transcript stored as columns instead of one object per snippet.
+
+    Start times and durations live in ``array('d')`` columns and the texts in
+    one string, joined by single spaces, with offsets into it. Long
+    livestreams have tens of thousands of caption lines, so this is much
+    cheaper to build and hold than a list of :class:`TranscriptSnippet`.
+
+    Iterating yields ``TranscriptSnippet`` objects. ``between(start, end)``
+    selects the snippets with ``start <= s.start < end`` in transcript order
+    by bisecting the start times, and ``text`` joins a transcript's texts
+    with spaces without copying them one by one.
+    """
+
+    __slots__ = ("starts", "durations", "_buffer", "_offsets", "_order", "_sorted_starts")
+
+    def __init__(
+        self,
+        texts: Iterable[str] = (),
+        starts: Iterable[float] = (),
+        durations: Iterable[float] = (),
+    ) -> None:
+        texts = list(texts)
+        self.starts = array("d", starts)
+        self.durations = array("d", durations)
+        if not len(texts) == len(self.starts) == len(self.durations):
+            raise ValueError("texts, starts and durations must have the same length")
+        self._buffer = " ".join(texts)
+        # Snippet i is _buffer[_offsets[i]:_offsets[i + 1] - 1]
+        offsets = array("q", [0])
+        position = 0
+        for text in texts:
+            position += len(text) + 1
+            offsets.append(position)
+        self._offsets = offsets
+        self._index()
+
+    @classmethod
+    def from_snippets(cls, snippets: Iterable) -> Transcript:
+        """Build from objects with ``text``, ``start`` and ``duration`` attributes."""
+        if isinstance(snippets, Transcript):
+            return snippets
+        snippets = list(snippets)
+        return cls(
+            (s.text for s in snippets),
+            (s.start for s in snippets),
+            (s.duration for s in snippets),
+        )
+
+    def _index(self) -> None:
+        """Prepare time lookups; only unsorted transcripts need a sort order."""
+        starts = self.starts
+        if all(a <= b for a, b in zip(starts, islice(starts, 1, None))):
+            self._order = self._sorted_starts = None
+        else:
+            self._order = array("q", sorted(range(len(starts)), key=starts.__getitem__))
+            self._sorted_starts = array("d", (starts[i] for i in self._order))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[TranscriptSnippet]:
+        for text, start, duration in zip(self.texts(), self.starts, self.durations):
+            yield TranscriptSnippet.model_construct(text=text, start=start, duration=duration)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._take(range(len(self))[key])
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("transcript index out of range")
+        return TranscriptSnippet.model_construct(
+            text=self._text_at(key), start=self.starts[key], duration=self.durations[key]
+        )
+
+    def __repr__(self) -> str:
+        return f"Transcript({len(self)} snippets)"
+
+    def _text_at(self, i: int) -> str:
+        return self._buffer[self._offsets[i] : self._offsets[i + 1] - 1]
+
+    def texts(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self._text_at(i)
+
+    @property
+    def text(self) -> str:
+        """All snippet texts joined by single spaces."""
+        return self._buffer
+
+    def _take(self, indices: range | list[int]) -> Transcript:
+        if isinstance(indices, range) and indices.step == 1:
+            lo, hi = indices.start, max(indices.start, indices.stop)
+            part = Transcript.__new__(Transcript)
+            part.starts = self.starts[lo:hi]
+            part.durations = self.durations[lo:hi]
+            base = self._offsets[lo]
+            part._buffer = self._buffer[base : self._offsets[hi] - 1] if hi > lo else ""
+            part._offsets = array("q", (o - base for o in self._offsets[lo : hi + 1]))
+            if self._order is None:
+                part._order = part._sorted_starts = None
+            else:
+                part._index()
+            return part
+        return Transcript(
+            (self._text_at(i) for i in indices),
+            (self.starts[i] for i in indices),
+            (self.durations[i] for i in indices),
+        )
+
+    def between(self, start: float, end: float) -> Transcript:
+        """The snippets starting in ``[start, end)``, in transcript order."""
+        if self._order is None:
+            lo = bisect_left(self.starts, start)
+            hi = bisect_left(self.starts, end)
+            return self._take(range(lo, max(lo, hi)))
+        # Unsorted input: look up in sorted order, return in original order
+        lo = bisect_left(self._sorted_starts, start)
+        hi = bisect_left(self._sorted_starts, end)
+        return self._take(sorted(self._order[lo:hi]))
+
+    def text_between(self, start: float, end: float) -> str:
+        """The joined text of the snippets starting in ``[start, end)``."""
+        if self._order is None:
+            lo = bisect_left(self.starts, start)
+            hi = bisect_left(self.starts, end)
+            return self._buffer[self._offsets[lo] : self._offsets[hi] - 1] if hi > lo else ""
+        return self.between(start, end).text
+
+
+class TranscriptWindow(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    start: float  # snippets sent to the model, including overlaps
+    end: float
+    core_start: float  # the span whose section boundaries this window decides
+    core_end: float
+    snippets: Transcript
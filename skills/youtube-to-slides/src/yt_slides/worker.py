@@ -0,0 +1,219 @@
+"""Queue worker: leases items from a :class:`WorkQueue` and runs them."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from rich.console import Console
+
+from yt_slides.ai.response_cache import open_response_cache
+from yt_slides.backends import Backends
+from yt_slides.budget import TokenBudget
+from yt_slides.image.cache import open_image_cache
+from yt_slides.image.postprocess import ImagePostprocessor
+from yt_slides.models import WorkItem
+from yt_slides.pipeline import run_pipeline_async
+from yt_slides.scheduler import Scheduler
+from yt_slides.workqueue import WorkQueue, read_record, write_record
+
+if TYPE_CHECKING:
+    from yt_slides.config import Settings
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class QueueWorker:
+    """Runs up to ``concurrency`` queue items at once with one warm set of clients.
+
+    Like :class:`~yt_slides.server.JobServer`, every item shares one Gemini
+    client, one :class:`Scheduler`, the caches and one image
+    post-processing pool. Every run resumes from the checkpoints in
+    ``output_dir/<video_id>/``, which must be on the volume all workers
+    share, so a slide item picks up the sections its video item detected.
+
+    Each item's token budget starts from what the video's earlier items
+    spent, as recorded in the queue, so ``MAX_INPUT_TOKENS`` and the other
+    limits apply to the whole video rather than to each item.
+
+    Before running an item the worker checks for its completion record; one
+    that is already there means another worker finished the item but died
+    before telling the queue, so the item is only marked done.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        queue: WorkQueue,
+        concurrency: int | None = None,
+        worker_id: str | None = None,
+        backends: Backends | None = None,
+        console: Console | None = None,
+    ) -> None:
+        self.settings = settings
+        self.queue = queue
+        self.concurrency = max(1, concurrency or settings.batch_concurrency)
+        self.worker_id = worker_id or default_worker_id()
+        self.backends = backends or Backends()
+        self.console = console or Console()
+        self.processed = {"done": 0, "failed": 0}
+        # Shared by all slots; created when the worker starts
+        self.client = None
+        self.scheduler: Scheduler | None = None
+        self.response_cache = None
+        self.image_cache = None
+        self.postprocessor: ImagePostprocessor | None = None
+
+    async def run(self, exit_when_idle: bool = False) -> None:
+        """Work until cancelled, or until the queue is drained with ``exit_when_idle``."""
+        self.client = self.backends.create_client(self.settings.gemini_api_key, self.settings.gemini_base_url)
+        self.scheduler = Scheduler(self.settings)
+        self.response_cache = open_response_cache(self.settings)
+        self.image_cache = open_image_cache(self.settings)
+        self.postprocessor = ImagePostprocessor.from_settings(self.settings)
+        self.console.print(
+            f"[green]Worker {self.worker_id} running {self.concurrency} items at once "
+            f"from {self.queue.path}[/green]"
+        )
+        try:
+            await asyncio.gather(*(self._slot(n, exit_when_idle) for n in range(self.concurrency)))
+        finally:
+            self.postprocessor.close()
+
+    async def _slot(self, n: int, exit_when_idle: bool) -> None:
+        owner = f"{self.worker_id}/{n}"
+        while True:
+            item = await asyncio.to_thread(self.queue.lease, owner)
+            if item is None:
+                # Another slot's video item may still add slide items
+                if exit_when_idle and not await asyncio.to_thread(self.queue.has_work):
+                    return
+                await asyncio.sleep(self.settings.queue_poll_seconds)
+                continue
+            heartbeat = asyncio.create_task(self._heartbeat(item))
+            try:
+                await self._process(item)
+            finally:
+                heartbeat.cancel()
+
+    async def _heartbeat(self, item: WorkItem) -> None:
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            if not await asyncio.to_thread(self.queue.renew, item):
+                self.console.print(f"[yellow]Lost the lease on {_label(item)}[/yellow]")
+                return
+
+    async def _process(self, item: WorkItem) -> None:
+        video_dir = Path(self.settings.output_dir) / item.video_id
+        record = read_record(video_dir, item)
+        if record is None:
+            try:
+                record = await self._execute(item)
+            except asyncio.CancelledError:
+                await asyncio.to_thread(self.queue.fail, item, "worker stopped")
+                raise
+            except Exception as e:
+                error = str(e).splitlines()[0] if str(e) else type(e).__name__
+                await asyncio.to_thread(self.queue.fail, item, error)
+                self.processed["failed"] += 1
+                self.console.print(f"[red]Failed {_label(item)} (attempt {item.attempts}): {error}[/red]")
+                return
+            write_record(video_dir, item, **record)
+        await asyncio.to_thread(self.queue.complete, item, record.get("slides", 0))
+        self.processed["done"] += 1
+        self.console.print(f"[green]Finished {_label(item)}[/green]")
+
+    async def _execute(self, item: WorkItem) -> dict:
+        """Run the pipeline for one item; returns its completion record fields."""
+        request = item.request
+        overrides: dict = {}
+        if request.max_sections is not None:
+            overrides["max_sections"] = request.max_sections
+        if request.aspect_ratio:
+            overrides["image_aspect_ratio"] = request.aspect_ratio
+        settings = self.settings.model_copy(update=overrides)
+        if item.kind == "video":
+            slides, regenerate = set(), set()
+        elif item.kind == "slide":
+            slides = {item.slide}
+            regenerate = {item.slide} & set(request.regenerate)
+        else:
+            slides, regenerate = None, set()
+        total = 0
+
+        def on_progress(stage: str, done: int, count: int) -> None:
+            nonlocal total
+            if stage == "slides":
+                total = count
+
+        budget = TokenBudget.from_settings(settings)
+        spent = await asyncio.to_thread(self.queue.usage, item.video_id)
+        budget.input_tokens, budget.output_tokens, budget.images = spent
+        started = time.monotonic()
+        try:
+            results = await run_pipeline_async(
+                url=request.url,
+                settings=settings,
+                style=request.style,
+                dry_run=request.dry_run,
+                console=Console(quiet=True),
+                client=self.client,
+                scheduler=self.scheduler,
+                show_progress=False,
+                resume=True,
+                response_cache=self.response_cache,
+                image_cache=self.image_cache,
+                regenerate=regenerate,
+                refresh=request.refresh and item.kind == "video",
+                backends=self.backends,
+                postprocessor=self.postprocessor,
+                on_progress=on_progress,
+                slides=slides,
+                token_budget=budget,
+            )
+        finally:
+            await asyncio.to_thread(
+                self.queue.add_usage,
+                item.video_id,
+                budget.input_tokens - spent[0],
+                budget.output_tokens - spent[1],
+                budget.images - spent[2],
+            )
+        record: dict = {"seconds": round(time.monotonic() - started, 3)}
+        if item.kind == "video":
+            record["slides"] = total
+        elif item.kind == "slide":
+            if not results:
+                raise RuntimeError("slide was skipped; the token budget ran out")
+            record["image"] = results[0].image_path
+        else:
+            record["slides"] = len(results)
+        return record
+
+
+def _label(item: WorkItem) -> str:
+    if item.kind == "slide":
+        return f"{item.video_id} slide {item.slide}"
+    return f"{item.video_id} {item.kind}"
+
+
+def run_worker(
+    settings: Settings,
+    concurrency: int | None = None,
+    exit_when_idle: bool = False,
+    console: Console | None = None,
+) -> QueueWorker:
+    """Run a :class:`QueueWorker` on the configured queue until interrupted."""
+    with WorkQueue.from_settings(settings) as queue:
+        worker = QueueWorker(settings, queue, concurrency=concurrency, console=console)
+        try:
+            asyncio.run(worker.run(exit_when_idle=exit_when_idle))
+        except KeyboardInterrupt:
+            pass
+    return worker
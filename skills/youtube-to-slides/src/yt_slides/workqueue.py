@@ -0,0 +1,351 @@
+"""Durable work queue shared by yt-slides workers on one or many machines."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from yt_slides.models import JobRequest, WorkItem
+from yt_slides.youtube.url_parser import extract_video_id
+
+if TYPE_CHECKING:
+    from yt_slides.config import Settings
+
+QUEUE_FILE = "queue.sqlite3"
+RECORD_DIR = ".queue"
+KINDS = ("video", "slide", "assemble")
+
+_SCHEMA = (
+    """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    video_id TEXT NOT NULL,
+    slide INTEGER NOT NULL DEFAULT 0,
+    request TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    owner TEXT NOT NULL DEFAULT '',
+    lease_expires REAL,
+    error TEXT NOT NULL DEFAULT '',
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    UNIQUE (kind, video_id, slide)
+)""",
+    "CREATE INDEX IF NOT EXISTS items_by_status ON items (status, lease_expires)",
+    "CREATE INDEX IF NOT EXISTS items_by_video ON items (video_id, kind, status)",
+    """
+CREATE TABLE IF NOT EXISTS usage (
+    video_id TEXT PRIMARY KEY,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    images INTEGER NOT NULL DEFAULT 0
+)""",
+)
+_COLUMNS = "id, kind, video_id, slide, request, status, attempts, owner, lease_expires, error"
+# Finish videos already started before starting new ones
+_PRIORITY = "CASE kind WHEN 'assemble' THEN 0 WHEN 'slide' THEN 1 ELSE 2 END"
+
+
+class WorkQueue:
+    """Video, slide and assembly work items in one SQLite file.
+
+    A ``video`` item fetches a video and detects its sections; completing
+    it adds one ``slide`` item per section, which summarize and render one
+    slide each, so several workers can share a long video. Completing the
+    last slide adds an ``assemble`` item, which writes ``metadata.json``
+    and the decks from the checkpoints.
+
+    Workers :meth:`lease` an item for ``lease_seconds`` and :meth:`renew`
+    the lease while they work. An item whose lease expires, because its
+    worker crashed or lost the volume, is handed out again, up to
+    ``max_attempts`` times in all.
+
+    The tokens and images each video's items spend are added up, so its
+    budget holds across workers.
+
+    Every transaction takes SQLite's write lock up front. The file may
+    therefore live on a shared volume, as long as that volume supports
+    file locks. WAL mode is not used because it does not work across
+    machines.
+    """
+
+    def __init__(self, path: Path, lease_seconds: float = 600, max_attempts: int = 3) -> None:
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.path, timeout=60, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._transaction() as conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> WorkQueue:
+        return cls(
+            settings.queue_path or Path(settings.output_dir) / QUEUE_FILE,
+            lease_seconds=settings.queue_lease_seconds,
+            max_attempts=settings.queue_max_attempts,
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> WorkQueue:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    # -- producers ------------------------------------------------------------
+
+    def enqueue(self, requests: Iterable[JobRequest]) -> list[tuple[str, str]]:
+        """Add a video item per request; returns ``(video_id, outcome)`` pairs.
+
+        The outcome is ``"added"``, ``"queued"`` (already waiting or running),
+        ``"done"`` or ``"retried"`` (a failed video whose failed items were
+        reset and whose budget starts over, as with ``--resume``). Raises ValueError for URLs that are not YouTube videos.
+        """
+        outcomes = []
+        now = time.time()
+        with self._transaction() as conn:
+            for request in requests:
+                video_id = extract_video_id(request.url)
+                statuses = [
+                    row[0]
+                    for row in conn.execute("SELECT status FROM items WHERE video_id = ?", (video_id,))
+                ]
+                if not statuses:
+                    conn.execute(
+                        "INSERT INTO items (kind, video_id, request, created_at, updated_at)"
+                        " VALUES ('video', ?, ?, ?, ?)",
+                        (video_id, request.model_dump_json(), now, now),
+                    )
+                    outcomes.append((video_id, "added"))
+                elif "failed" in statuses:
+                    conn.execute(
+                        "UPDATE items SET status = 'pending', attempts = 0, owner = '',"
+                        " lease_expires = NULL, updated_at = ? WHERE video_id = ? AND status = 'failed'",
+                        (now, video_id),
+                    )
+                    conn.execute("DELETE FROM usage WHERE video_id = ?", (video_id,))
+                    outcomes.append((video_id, "retried"))
+                elif self._video_done(conn, video_id):
+                    outcomes.append((video_id, "done"))
+                else:
+                    outcomes.append((video_id, "queued"))
+        return outcomes
+
+    # -- workers ----------------------------------------------------------------
+
+    def lease(self, owner: str) -> WorkItem | None:
+        """Take the next ready item, or None if there is none right now.
+
+        Items whose lease expired too often are marked failed instead.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            while True:
+                row = conn.execute(
+                    f"SELECT {_COLUMNS} FROM items"
+                    " WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?)"
+                    f" ORDER BY {_PRIORITY}, id LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is None:
+                    return None
+                item = _item(row)
+                if item.attempts >= self.max_attempts:
+                    conn.execute(
+                        "UPDATE items SET status = 'failed', owner = '', lease_expires = NULL,"
+                        " error = ?, updated_at = ? WHERE id = ?",
+                        (item.error or f"lease expired {item.attempts} times", now, item.id),
+                    )
+                    continue
+                item.status = "leased"
+                item.attempts += 1
+                item.owner = owner
+                item.lease_expires = now + self.lease_seconds
+                conn.execute(
+                    "UPDATE items SET status = 'leased', attempts = ?, owner = ?, lease_expires = ?,"
+                    " updated_at = ? WHERE id = ?",
+                    (item.attempts, owner, item.lease_expires, now, item.id),
+                )
+                return item
+
+    def renew(self, item: WorkItem) -> bool:
+        """Extend the lease on ``item``; False if another worker took it over."""
+        now = time.time()
+        with self._transaction() as conn:
+            updated = conn.execute(
+                "UPDATE items SET lease_expires = ?, updated_at = ?"
+                " WHERE id = ? AND status = 'leased' AND owner = ?",
+                (now + self.lease_seconds, now, item.id, item.owner),
+            ).rowcount
+        if updated:
+            item.lease_expires = now + self.lease_seconds
+        return bool(updated)
+
+    def complete(self, item: WorkItem, slides: int = 0) -> None:
+        """Mark ``item`` done and add the work that follows it.
+
+        ``slides`` is the number of sections a video item found. Completing
+        an item twice, e.g. by two workers after a lease expired, is
+        harmless.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE items SET status = 'done', owner = '', lease_expires = NULL, error = '',"
+                " updated_at = ? WHERE id = ?",
+                (now, item.id),
+            )
+            request = item.request.model_dump_json()
+            if item.kind == "video":
+                conn.executemany(
+                    "INSERT OR IGNORE INTO items (kind, video_id, slide, request, created_at, updated_at)"
+                    " VALUES ('slide', ?, ?, ?, ?, ?)",
+                    [(item.video_id, n, request, now, now) for n in range(1, slides + 1)],
+                )
+            if item.kind in ("video", "slide"):
+                remaining = conn.execute(
+                    "SELECT COUNT(*) FROM items WHERE video_id = ? AND kind = 'slide' AND status != 'done'",
+                    (item.video_id,),
+                ).fetchone()[0]
+                if not remaining:
+                    conn.execute(
+                        "INSERT OR IGNORE INTO items (kind, video_id, request, created_at, updated_at)"
+                        " VALUES ('assemble', ?, ?, ?, ?)",
+                        (item.video_id, request, now, now),
+                    )
+
+    def fail(self, item: WorkItem, error: str) -> None:
+        """Release ``item`` for a retry, or mark it failed after the last attempt."""
+        status = "failed" if item.attempts >= self.max_attempts else "pending"
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE items SET status = ?, owner = '', lease_expires = NULL, error = ?,"
+                " updated_at = ? WHERE id = ? AND owner = ?",
+                (status, error, time.time(), item.id, item.owner),
+            )
+
+    def usage(self, video_id: str) -> tuple[int, int, int]:
+        """Input tokens, output tokens and images spent on ``video_id`` so far."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT input_tokens, output_tokens, images FROM usage WHERE video_id = ?", (video_id,)
+            ).fetchone()
+        return tuple(row) if row else (0, 0, 0)
+
+    def add_usage(self, video_id: str, input_tokens: int, output_tokens: int, images: int) -> None:
+        """Add what one item of ``video_id`` spent to the video's totals."""
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO usage (video_id, input_tokens, output_tokens, images) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (video_id) DO UPDATE SET input_tokens = input_tokens + excluded.input_tokens,"
+                " output_tokens = output_tokens + excluded.output_tokens, images = images + excluded.images",
+                (video_id, input_tokens, output_tokens, images),
+            )
+
+    # -- inspection ---------------------------------------------------------------
+
+    def counts(self) -> dict[str, dict[str, int]]:
+        """Number of items by kind and status."""
+        counts: dict[str, dict[str, int]] = {kind: {} for kind in KINDS}
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, status, COUNT(*) FROM items GROUP BY kind, status")
+            for kind, status, n in rows:
+                counts.setdefault(kind, {})[status] = n
+        return counts
+
+    def failed(self) -> list[WorkItem]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM items WHERE status = 'failed' ORDER BY id"
+            ).fetchall()
+        return [_item(row) for row in rows]
+
+    def has_work(self) -> bool:
+        """Whether any item is still pending or leased."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM items WHERE status IN ('pending', 'leased') LIMIT 1"
+            ).fetchone()
+        return row is not None
+
+    @staticmethod
+    def _video_done(conn: sqlite3.Connection, video_id: str) -> bool:
+        row = conn.execute(
+            "SELECT 1 FROM items WHERE video_id = ? AND kind = 'assemble' AND status = 'done'",
+            (video_id,),
+        ).fetchone()
+        return row is not None
+
+
+def _item(row: tuple) -> WorkItem:
+    id_, kind, video_id, slide, request, status, attempts, owner, lease_expires, error = row
+    return WorkItem(
+        id=id_,
+        kind=kind,
+        video_id=video_id,
+        slide=slide,
+        request=JobRequest.model_validate_json(request),
+        status=status,
+        attempts=attempts,
+        owner=owner,
+        lease_expires=lease_expires,
+        error=error,
+    )
+
+
+def record_path(video_dir: Path, item: WorkItem) -> Path:
+    """Where the completion record of ``item`` is kept."""
+    name = f"slide-{item.slide:02d}" if item.kind == "slide" else item.kind
+    return video_dir / RECORD_DIR / f"{name}.json"
+
+
+def read_record(video_dir: Path, item: WorkItem) -> dict | None:
+    """The completion record of ``item``, if a worker already finished it."""
+    try:
+        return json.loads(record_path(video_dir, item).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def write_record(video_dir: Path, item: WorkItem, **fields) -> None:
+    """Record that ``item`` is finished, before the queue is told.
+
+    If the worker dies between the two, the next worker to lease the item
+    finds the record and completes it without redoing the work.
+    """
+    path = record_path(video_dir, item)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp.write_text(
+        json.dumps(
+            {"kind": item.kind, "video_id": item.video_id, "slide": item.slide,
+             "worker": item.owner, "finished_at": time.time(), **fields}
+        )
+    )
+    os.replace(tmp, path)
@@ -0,0 +1,84 @@
+"""Local TTL cache for video metadata and transcripts."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from yt_slides.models import VideoMetadata
+from yt_slides.transcript import Transcript
+
+if TYPE_CHECKING:
+    from yt_slides.config import Settings
+
+
+class FetchCache:
+    """Caches YouTube lookups so reruns against the same video stay offline.
+
+    Entries are gzip-compressed JSON files keyed by video ID (and language for
+    transcripts). Transcripts are stored column-wise (texts, starts, durations)
+    rather than one object per snippet, which keeps long captions compact.
+    Entries older than ``ttl_seconds`` are treated as missing.
+    """
+
+    def __init__(self, directory: Path, ttl_seconds: float) -> None:
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def load_metadata(self, video_id: str) -> VideoMetadata | None:
+        data = self._read(f"{video_id}.metadata.json.gz")
+        return VideoMetadata(**data) if data else None
+
+    def save_metadata(self, metadata: VideoMetadata) -> None:
+        self._write(f"{metadata.video_id}.metadata.json.gz", metadata.model_dump())
+
+    def load_transcript(self, video_id: str, language: str) -> Transcript | None:
+        data = self._read(f"{video_id}.{language}.transcript.json.gz")
+        if not data:
+            return None
+        return Transcript(data["text"], data["start"], data["duration"])
+
+    def save_transcript(self, video_id: str, language: str, transcript: Transcript) -> None:
+        self._write(
+            f"{video_id}.{language}.transcript.json.gz",
+            {
+                "text": list(transcript.texts()),
+                "start": transcript.starts.tolist(),
+                "duration": transcript.durations.tolist(),
+            },
+        )
+
+    def _read(self, name: str) -> dict | None:
+        path = self.directory / name
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("fetched_at", 0) > self.ttl_seconds:
+            return None
+        return entry["value"]
+
+    def _write(self, name: str, value) -> None:
+        path = self.directory / name
+        # Unique per writer: other processes may share the cache directory
+        tmp = path.with_name(f"{name}.{uuid.uuid4().hex}.tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump({"fetched_at": time.time(), "value": value}, f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+
+def open_fetch_cache(settings: Settings) -> FetchCache | None:
+    """Open the metadata/transcript cache configured in settings, if enabled."""
+    if settings.fetch_cache_ttl_hours <= 0:
+        return None
+    return FetchCache(
+        Path(settings.cache_dir).expanduser() / "youtube",
+        ttl_seconds=settings.fetch_cache_ttl_hours * 3600,
+    )
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import re
+from typing import Iterable
 
-from yt_slides.models import Chapter, Section, TranscriptSnippet
+from yt_slides.models import Chapter, Section
+from yt_slides.transcript import Transcript
 
 
 def _timestamp_to_seconds(ts: str) -> float:
@@ -48,16 +50,13 @@ def parse_chapters_from_description(
 
 def assign_transcript_to_sections(
     chapters: list[Chapter],
-    transcript: list[TranscriptSnippet],
+    transcript: Transcript | Iterable,
 ) -> list[Section]:
     """Map transcript snippets into chapter-defined sections."""
+    transcript = Transcript.from_snippets(transcript)
     sections: list[Section] = []
     for i, chapter in enumerate(chapters):
-        section_text = " ".join(
-            s.text
-            for s in transcript
-            if chapter.start_seconds <= s.start < chapter.end_seconds
-        )
+        section_text = transcript.text_between(chapter.start_seconds, chapter.end_seconds)
         sections.append(
             Section(
                 index=i + 1,
@@ -71,19 +70,18 @@ def assign_transcript_to_sections(
 
 
 def split_by_time(
-    transcript: list[TranscriptSnippet],
+    transcript: Transcript | Iterable,
     video_duration_seconds: int,
     interval_seconds: int = 180,
 ) -> list[Section]:
     """Fallback: split transcript into even time-based sections."""
+    transcript = Transcript.from_snippets(transcript)
     sections: list[Section] = []
     start = 0.0
     index = 1
     while start < video_duration_seconds:
         end = min(start + interval_seconds, float(video_duration_seconds))
-        section_text = " ".join(
-            s.text for s in transcript if start <= s.start < end
-        )
+        section_text = transcript.text_between(start, end)
         if section_text.strip():
             sections.append(
                 Section(
@@ -0,0 +1,100 @@
+"""Shrink auto-generated captions before they are sent to Gemini."""
+
+from __future__ import annotations
+
+import re
+
+from yt_slides.transcript import Transcript
+
+# [Music], [Applause], ♪ lyrics ♪, (laughs), ">>" speaker-change markers
+_NON_SPEECH = re.compile(
+    r"\[[^\]]*\]|♪[^♪]*♪|♪"
+    r"|\((?:[^)]*\b(?:music|applause|laugh\w*|cheer\w*|inaudible|silence|crosstalk|sighs?)\b[^)]*)\)"
+    r"|>>",
+    re.IGNORECASE,
+)
+_FILLERS = re.compile(r"\b(?:u+m+|u+h+|uhm|erm|hmm+|mm+|mhm|ah+)\b,?", re.IGNORECASE)
+_STUTTER = re.compile(r"\b(\w+)(?:\s+\1\b)+", re.IGNORECASE)
+_SPACES = re.compile(r"\s+")
+_SENTENCE_END = re.compile(r"[.?!…][\"')\]]*$")
+_WORD_KEY = re.compile(r"[^\w']+")
+
+
+def _clean(text: str, strip_fillers: bool) -> str:
+    text = _NON_SPEECH.sub(" ", text)
+    if strip_fillers:
+        text = _FILLERS.sub(" ", text)
+    text = _STUTTER.sub(r"\1", text)
+    return _SPACES.sub(" ", text).strip(" ,")
+
+
+def _key(word: str) -> str:
+    return _WORD_KEY.sub("", word.lower())
+
+
+def _overlap(tail: list[str], words: list[str]) -> int:
+    """Length of the longest suffix of ``tail`` that ``words`` starts with."""
+    tail_keys = [_key(w) for w in tail]
+    word_keys = [_key(w) for w in words]
+    for k in range(min(len(tail_keys), len(word_keys)), 0, -1):
+        if tail_keys[-k:] == word_keys[:k]:
+            return k
+    return 0
+
+
+def compact_transcript(
+    transcript: Transcript,
+    strip_fillers: bool = True,
+    merge_seconds: float = 12.0,
+    max_gap_seconds: float = 2.0,
+    max_overlap_words: int = 12,
+) -> Transcript:
+    """Return a smaller transcript with the same spoken content.
+
+    Non-speech markers such as ``[Music]`` are removed, along with
+    hesitation fillers (um, uh, ...) when ``strip_fillers`` is set, and
+    stuttered words. Text that repeats the end of the previous caption, as
+    rolling auto-captions do, is dropped. Fragments are then merged into
+    sentence-sized snippets. A merged snippet starts where its first
+    fragment started and spans at most ``merge_seconds``, and fragments
+    are never merged across a pause longer than ``max_gap_seconds``. Timestamps
+    therefore stay accurate to within ``merge_seconds``.
+    """
+    texts: list[str] = []
+    starts: list[float] = []
+    durations: list[float] = []
+    words: list[str] = []  # words of the snippet being merged
+    tail: list[str] = []  # last words emitted, for overlap detection
+    group_start = group_end = 0.0
+
+    def flush() -> None:
+        if words:
+            texts.append(" ".join(words))
+            starts.append(group_start)
+            durations.append(group_end - group_start)
+            words.clear()
+
+    for start, duration, text in zip(transcript.starts, transcript.durations, transcript.texts()):
+        new = _clean(text, strip_fillers).split()
+        skip = _overlap(tail, new)
+        # A single shared word is usually a coincidence, not a rolling repeat
+        if skip == 1 and len(new) > 1:
+            skip = 0
+        new = new[skip:]
+        if not new:
+            continue
+        mergeable = (
+            words
+            and start - group_end <= max_gap_seconds
+            and start - group_start < merge_seconds
+            and not _SENTENCE_END.search(words[-1])
+        )
+        if not mergeable:
+            flush()
+            group_start = start
+            group_end = start
+        words.extend(new)
+        group_end = max(group_end, start + duration)
+        tail = (tail + new)[-max_overlap_words:]
+    flush()
+    return Transcript(texts, starts, durations)
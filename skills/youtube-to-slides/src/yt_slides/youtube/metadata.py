@@ -1,12 +1,12 @@
 """Fetch video metadata via yt-dlp (no API key required)."""
 
-import yt_dlp
-
 from yt_slides.models import VideoMetadata
 
 
 def fetch_metadata(video_id: str) -> VideoMetadata:
     """Fetch video metadata using yt-dlp."""
+    import yt_dlp
+
     url = f"https://www.youtube.com/watch?v={video_id}"
     opts = {
         "quiet": True,
@@ -0,0 +1,29 @@
+"""List the videos of a playlist or channel via yt-dlp (no API key required)."""
+
+from yt_slides.youtube.url_parser import is_video_id
+
+
+def expand_collection(url: str) -> list[str]:
+    """Video IDs of a playlist or channel tab, in the order YouTube lists them.
+
+    Uses yt-dlp's flat extraction, which reads only the listing pages
+    instead of every video's page, so even large channels expand in a few
+    requests.
+    """
+    import yt_dlp
+
+    opts = {
+        "quiet": True,
+        "no_warnings": True,
+        "skip_download": True,
+        "extract_flat": "in_playlist",
+    }
+    with yt_dlp.YoutubeDL(opts) as ydl:
+        info = ydl.extract_info(url, download=False)
+
+    if not info:
+        raise ValueError(f"Playlist or channel not found: {url}")
+
+    # Deleted and private videos come back as None or without a usable ID
+    entries = (entry or {} for entry in info.get("entries") or [])
+    return list(dict.fromkeys(e["id"] for e in entries if is_video_id(e.get("id") or "")))
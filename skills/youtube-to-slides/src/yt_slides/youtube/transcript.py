@@ -1,24 +1,17 @@
 """Fetch video transcript via youtube-transcript-api."""
 
-from youtube_transcript_api import YouTubeTranscriptApi
+from yt_slides.transcript import Transcript
 
-from yt_slides.models import TranscriptSnippet
 
-
-def fetch_transcript(video_id: str, language: str = "en") -> list[TranscriptSnippet]:
+def fetch_transcript(video_id: str, language: str = "en") -> Transcript:
     """Fetch timestamped transcript for a YouTube video.
 
     Tries manual captions first, then auto-generated, then translation.
     Raises an exception if no transcript is available.
     """
+    from youtube_transcript_api import YouTubeTranscriptApi
+
     ytt_api = YouTubeTranscriptApi()
     transcript = ytt_api.fetch(video_id, languages=[language, "en"])
 
-    return [
-        TranscriptSnippet(
-            text=entry.text,
-            start=entry.start,
-            duration=entry.duration,
-        )
-        for entry in transcript.snippets
-    ]
+    return Transcript.from_snippets(transcript.snippets)
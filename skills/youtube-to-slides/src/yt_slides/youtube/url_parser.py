@@ -1,10 +1,19 @@
-"""Extract YouTube video ID from various URL formats."""
+"""Extract YouTube video IDs and playlist/channel URLs from various URL formats."""
 
 import re
+from typing import Optional
 from urllib.parse import parse_qs, urlparse
 
 
 _VIDEO_ID_RE = re.compile(r"^[a-zA-Z0-9_-]{11}$")
+_PLAYLIST_ID_RE = re.compile(r"^[a-zA-Z0-9_-]{12,}$")
+_YOUTUBE_HOSTS = ("www.youtube.com", "youtube.com", "m.youtube.com")
+_CHANNEL_TABS = ("videos", "streams", "shorts")
+
+
+def is_video_id(value: str) -> bool:
+    """Whether ``value`` has the shape of an 11-character YouTube video ID."""
+    return bool(_VIDEO_ID_RE.match(value))
 
 
 def extract_video_id(url: str) -> str:
@@ -32,7 +41,7 @@ def extract_video_id(url: str) -> str:
             return video_id
 
     # youtube.com/watch?v=VIDEO_ID
-    if parsed.hostname in ("www.youtube.com", "youtube.com", "m.youtube.com"):
+    if parsed.hostname in _YOUTUBE_HOSTS:
         if parsed.path == "/watch":
             qs = parse_qs(parsed.query)
             video_id = qs.get("v", [None])[0]
@@ -46,7 +55,45 @@ def extract_video_id(url: str) -> str:
                 if _VIDEO_ID_RE.match(video_id):
                     return video_id
 
+    if collection_url(url):
+        raise ValueError(
+            f"{url} is a playlist or channel, not a video\n"
+            "Pass it to `yt-slides batch` or `yt-slides enqueue` to convert all of its videos"
+        )
     raise ValueError(
         f"Could not extract video ID from: {url}\n"
         "Supported formats: youtube.com/watch?v=ID, youtu.be/ID, or bare 11-char ID"
     )
+
+
+def collection_url(url: str) -> Optional[str]:
+    """Normalize a playlist or channel URL for yt-dlp; None for any other URL.
+
+    Supports:
+      - https://www.youtube.com/playlist?list=PLAYLIST_ID
+      - https://www.youtube.com/@HANDLE, /channel/CHANNEL_ID, /c/NAME or
+        /user/NAME, optionally followed by /videos, /streams or /shorts
+        (default /videos)
+    """
+    parsed = urlparse(url.strip())
+    if parsed.hostname not in _YOUTUBE_HOSTS:
+        return None
+    parts = [p for p in parsed.path.split("/") if p]
+
+    # youtube.com/playlist?list=PLAYLIST_ID
+    if parts == ["playlist"]:
+        playlist_id = parse_qs(parsed.query).get("list", [None])[0]
+        if playlist_id and _PLAYLIST_ID_RE.match(playlist_id):
+            return f"https://www.youtube.com/playlist?list={playlist_id}"
+        return None
+
+    # youtube.com/@HANDLE[/TAB] or youtube.com/channel|c|user/NAME[/TAB]
+    if parts and len(parts[0]) > 1 and parts[0].startswith("@"):
+        channel, tabs = parts[:1], parts[1:]
+    elif len(parts) >= 2 and parts[0] in ("channel", "c", "user"):
+        channel, tabs = parts[:2], parts[2:]
+    else:
+        return None
+    if len(tabs) > 1 or (tabs and tabs[0] not in _CHANNEL_TABS):
+        return None
+    return "https://www.youtube.com/" + "/".join([*channel, tabs[0] if tabs else "videos"])
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+
+from rich.console import Console
+
+from yt_slides.backends import Backends
+from yt_slides.batch import expand_urls, has_finished_output
+from yt_slides.bench.runner import bench_settings
+
+CHANNEL = "https://www.youtube.com/@channel"
+PLAYLIST = "https://www.youtube.com/playlist?list=PLrAXtmErZgOeiKm4sgNOknGvNjby9efdf"
+
+
+def _finish(video_dir, slides=("01_intro.png",), **extra) -> None:
+    video_dir.mkdir(parents=True)
+    for name in slides:
+        (video_dir / name).write_bytes(b"png")
+    sections = [{"title": name, "image_file": name} for name in slides]
+    (video_dir / "metadata.json").write_text(json.dumps({"sections": sections, **extra}))
+
+
+def _expand(settings, urls, listings):
+    calls = []
+
+    def expand_collection(url):
+        calls.append(url)
+        if isinstance(listings[url], Exception):
+            raise listings[url]
+        return listings[url]
+
+    backends = Backends(expand_collection=expand_collection)
+    return (*expand_urls(urls, settings, backends, Console(quiet=True)), calls)
+
+
+def test_collections_expand_in_place(tmp_path):
+    settings = bench_settings(tmp_path)
+    urls = ["aaaaaaaaaaa", CHANNEL, "bbbbbbbbbbb", CHANNEL + "/videos"]
+
+    expanded, invalid, calls = _expand(settings, urls, {CHANNEL + "/videos": ["ccccccccccc", "ddddddddddd"]})
+
+    assert expanded == [
+        "aaaaaaaaaaa",
+        "https://www.youtube.com/watch?v=ccccccccccc",
+        "https://www.youtube.com/watch?v=ddddddddddd",
+        "bbbbbbbbbbb",
+    ]
+    assert invalid == []
+    assert calls == [CHANNEL + "/videos"]
+
+
+def test_finished_videos_of_a_collection_are_skipped(tmp_path):
+    settings = bench_settings(tmp_path)
+    _finish(settings.output_dir / "ccccccccccc")
+
+    expanded, _, _ = _expand(settings, [PLAYLIST, "ccccccccccc"], {PLAYLIST: ["ccccccccccc", "ddddddddddd"]})
+
+    assert expanded == ["https://www.youtube.com/watch?v=ddddddddddd", "ccccccccccc"]
+
+
+def test_failed_expansions_are_reported(tmp_path):
+    settings = bench_settings(tmp_path)
+
+    expanded, invalid, _ = _expand(settings, [PLAYLIST, "aaaaaaaaaaa"], {PLAYLIST: ValueError("gone\ndetails")})
+
+    assert expanded == ["aaaaaaaaaaa"]
+    assert [(r.url, r.error) for r in invalid] == [(PLAYLIST, "gone")]
+
+
+def test_finished_output_needs_every_slide(tmp_path):
+    _finish(tmp_path / "done", slides=("01_a.png", "02_b.png"))
+    _finish(tmp_path / "partial", incomplete=True)
+    _finish(tmp_path / "missing", slides=("01_a.png",))
+    (tmp_path / "missing" / "01_a.png").unlink()
+    _finish(tmp_path / "empty", slides=())
+
+    assert has_finished_output(tmp_path / "done")
+    assert not has_finished_output(tmp_path / "partial")
+    assert not has_finished_output(tmp_path / "missing")
+    assert not has_finished_output(tmp_path / "empty")
+    assert not has_finished_output(tmp_path / "absent")
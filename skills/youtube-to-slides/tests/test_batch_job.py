@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from google.genai import types
+from rich.console import Console
+
+from yt_slides.checkpoint import CheckpointStore
+from yt_slides.image.batch_job import BatchJobError, run_image_batch_async
+from yt_slides.models import PendingImage
+
+
+def _image_response(data: bytes) -> SimpleNamespace:
+    part = SimpleNamespace(inline_data=SimpleNamespace(data=data))
+    return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+
+
+class _Batches:
+    """Stand-in for ``client.aio.batches`` that finishes after one poll."""
+
+    def __init__(self, responses: list | None) -> None:
+        self.responses = responses
+        self.created = []
+        self.polls = 0
+
+    async def create(self, model, src, config=None):
+        self.created.append(src)
+        return SimpleNamespace(name="batches/1", state=types.JobState.JOB_STATE_RUNNING)
+
+    async def get(self, name):
+        self.polls += 1
+        dest = SimpleNamespace(inlined_responses=self.responses)
+        return SimpleNamespace(name=name, state=types.JobState.JOB_STATE_SUCCEEDED, dest=dest)
+
+
+def _pending(tmp_path, slide: int) -> PendingImage:
+    return PendingImage(
+        video_id="dQw4w9WgXcQ",
+        slide=slide,
+        prompt=f"prompt {slide}",
+        output_path=str(tmp_path / f"{slide:02d}_slide.png"),
+        checkpoint_key=f"key{slide}",
+    )
+
+
+def _run(batches: _Batches, images: list[PendingImage]) -> list[PendingImage]:
+    client = SimpleNamespace(aio=SimpleNamespace(batches=batches))
+    return asyncio.run(
+        run_image_batch_async(client, images, "model", "16:9", poll_seconds=0, console=Console(quiet=True))
+    )
+
+
+def test_results_are_written_and_checkpointed(tmp_path):
+    images = [_pending(tmp_path, 1), _pending(tmp_path, 2)]
+    batches = _Batches([
+        SimpleNamespace(error=None, response=_image_response(b"one")),
+        SimpleNamespace(error=None, response=_image_response(b"two")),
+    ])
+
+    assert _run(batches, images) == []
+
+    assert len(batches.created) == 1 and len(batches.created[0]) == 2
+    assert (tmp_path / "02_slide.png").read_bytes() == b"two"
+    store = CheckpointStore(tmp_path, resume=True)
+    assert store.has_image(1, "key1", tmp_path / "01_slide.png")
+
+
+def test_failed_and_missing_results_are_returned(tmp_path):
+    images = [_pending(tmp_path, 1), _pending(tmp_path, 2), _pending(tmp_path, 3)]
+    batches = _Batches([
+        SimpleNamespace(error=None, response=_image_response(b"one")),
+        SimpleNamespace(error="quota", response=None),
+    ])
+
+    failed = _run(batches, images)
+
+    assert [image.slide for image in failed] == [2, 3]
+    assert not (tmp_path / "02_slide.png").exists()
+
+
+def test_a_job_without_results_raises(tmp_path):
+    with pytest.raises(BatchJobError):
+        _run(_Batches(None), [_pending(tmp_path, 1)])
+
+
+def test_nothing_is_submitted_without_images():
+    batches = _Batches([])
+
+    assert _run(batches, []) == []
+    assert batches.created == []
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from yt_slides.bench.runner import bench_settings
+from yt_slides.budget import BudgetExceededError, TokenBudget, charge, clamp_sections
+from yt_slides.models import VideoMetadata
+from yt_slides.transcript import Transcript
+
+
+def _metadata(duration_seconds: int = 1800) -> VideoMetadata:
+    return VideoMetadata(
+        video_id="dQw4w9WgXcQ",
+        title="Title",
+        description="",
+        channel_title="Channel",
+        duration_seconds=duration_seconds,
+    )
+
+
+def _transcript(words: int = 4000) -> Transcript:
+    count = words // 10
+    return Transcript(["word " * 10] * count, [i * 3.0 for i in range(count)], [3.0] * count)
+
+
+def _response(prompt: int, output: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        usage_metadata=SimpleNamespace(
+            prompt_token_count=prompt, candidates_token_count=output, thoughts_token_count=None
+        )
+    )
+
+
+def _plan(budget: TokenBudget, tmp_path, **options) -> int:
+    return budget.plan_sections(_metadata(), _transcript(), bench_settings(tmp_path), segmented_locally=False, **options)
+
+
+def test_an_unlimited_budget_plans_no_cap(tmp_path):
+    assert _plan(TokenBudget(), tmp_path) == 0
+
+
+def test_the_image_limit_caps_slides_only_when_rendering(tmp_path):
+    budget = TokenBudget(max_images=3)
+
+    assert _plan(budget, tmp_path) == 3
+    assert _plan(budget, tmp_path, with_images=False) == 0
+
+
+def test_larger_token_budgets_allow_more_slides(tmp_path):
+    small = _plan(TokenBudget(max_input_tokens=20_000), tmp_path)
+    large = _plan(TokenBudget(max_input_tokens=40_000), tmp_path)
+
+    assert 1 <= small < large
+
+
+def test_a_budget_above_one_slide_per_snippet_plans_no_cap(tmp_path):
+    assert _plan(TokenBudget(max_input_tokens=10**9), tmp_path) == 0
+    assert _plan(TokenBudget(max_images=400), tmp_path) == 0
+    assert _plan(TokenBudget(max_images=399), tmp_path) == 399
+
+
+@pytest.mark.parametrize(
+    ("max_sections", "planned", "expected"),
+    [
+        (0, 0, 0),  # neither limits the run
+        (0, 5, 5),  # the budget caps an unlimited run
+        (8, 5, 5),  # the budget is tighter
+        (4, 5, 4),  # the setting is tighter
+        (5, 5, 5),
+        (8, 0, 8),  # the budget sets no limit
+    ],
+)
+def test_clamp_sections_only_lowers_the_cap(max_sections, planned, expected):
+    assert clamp_sections(max_sections, planned) == expected
+
+
+def test_a_budget_too_small_for_one_slide_raises(tmp_path):
+    with pytest.raises(BudgetExceededError, match="single slide"):
+        _plan(TokenBudget(max_output_tokens=100), tmp_path)
+
+
+def test_images_are_reserved_up_to_the_limit():
+    budget = TokenBudget(max_images=2)
+    budget.reserve_image()
+    budget.reserve_image()
+
+    with pytest.raises(BudgetExceededError, match="Image budget"):
+        budget.reserve_image()
+    assert budget.images == 2
+
+
+def test_usage_is_charged_to_the_active_budget_only():
+    budget = TokenBudget(max_input_tokens=100)
+    charge(_response(500, 5))
+
+    with budget:
+        charge(_response(60, 5))
+        budget.check()
+        charge(_response(60, 5))
+
+    assert (budget.input_tokens, budget.output_tokens) == (120, 10)
+    with pytest.raises(BudgetExceededError, match="input tokens"):
+        budget.check()
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from yt_slides.ai.gemini_client import generate_text_async
+from yt_slides.ai.response_cache import ResponseCache
+from yt_slides.image.cache import ImageCache
+from yt_slides.models import VideoMetadata
+from yt_slides.transcript import Transcript
+from yt_slides.youtube.cache import FetchCache
+
+
+class _Models:
+    """Stand-in for ``client.aio.models`` that replays canned reply texts."""
+
+    def __init__(self, replies: list) -> None:
+        self.replies = list(replies)
+        self.calls = 0
+
+    async def generate_content(self, model, contents, config=None):
+        self.calls += 1
+        return SimpleNamespace(text=self.replies.pop(0), usage_metadata=None, candidates=[])
+
+
+def _client(*replies) -> SimpleNamespace:
+    return SimpleNamespace(aio=SimpleNamespace(models=_Models(replies)))
+
+
+def _generate(client, cache, validate=json.loads) -> str:
+    return asyncio.run(generate_text_async(client, "model", "prompt", None, cache, validate=validate))
+
+
+def _metadata() -> VideoMetadata:
+    return VideoMetadata(
+        video_id="dQw4w9WgXcQ", title="Title", description="", channel_title="Channel", duration_seconds=120
+    )
+
+
+@pytest.fixture
+def responses(tmp_path):
+    return ResponseCache(tmp_path / "responses", max_bytes=1 << 20)
+
+
+def test_response_cache_round_trip(responses):
+    key = ResponseCache.key("model", ["prompt"], None)
+
+    assert responses.get(key) is None
+    responses.put(key, "reply")
+
+    assert responses.get(key) == "reply"
+    assert (responses.hits, responses.misses) == (1, 1)
+    assert ResponseCache.key("other", ["prompt"], None) != key
+
+
+def test_response_cache_delete(responses):
+    responses.put("ab12", "reply")
+
+    responses.delete("ab12")
+    responses.delete("ab12")
+
+    assert responses.get("ab12") is None
+    assert responses._total_bytes == 0
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path, max_bytes=35)
+    for n, key in enumerate(("aa1", "bb2", "cc3")):
+        cache.put(key, "x" * 10)
+        os.utime(cache._path(key), (n, n))
+    cache.get("aa1")  # now the most recently used
+
+    cache.put("dd4", "x" * 10)
+
+    assert [key for key in ("aa1", "bb2", "cc3", "dd4") if cache.get(key)] == ["aa1", "cc3", "dd4"]
+    assert cache._total_bytes == 30
+
+
+def test_response_cache_eviction_skips_entries_deleted_by_other_processes(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path, max_bytes=35)
+    for n, key in enumerate(("aa1", "bb2", "cc3")):
+        cache.put(key, "x" * 10)
+        os.utime(cache._path(key), (n, n))
+    listed = cache._entries() + [cache._path("ee5")]  # removed after the listing
+    monkeypatch.setattr(cache, "_entries", lambda: listed)
+    unlink = Path.unlink
+
+    def raced_unlink(path, missing_ok=False):
+        if path.name.startswith("aa1"):
+            os.remove(path)  # another process evicted it first
+        unlink(path, missing_ok)
+
+    monkeypatch.setattr(Path, "unlink", raced_unlink)
+
+    cache.put("dd4", "x" * 10)
+
+    assert [key for key in ("aa1", "bb2", "cc3", "dd4") if cache.get(key)] == ["cc3", "dd4"]
+
+
+def test_response_cache_counts_existing_entries(responses):
+    responses.put("ab12", "reply")
+
+    reopened = ResponseCache(responses.directory, max_bytes=1 << 20)
+
+    assert reopened._total_bytes == len("reply")
+
+
+def test_valid_replies_are_cached(responses):
+    client = _client('{"ok": 1}')
+
+    assert _generate(client, responses) == '{"ok": 1}'
+    assert _generate(client, responses) == '{"ok": 1}'
+    assert client.aio.models.calls == 1
+
+
+@pytest.mark.parametrize("bad", ['{"truncated": ', None])
+def test_rejected_replies_are_not_cached(responses, bad):
+    client = _client(bad, '{"ok": 1}')
+
+    assert _generate(client, responses) == bad
+    assert _generate(client, responses) == '{"ok": 1}'
+    assert client.aio.models.calls == 2
+
+
+def test_rejected_cache_entry_is_replaced(responses):
+    key = ResponseCache.key("model", ["prompt"], None)
+    responses.put(key, "garbage")
+    client = _client('{"ok": 1}')
+
+    assert _generate(client, responses) == '{"ok": 1}'
+    assert responses.get(key) == '{"ok": 1}'
+
+
+def test_image_cache_links_into_the_output(tmp_path):
+    cache = ImageCache(tmp_path / "images")
+    key = ImageCache.key("prompt", "model", "16:9")
+    rendered = tmp_path / "render.png"
+    rendered.write_bytes(b"png")
+    output = tmp_path / "out" / "01_slide.png"
+    output.parent.mkdir()
+
+    assert not cache.fetch(key, output)
+    cache.store(key, rendered)
+    assert cache.fetch(key, output)
+
+    assert output.read_bytes() == b"png"
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert not list(tmp_path.rglob("*.tmp"))
+    assert ImageCache.key("prompt", "model", "9:16") != key
+
+
+def test_image_cache_replaces_an_existing_output(tmp_path):
+    cache = ImageCache(tmp_path / "images")
+    rendered = tmp_path / "render.png"
+    rendered.write_bytes(b"new")
+    output = tmp_path / "01_slide.png"
+    output.write_bytes(b"old")
+
+    cache.store("ab12", rendered)
+    cache.fetch("ab12", output)
+
+    assert output.read_bytes() == b"new"
+
+
+def test_fetch_cache_round_trip(tmp_path):
+    cache = FetchCache(tmp_path, ttl_seconds=60)
+    metadata = _metadata()
+    transcript = Transcript(["hello", "world"], [0.0, 1.5], [1.5, 2.0])
+
+    cache.save_metadata(metadata)
+    cache.save_transcript("dQw4w9WgXcQ", "en", transcript)
+
+    assert cache.load_metadata("dQw4w9WgXcQ") == metadata
+    loaded = cache.load_transcript("dQw4w9WgXcQ", "en")
+    assert list(loaded) == list(transcript)
+    assert cache.load_transcript("dQw4w9WgXcQ", "de") is None
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_fetch_cache_expires_entries(tmp_path, monkeypatch):
+    cache = FetchCache(tmp_path, ttl_seconds=60)
+    cache.save_metadata(_metadata())
+    now = time.time()
+
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+
+    assert cache.load_metadata("dQw4w9WgXcQ") is None
+
+
+def test_fetch_cache_ignores_corrupt_entries(tmp_path):
+    cache = FetchCache(tmp_path, ttl_seconds=60)
+    (tmp_path / "dQw4w9WgXcQ.metadata.json.gz").write_bytes(b"not gzip")
+
+    assert cache.load_metadata("dQw4w9WgXcQ") is None
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from yt_slides.checkpoint import CheckpointStore, fingerprint
+from yt_slides.models import Section, SectionSummary, VideoMetadata
+from yt_slides.transcript import Transcript
+
+
+def _metadata() -> VideoMetadata:
+    return VideoMetadata(
+        video_id="dQw4w9WgXcQ", title="Title", description="", channel_title="Channel", duration_seconds=120
+    )
+
+
+def _section() -> Section:
+    return Section(index=1, title="Intro", start_seconds=0, end_seconds=60, transcript_text="hello")
+
+
+def test_fingerprint_depends_on_every_input():
+    assert fingerprint("a", 1) == fingerprint("a", 1)
+    assert fingerprint("a", 1) != fingerprint("a", 2)
+    assert fingerprint({"x": 1, "y": 2}) == fingerprint({"y": 2, "x": 1})
+    assert len(fingerprint("a")) == 16
+
+
+def test_checkpoints_are_only_read_when_resuming(tmp_path):
+    CheckpointStore(tmp_path).save_metadata(_metadata())
+
+    assert CheckpointStore(tmp_path).load_metadata() is None
+    assert CheckpointStore(tmp_path, resume=True).load_metadata() == _metadata()
+
+
+def test_transcript_round_trip(tmp_path):
+    transcript = Transcript(["hello", "world"], [0.0, 1.5], [1.5, 2.0])
+    CheckpointStore(tmp_path).save_transcript("en", transcript)
+
+    assert list(CheckpointStore(tmp_path, resume=True).load_transcript("en")) == list(transcript)
+
+
+def test_transcript_in_another_language_is_not_reused(tmp_path):
+    CheckpointStore(tmp_path).save_transcript("en", Transcript(["hello"], [0.0], [1.0]))
+
+    assert CheckpointStore(tmp_path, resume=True).load_transcript("de") is None
+
+
+def test_stale_fingerprints_are_ignored(tmp_path):
+    store = CheckpointStore(tmp_path, resume=True)
+    summary = SectionSummary(
+        section=_section(), headline="Intro", key_points=["a"], summary="s", visual_suggestions="chart"
+    )
+    store.save_sections("old", [_section()])
+    store.save_summary(1, "old", summary)
+
+    assert store.load_sections("old") == [_section()]
+    assert store.load_sections("new") is None
+    assert store.load_summary(1, "old") == summary
+    assert store.load_summary(1, "new") is None
+    assert store.load_summary(2, "old") is None
+
+
+def test_image_needs_a_matching_non_empty_file(tmp_path):
+    store = CheckpointStore(tmp_path, resume=True)
+    image = tmp_path / "01_intro.png"
+    store.save_image(1, "key", image)
+
+    assert not store.has_image(1, "key", image)
+    image.write_bytes(b"")
+    assert not store.has_image(1, "key", image)
+    image.write_bytes(b"png")
+    assert store.has_image(1, "key", image)
+    assert not store.has_image(1, "other", image)
+    assert not store.has_image(1, "key", tmp_path / "01_renamed.png")
+
+
+def test_corrupt_checkpoints_are_ignored(tmp_path):
+    store = CheckpointStore(tmp_path, resume=True)
+    (store.root / "metadata.json").write_text("{not json")
+
+    assert store.load_metadata() is None
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+from yt_slides import pipeline
+from yt_slides.cli import app
+
+URL = "https://youtu.be/dQw4w9WgXcQ"
+
+
+@pytest.fixture
+def runs(monkeypatch) -> list[dict]:
+    calls: list[dict] = []
+    monkeypatch.setattr(pipeline, "run_pipeline", lambda **kwargs: calls.append(kwargs) or [])
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    return calls
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["generate", URL, "--output", "{out}"],
+        [URL, "--output", "{out}"],
+        ["--output", "{out}", URL],
+    ],
+    ids=["generate", "url first", "options first"],
+)
+def test_a_bare_url_runs_generate(tmp_path, runs, args):
+    app([a.format(out=tmp_path) for a in args], standalone_mode=False)
+
+    assert [(r["url"], r["settings"].output_dir) for r in runs] == [(URL, tmp_path)]
+
+
+def test_unknown_options_still_fail(runs):
+    with pytest.raises(Exception, match="--no-such-option"):
+        app(["--no-such-option", URL], standalone_mode=False)
+    assert runs == []
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from yt_slides.transcript import Transcript
+from yt_slides.youtube.compaction import compact_transcript
+
+
+def _captions(*captions: tuple[float, float, str]) -> Transcript:
+    return Transcript([c[2] for c in captions], [c[0] for c in captions], [c[1] for c in captions])
+
+
+def test_non_speech_fillers_and_stutters_are_removed():
+    transcript = _captions((0.0, 2.0, "[Music] so um the the model (laughs) >> learns ♪ la la ♪ fast."))
+
+    compacted = compact_transcript(transcript)
+
+    assert compacted.text == "so the model learns fast."
+
+
+def test_fillers_can_be_kept():
+    compacted = compact_transcript(_captions((0.0, 2.0, "uh we start")), strip_fillers=False)
+
+    assert compacted.text == "uh we start"
+
+
+def test_rolling_caption_repeats_are_dropped():
+    transcript = _captions(
+        (0.0, 2.0, "today we talk about"),
+        (2.0, 2.0, "we talk about gradient descent"),
+        (4.0, 2.0, "gradient descent and momentum."),
+    )
+
+    compacted = compact_transcript(transcript)
+
+    assert compacted.text == "today we talk about gradient descent and momentum."
+
+
+def test_a_single_shared_word_is_not_a_repeat():
+    transcript = _captions((0.0, 1.0, "we saw the"), (1.0, 1.0, "the results"))
+
+    assert compact_transcript(transcript).text == "we saw the the results"
+
+
+def test_fragments_merge_until_a_sentence_ends():
+    transcript = _captions(
+        (0.0, 2.0, "first part"),
+        (2.0, 2.0, "of a sentence."),
+        (4.0, 2.0, "next one"),
+    )
+
+    compacted = compact_transcript(transcript)
+
+    assert list(compacted.texts()) == ["first part of a sentence.", "next one"]
+    assert list(compacted.starts) == [0.0, 4.0]
+    assert list(compacted.durations) == [4.0, 2.0]
+
+
+def test_merges_stop_at_pauses_and_the_time_limit():
+    paused = _captions((0.0, 1.0, "before"), (4.0, 1.0, "after"))
+    steady = _captions(*((float(t), 1.0, f"w{t}") for t in range(30)))
+
+    assert len(compact_transcript(paused)) == 2
+    assert all(d <= 12.0 for d in compact_transcript(steady).durations)
+    assert list(compact_transcript(steady).starts) == [0.0, 12.0, 24.0]
+
+
+def test_empty_captions_are_dropped():
+    transcript = _captions((0.0, 1.0, "[Applause]"), (1.0, 1.0, "um"), (2.0, 1.0, "hello"))
+
+    compacted = compact_transcript(transcript)
+
+    assert (compacted.text, list(compacted.starts)) == ("hello", [2.0])
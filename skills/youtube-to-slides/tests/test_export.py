@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import base64
+import json
+import re
+import zlib
+
+import pytest
+from PIL import Image
+
+from yt_slides.export import DeckExporter, export_deck, parse_export_formats
+
+
+def _slide(path, color, mode="RGB", fmt="PNG"):
+    image = Image.new(mode, (32, 18), color)
+    image.save(path, format=fmt)
+    return path
+
+
+def _images(pdf: bytes) -> list[tuple[bytes, bytes]]:
+    """The (dictionary, stream data) of every image XObject, in page order."""
+    pattern = re.compile(rb"<< /Type /XObject /Subtype /Image (.*?) /Length (\d+) >>\nstream\n", re.DOTALL)
+    images = []
+    for match in pattern.finditer(pdf):
+        start = match.end()
+        images.append((match.group(1), pdf[start : start + int(match.group(2))]))
+    return images
+
+
+def _unfilter(data: bytes, width: int, colors: int) -> bytes:
+    """Undo the PNG row filters that /Predictor 15 declares."""
+    raw = zlib.decompress(data)
+    stride = width * colors
+    rows, previous = [], bytearray(stride)
+    for offset in range(0, len(raw), stride + 1):
+        kind, row = raw[offset], bytearray(raw[offset + 1 : offset + 1 + stride])
+        for i in range(stride):
+            left = row[i - colors] if i >= colors else 0
+            up = previous[i]
+            upper_left = previous[i - colors] if i >= colors else 0
+            if kind == 1:
+                row[i] = (row[i] + left) & 0xFF
+            elif kind == 2:
+                row[i] = (row[i] + up) & 0xFF
+            elif kind == 3:
+                row[i] = (row[i] + (left + up) // 2) & 0xFF
+            elif kind == 4:
+                p = left + up - upper_left
+                pa, pb, pc = abs(p - left), abs(p - up), abs(p - upper_left)
+                predictor = left if pa <= pb and pa <= pc else up if pb <= pc else upper_left
+                row[i] = (row[i] + predictor) & 0xFF
+        rows.append(bytes(row))
+        previous = row
+    return b"".join(rows)
+
+
+def test_parse_export_formats():
+    assert parse_export_formats("PDF, html,") == ["pdf", "html"]
+    assert parse_export_formats("") == []
+    assert parse_export_formats(["html"]) == ["html"]
+    with pytest.raises(ValueError, match="pptx"):
+        parse_export_formats("pdf,pptx")
+
+
+def test_slides_are_written_in_order(tmp_path):
+    slides = [_slide(tmp_path / f"{n}.png", (n * 60, 0, 0)) for n in (1, 2, 3)]
+    exporter = DeckExporter(tmp_path, "Deck", ["pdf", "html"])
+
+    for n in (3, 1, 2):
+        exporter.add(n, slides[n - 1], f"Slide {n}")
+    pdf_path, html_path = exporter.finish()
+
+    pdf = pdf_path.read_bytes()
+    assert pdf.startswith(b"%PDF-1.4") and pdf.endswith(b"%%EOF\n")
+    assert b"/Count 3" in pdf
+    page = html_path.read_text()
+    alts = re.findall(r'alt="([^"]*)"', page)
+    assert alts == ["Slide 1", "Slide 2", "Slide 3"]
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_png_slides_are_embedded_losslessly(tmp_path):
+    image = Image.new("RGB", (32, 18))
+    image.putdata([(x * 8, y * 14, (x * y) % 256) for y in range(18) for x in range(32)])
+    image.save(tmp_path / "1.png")
+    exporter = DeckExporter(tmp_path, "Deck", ["pdf"])
+
+    exporter.add(1, tmp_path / "1.png")
+    (pdf_path,) = exporter.finish()
+
+    ((entries, data),) = _images(pdf_path.read_bytes())
+    assert b"/FlateDecode" in entries and b"/Predictor 15" in entries
+    assert _unfilter(data, 32, 3) == image.tobytes()
+
+
+def test_transparency_is_flattened_onto_white(tmp_path):
+    _slide(tmp_path / "1.png", (255, 0, 0, 0), mode="RGBA")
+    exporter = DeckExporter(tmp_path, "Deck", ["pdf"])
+
+    exporter.add(1, tmp_path / "1.png")
+    (pdf_path,) = exporter.finish()
+
+    ((_, data),) = _images(pdf_path.read_bytes())
+    assert set(_unfilter(data, 32, 3)) == {255}
+
+
+def test_jpeg_slides_are_embedded_as_they_are(tmp_path):
+    jpeg = _slide(tmp_path / "1.jpg", (10, 20, 30), fmt="JPEG")
+    gray = _slide(tmp_path / "2.png", 128, mode="L")
+    exporter = DeckExporter(tmp_path, "Deck", ["pdf"])
+
+    exporter.add(1, jpeg)
+    exporter.add(2, gray)
+    (pdf_path,) = exporter.finish()
+
+    (jpeg_entries, jpeg_data), (gray_entries, gray_data) = _images(pdf_path.read_bytes())
+    assert b"/DCTDecode" in jpeg_entries and jpeg_data == jpeg.read_bytes()
+    assert b"/DeviceGray" in gray_entries and _unfilter(gray_data, 32, 1) == bytes([128]) * 32 * 18
+
+
+def test_finish_skips_missing_slides(tmp_path):
+    exporter = DeckExporter(tmp_path, "Deck", ["html"])
+
+    exporter.add(3, _slide(tmp_path / "3.png", "blue"), "Third")
+    exporter.add(1, _slide(tmp_path / "1.png", "red"), "First")
+    (html_path,) = exporter.finish()
+
+    page = html_path.read_text()
+    assert re.findall(r'alt="([^"]*)"', page) == ["First", "Third"]
+    encoded = re.findall(r"base64,([^\"]+)", page)
+    assert base64.b64decode(encoded[1]) == (tmp_path / "3.png").read_bytes()
+
+
+def test_abort_discards_partial_decks(tmp_path):
+    exporter = DeckExporter(tmp_path, "Deck", ["pdf", "html"])
+    exporter.add(1, _slide(tmp_path / "1.png", "red"))
+
+    exporter.abort()
+
+    assert not list(tmp_path.glob("slides.*"))
+
+
+def test_html_escapes_titles(tmp_path):
+    exporter = DeckExporter(tmp_path, "<Deck>", ["html"])
+    exporter.add(1, _slide(tmp_path / "1.png", "red"), 'Say "hi" & <bye>')
+
+    (html_path,) = exporter.finish()
+
+    page = html_path.read_text()
+    assert "<title>&lt;Deck&gt;</title>" in page
+    assert 'alt="Say &quot;hi&quot; &amp; &lt;bye&gt;"' in page
+
+
+def test_export_deck_reads_metadata(tmp_path):
+    _slide(tmp_path / "01_intro.png", "red")
+    _slide(tmp_path / "03_end.png", "blue")
+    (tmp_path / "metadata.json").write_text(
+        json.dumps(
+            {
+                "video_title": "Video",
+                "sections": [
+                    {"title": "Intro", "image_file": "01_intro.png"},
+                    {"title": "Missing", "image_file": "02_missing.png"},
+                    {"title": "End", "image_file": "03_end.png"},
+                ],
+            }
+        )
+    )
+
+    pdf_path, html_path = export_deck(tmp_path)
+
+    assert b"/Count 2" in pdf_path.read_bytes()
+    assert re.findall(r'alt="([^"]*)"', html_path.read_text()) == ["Intro", "End"]
+
+
+def test_export_deck_discards_partial_decks_when_finishing_fails(tmp_path):
+    (tmp_path / "02_broken.png").write_bytes(b"not an image")
+    (tmp_path / "metadata.json").write_text(
+        json.dumps(
+            {
+                "video_title": "Video",
+                "sections": [
+                    {"title": "Missing", "image_file": "01_missing.png"},
+                    {"title": "Broken", "image_file": "02_broken.png"},
+                ],
+            }
+        )
+    )
+
+    with pytest.raises(OSError):
+        export_deck(tmp_path)  # the broken slide waits for slide 1 until finish()
+
+    assert not list(tmp_path.glob("slides.*"))
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+from google.genai import types
+
+from yt_slides.bench.fakes import FakeGenaiClient, placeholder_png
+from yt_slides.image import generator
+from yt_slides.image.generator import (
+    ImageGenerationError,
+    _save_image,
+    generate_infographic,
+)
+
+
+def test_generate_infographic_runs_without_an_event_loop(tmp_path):
+    client = FakeGenaiClient()
+
+    path = generate_infographic(client, "A slide", tmp_path / "slide.png")
+
+    assert path.read_bytes() == placeholder_png()
+    assert client.stats.image_calls == 1
+
+
+def test_generate_infographic_retries_then_gives_up(tmp_path, monkeypatch):
+    monkeypatch.setattr(generator.time, "sleep", lambda seconds: None)
+    client = FakeGenaiClient(error_rate=1.0)
+
+    with pytest.raises(ImageGenerationError, match="after 2 attempts"):
+        generate_infographic(client, "A slide", tmp_path / "slide.png", max_retries=1)
+
+    assert client.stats.image_calls == 2
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        types.GenerateContentResponse(),
+        types.GenerateContentResponse(candidates=[types.Candidate()]),
+        types.GenerateContentResponse(candidates=[types.Candidate(content=types.Content(role="model"))]),
+    ],
+    ids=["no candidates", "no content", "no parts"],
+)
+def test_a_response_without_an_image_raises(tmp_path, response):
+    with pytest.raises(ImageGenerationError):
+        _save_image(response, tmp_path / "slide.png")
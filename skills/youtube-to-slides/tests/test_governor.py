@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from google.genai import errors
+
+from yt_slides import governor
+from yt_slides.governor import RateGovernor, _Window, is_rate_limited, retry_delay
+
+
+def _api_error(code: int, status: str = "", details: list | None = None) -> errors.APIError:
+    return errors.APIError(code, {"error": {"code": code, "status": status, "details": details or []}})
+
+
+def _flaky(failures: list[BaseException], result="ok"):
+    """A call that raises each of ``failures`` in turn, then returns ``result``."""
+    calls = []
+
+    async def call():
+        calls.append(1)
+        if len(calls) <= len(failures):
+            raise failures[len(calls) - 1]
+        return result
+
+    return call, calls
+
+
+def _run(call, retry_on=(), **options):
+    """Await one call through a governor created inside the running loop (required on 3.9)."""
+
+    async def main():
+        return await RateGovernor("text", **options).call(call, retry_on=retry_on)
+
+    return asyncio.run(main())
+
+
+@pytest.fixture(autouse=True)
+def fast_backoff(monkeypatch):
+    monkeypatch.setattr(governor, "_MAX_BACKOFF_SECONDS", 0.001)
+
+
+def test_window_admits_up_to_the_limit():
+    window = _Window(limit=2, period=60.0)
+
+    for now in (0.0, 1.0):
+        assert window.wait_time(1, now) == 0.0
+        window.add(1, now)
+
+    # The oldest start leaves the window at 60s
+    assert window.wait_time(1, 2.0) == pytest.approx(58.0)
+    assert window.wait_time(1, 60.0) == 0.0
+
+
+def test_window_caps_oversized_amounts_at_the_limit():
+    window = _Window(limit=100)
+
+    assert window.wait_time(500, 0.0) == 0.0
+    window.add(500, 0.0)
+    assert window.wait_time(1, 1.0) == pytest.approx(59.0)
+
+
+def test_unlimited_window_never_waits():
+    window = _Window(limit=0)
+    window.add(10**9, 0.0)
+
+    assert window.wait_time(10**9, 0.0) == 0.0
+
+
+def test_retry_delay_reads_retry_info():
+    error = _api_error(
+        429,
+        "RESOURCE_EXHAUSTED",
+        [{"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "1.5s"}],
+    )
+
+    assert retry_delay(error) == 1.5
+    assert is_rate_limited(error)
+    assert retry_delay(ValueError("boom")) is None
+    assert not is_rate_limited(_api_error(500))
+
+
+def test_retries_throttled_and_transient_errors():
+    call, calls = _flaky([_api_error(429, "RESOURCE_EXHAUSTED"), _api_error(503), asyncio.TimeoutError()])
+
+    result = _run(call, max_retries=5)
+
+    assert result == "ok"
+    assert len(calls) == 4
+
+
+def test_does_not_retry_client_errors():
+    call, calls = _flaky([_api_error(400, "INVALID_ARGUMENT")])
+
+    with pytest.raises(errors.APIError):
+        _run(call)
+    assert len(calls) == 1
+
+
+def test_does_not_retry_daily_quota():
+    daily = _api_error(
+        429,
+        "RESOURCE_EXHAUSTED",
+        [{"violations": [{"quotaId": "GenerateRequestsPerDayPerProjectPerModel"}]}],
+    )
+    call, calls = _flaky([daily])
+
+    with pytest.raises(errors.APIError):
+        _run(call)
+    assert len(calls) == 1
+
+
+def test_retry_on_adds_exception_types():
+    call, calls = _flaky([KeyError("missing image")])
+
+    assert _run(call, retry_on=(KeyError,)) == "ok"
+    assert len(calls) == 2
+
+
+def test_gives_up_after_max_retries():
+    error = _api_error(503)
+    call, calls = _flaky([error] * 10)
+
+    with pytest.raises(errors.APIError):
+        _run(call, max_retries=2)
+    assert len(calls) == 3
+
+
+def test_limits_concurrent_calls():
+    running = 0
+    peak = 0
+
+    async def call():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    async def main():
+        limiter = RateGovernor("image", concurrency=2)
+        await asyncio.gather(*(limiter.call(call) for _ in range(6)))
+
+    asyncio.run(main())
+    assert peak == 2
+
+
+def test_rpm_limit_delays_calls_beyond_the_window(monkeypatch):
+    slept = []
+
+    async def no_sleep(seconds):
+        slept.append(seconds)
+        # Jump the clock instead of waiting
+        clock[0] += seconds
+
+    clock = [1000.0]
+    monkeypatch.setattr(governor.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(governor.asyncio, "sleep", no_sleep)
+
+    async def call():
+        return clock[0]
+
+    async def main():
+        limiter = RateGovernor("text", concurrency=5, rpm=2)
+        return [await limiter.call(call) for _ in range(3)]
+
+    starts = asyncio.run(main())
+
+    assert starts == [1000.0, 1000.0, 1060.0]
+    assert slept == [60.0]
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from yt_slides.bench.imports import CLI_MODULE, HEAVY_MODULES
+
+
+def _loaded_after(statement: str) -> set[str]:
+    """The HEAVY_MODULES a fresh interpreter has imported after ``statement``."""
+    check = f"import sys\n{statement}\nprint('heavy:', *(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    proc = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+    return set(proc.stdout.splitlines()[-1].split()[1:])
+
+
+def test_the_cli_imports_no_heavy_dependencies():
+    assert _loaded_after(f"import {CLI_MODULE}") == set()
+
+
+def test_help_runs_without_heavy_dependencies():
+    statement = f"from {CLI_MODULE} import app\napp(['--help'], standalone_mode=False)"
+
+    assert _loaded_after(statement) == set()
+
+
+def test_a_usage_error_runs_without_heavy_dependencies():
+    statement = f"from {CLI_MODULE} import app\ntry: app(['generate'], standalone_mode=False)\nexcept Exception: pass"
+
+    assert _loaded_after(statement) == set()
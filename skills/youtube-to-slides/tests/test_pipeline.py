@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+
+from rich.console import Console
+
+from yt_slides.bench.fakes import FakeGenaiClient, FakeYouTube, fake_backends
+from yt_slides.bench.runner import bench_settings
+from yt_slides.pipeline import run_pipeline_async
+
+
+def _run(settings, client: FakeGenaiClient, youtube: FakeYouTube | None = None, **options):
+    return asyncio.run(
+        run_pipeline_async(
+            url="dQw4w9WgXcQ",
+            settings=settings,
+            console=Console(quiet=True),
+            show_progress=False,
+            backends=fake_backends(youtube or FakeYouTube(600), client),
+            **options,
+        )
+    )
+
+
+class _CountingYouTube(FakeYouTube):
+    def __init__(self, duration_seconds: int) -> None:
+        super().__init__(duration_seconds)
+        self.fetches = 0
+
+    def fetch_metadata(self, video_id: str):
+        self.fetches += 1
+        return super().fetch_metadata(video_id)
+
+    def fetch_transcript(self, video_id: str, language: str = "en"):
+        self.fetches += 1
+        return super().fetch_transcript(video_id, language)
+
+
+def test_pipeline_renders_every_section(tmp_path):
+    settings = bench_settings(tmp_path, request_interval_seconds=0)
+    client = FakeGenaiClient()
+
+    results = _run(settings, client)
+
+    assert results and all(r.image_path for r in results)
+    assert client.stats.image_calls == len(results)
+    metadata = json.loads((settings.output_dir / "dQw4w9WgXcQ" / "metadata.json").read_text())
+    assert len(metadata["sections"]) == len(results)
+
+
+def test_resume_reuses_every_checkpoint(tmp_path):
+    settings = bench_settings(tmp_path, request_interval_seconds=0)
+    _run(settings, FakeGenaiClient())
+    client = FakeGenaiClient()
+
+    results = _run(settings, client, resume=True)
+
+    assert results
+    assert (client.stats.text_calls, client.stats.image_calls) == (0, 0)
+
+
+def test_refresh_refetches_despite_checkpoints(tmp_path):
+    settings = bench_settings(tmp_path, request_interval_seconds=0)
+    _run(settings, FakeGenaiClient())
+    resumed, refreshed = _CountingYouTube(600), _CountingYouTube(600)
+
+    _run(settings, FakeGenaiClient(), resumed, resume=True)
+    _run(settings, FakeGenaiClient(), refreshed, resume=True, refresh=True)
+
+    assert (resumed.fetches, refreshed.fetches) == (0, 2)
+
+
+def test_regenerate_redraws_only_the_chosen_slides(tmp_path):
+    settings = bench_settings(tmp_path, request_interval_seconds=0)
+    _run(settings, FakeGenaiClient())
+    client = FakeGenaiClient()
+
+    _run(settings, client, resume=True, regenerate={1})
+
+    assert (client.stats.text_calls, client.stats.image_calls) == (0, 1)
+
+
+def test_pipeline_writes_a_run_report(tmp_path):
+    settings = bench_settings(tmp_path, request_interval_seconds=0)
+
+    _run(settings, FakeGenaiClient())
+
+    report = json.loads((settings.output_dir / "dQw4w9WgXcQ" / "run_report.json").read_text())
+    assert report["status"] == "ok"
+    totals = report["totals"]
+    assert totals["image"]["count"] == len(list((settings.output_dir / "dQw4w9WgXcQ").glob("*.png")))
+    assert totals["gemini.generate_content"]["count"] >= totals["image"]["count"]
+
+
+def test_image_budget_caps_the_slide_count(tmp_path):
+    settings = bench_settings(tmp_path, request_interval_seconds=0, max_images=2)
+    client = FakeGenaiClient()
+
+    results = _run(settings, client)
+
+    assert len(results) == 2
+    assert client.stats.image_calls == 2
+
+
+def test_a_loose_budget_leaves_the_section_count_alone(tmp_path):
+    settings = bench_settings(tmp_path, request_interval_seconds=0, max_input_tokens=10**9)
+    console = Console(file=io.StringIO(), width=200)
+    client = FakeGenaiClient()
+
+    results = asyncio.run(
+        run_pipeline_async(
+            url="dQw4w9WgXcQ",
+            settings=settings,
+            console=console,
+            show_progress=False,
+            backends=fake_backends(FakeYouTube(600), client),
+        )
+    )
+
+    assert results
+    assert "Budget allows" not in console.file.getvalue()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from PIL import Image
+
+from yt_slides.image.postprocess import (
+    THUMBNAIL_DIR,
+    ImagePostprocessor,
+    postprocess_image,
+)
+from yt_slides.models import ImageStats, PendingImage
+from yt_slides.pipeline import record_batch_images
+
+
+def _slide(path, size=(800, 450), fmt="PNG"):
+    image = Image.new("RGB", size, (30, 120, 200))
+    image.save(path, format=fmt)
+    return path
+
+
+def test_matching_images_keep_the_model_bytes(tmp_path):
+    path = _slide(tmp_path / "01_intro.png")
+    original = path.read_bytes()
+
+    stats = postprocess_image(str(path), "png")
+
+    assert path.read_bytes() == original
+    assert stats.original_bytes == stats.bytes == len(original)
+    assert (stats.width, stats.height, stats.thumbnail) == (800, 450, None)
+
+
+def test_transcoding_reports_both_sizes(tmp_path):
+    path = _slide(tmp_path / "01_intro.png")
+    original_bytes = path.stat().st_size
+
+    stats = postprocess_image(str(path), "jpg", quality=60)
+
+    with Image.open(path) as image:
+        assert image.format == "JPEG"
+    assert stats.original_bytes == original_bytes
+    assert stats.bytes == path.stat().st_size
+    assert stats.format == "jpg"
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_wide_images_are_downscaled(tmp_path):
+    path = _slide(tmp_path / "01_intro.png")
+
+    stats = postprocess_image(str(path), "png", max_width=400)
+
+    assert (stats.width, stats.height) == (400, 225)
+    with Image.open(path) as image:
+        assert image.size == (400, 225)
+
+
+def test_thumbnails_are_written_beside_the_slide(tmp_path):
+    path = _slide(tmp_path / "01_intro.png")
+
+    stats = postprocess_image(str(path), "png", thumbnail_width=160)
+
+    assert stats.thumbnail == "01_intro.png"
+    with Image.open(tmp_path / THUMBNAIL_DIR / "01_intro.png") as thumb:
+        assert thumb.size == (160, 90)
+
+
+def test_transparent_images_get_a_white_background_as_jpeg(tmp_path):
+    path = tmp_path / "01_intro.png"
+    Image.new("RGBA", (10, 10), (0, 0, 0, 0)).save(path)
+
+    postprocess_image(str(path), "jpg")
+
+    with Image.open(path) as image:
+        assert image.getpixel((5, 5)) == (255, 255, 255)
+
+
+def test_unknown_formats_are_rejected():
+    with pytest.raises(ValueError, match="Unsupported image format"):
+        ImagePostprocessor("bmp")
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_postprocessor_records_stats_per_image(tmp_path, workers):
+    paths = [_slide(tmp_path / f"{n:02d}_slide.png") for n in (1, 2)]
+
+    async def main():
+        with ImagePostprocessor("png", max_width=400, workers=workers) as postprocessor:
+            await asyncio.gather(*(postprocessor.process(p) for p in paths))
+        return postprocessor
+
+    postprocessor = asyncio.run(main())
+
+    assert set(postprocessor.stats) == {str(p) for p in paths}
+    assert all(s.width == 400 for s in postprocessor.stats.values())
+
+
+def test_batch_results_are_recorded_in_metadata(tmp_path):
+    names = ["01_a.png", "02_b.png", "03_c.png"]
+    (tmp_path / "metadata.json").write_text(
+        json.dumps({"sections": [{"image_file": name} for name in names], "images": {"format": "png"}})
+    )
+    images = [
+        PendingImage(
+            video_id="dQw4w9WgXcQ", slide=n, prompt="p", output_path=str(tmp_path / name), checkpoint_key="k"
+        )
+        for n, name in enumerate(names, 1)
+    ]
+    stats = {
+        images[0].output_path: ImageStats(format="png", width=8, height=4, original_bytes=100, bytes=60),
+        images[1].output_path: ImageStats(
+            format="png", width=8, height=4, original_bytes=50, bytes=50, thumbnail="02_b.png"
+        ),
+    }
+
+    record_batch_images(tmp_path, images, stats, failed=[images[2]])
+
+    metadata = json.loads((tmp_path / "metadata.json").read_text())
+    first, second, third = metadata["sections"]
+    assert (first["bytes"], first["original_bytes"]) == (60, 100)
+    assert second["thumbnail_file"] == f"{THUMBNAIL_DIR}/02_b.png"
+    assert third == {"image_file": "03_c.png", "failed": True}
+    assert metadata["images"] == {"format": "png", "original_bytes": 150, "bytes": 110, "saved_bytes": 40}
+    assert metadata["incomplete"] is True
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from yt_slides.ai.segmenter import (
+    consolidate_sections,
+    merge_window_segments,
+    segment_transcript,
+    transcript_windows,
+)
+from yt_slides.bench.fakes import FakeGenaiClient, FakeYouTube
+from yt_slides.transcript import Transcript
+
+
+def _transcript(duration: int) -> Transcript:
+    starts = [float(s) for s in range(0, duration, 10)]
+    return Transcript([f"t{s:g}" for s in starts], starts, [10.0] * len(starts))
+
+
+def test_window_cores_tile_the_video_exactly():
+    windows = transcript_windows(_transcript(3000), 3000, window_seconds=1200, overlap_seconds=120)
+
+    assert [(w.start, w.end) for w in windows] == [(0, 1200), (1080, 2280), (2160, 3000)]
+    assert windows[0].core_start == 0 and windows[-1].core_end == 3000
+    for before, after in zip(windows, windows[1:]):
+        assert before.core_end == after.core_start
+        assert after.start < before.core_end < before.end
+
+
+def test_windows_hold_the_snippets_they_cover():
+    windows = transcript_windows(_transcript(3000), 3000, window_seconds=1200, overlap_seconds=120)
+
+    assert all(w.start <= s.start < w.end for w in windows for s in w.snippets)
+    assert len(windows[1].snippets) == 120
+
+
+def test_a_short_video_is_one_window():
+    windows = transcript_windows(_transcript(600), 600, window_seconds=1200, overlap_seconds=120)
+
+    assert [(w.core_start, w.core_end) for w in windows] == [(0, 600)]
+
+
+def test_merge_keeps_only_boundaries_inside_each_core():
+    transcript = _transcript(3000)
+    windows = transcript_windows(transcript, 3000, window_seconds=1200, overlap_seconds=120)
+    results = [
+        [(0, "Intro"), (600, "Setup"), (1160, "Past the core")],
+        [(1080, "Seam start"), (1500, "Middle"), (2230, "Past the core")],
+        [(2160, "Seam start"), (2500, "End")],
+    ]
+
+    sections = merge_window_segments(windows, results, transcript, 3000)
+
+    assert [(s.start_seconds, s.title) for s in sections] == [
+        (0, "Intro"),
+        (600, "Setup"),
+        (1500, "Middle"),
+        (2500, "End"),
+    ]
+    assert sections[-1].end_seconds == 3000
+    assert "t600" in sections[1].transcript_text
+
+
+def test_a_failed_window_falls_back_to_fixed_splits():
+    transcript = _transcript(1200)
+    windows = transcript_windows(transcript, 1200, window_seconds=1200, overlap_seconds=120)
+
+    sections = merge_window_segments(windows, [None], transcript, 1200, fallback_seconds=300)
+
+    assert [s.start_seconds for s in sections] == [0, 300, 600, 900]
+    assert [s.title for s in sections] == ["Part 1", "Part 2", "Part 3", "Part 4"]
+
+
+def test_short_sections_are_merged_away():
+    transcript = _transcript(600)
+    windows = transcript_windows(transcript, 600, window_seconds=1200, overlap_seconds=120)
+
+    sections = merge_window_segments(
+        windows, [[(30, "Intro"), (200, "Body"), (230, "Blip"), (570, "Outro")]], transcript, 600
+    )
+
+    assert [(s.start_seconds, s.title) for s in sections] == [(0, "Intro"), (200, "Body")]
+    assert sections[-1].end_seconds == 600
+
+
+def test_blocking_wrappers_segment_and_consolidate():
+    youtube = FakeYouTube(1800)
+    metadata = youtube.fetch_metadata("dQw4w9WgXcQ")
+    client = FakeGenaiClient()
+
+    sections = segment_transcript(client, youtube.fetch_transcript("dQw4w9WgXcQ"), metadata)
+    merged = consolidate_sections(client, sections, len(sections) - 1, metadata.title)
+
+    assert len(merged) == len(sections) - 1
+    assert client.stats.text_calls == 2
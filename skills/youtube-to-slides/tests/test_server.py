@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+
+from rich.console import Console
+
+from yt_slides.bench.fakes import FakeGenaiClient, FakeYouTube, fake_backends
+from yt_slides.bench.runner import bench_settings
+from yt_slides.server import JobServer
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _request(port: int, method: str, path: str, body: bytes = b"") -> tuple[int, object]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    status = int(head.split()[1])
+    if b"application/json" in head:
+        return status, json.loads(payload)
+    return status, payload.decode()
+
+
+def _serving(tmp_path, scenario):
+    """Run ``scenario(port)`` against a job server backed by fakes."""
+
+    async def main():
+        server = JobServer(
+            bench_settings(tmp_path, request_interval_seconds=0, postprocess_workers=0),
+            backends=fake_backends(FakeYouTube(600), FakeGenaiClient()),
+            console=Console(quiet=True),
+        )
+        port = _free_port()
+        task = asyncio.create_task(server.run("127.0.0.1", port))
+        for _ in range(100):
+            try:
+                await _request(port, "GET", "/healthz")
+                break
+            except OSError:
+                await asyncio.sleep(0.02)
+        try:
+            return await scenario(port)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    return asyncio.run(main())
+
+
+async def _wait_for(port: int, job_id: str) -> dict:
+    for _ in range(500):
+        _, job = await _request(port, "GET", f"/jobs/{job_id}")
+        if job["status"] not in ("queued", "running"):
+            return job
+        await asyncio.sleep(0.02)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_jobs_run_to_completion(tmp_path):
+    async def scenario(port):
+        body = json.dumps({"url": "dQw4w9WgXcQ", "style": "comic"}).encode()
+        created = await _request(port, "POST", "/jobs", body)
+        duplicate = await _request(port, "POST", "/jobs", body)
+        job = await _wait_for(port, created[1]["id"])
+        listing = await _request(port, "GET", "/jobs")
+        metrics = await _request(port, "GET", "/metrics")
+        return created, duplicate, job, listing, metrics
+
+    created, duplicate, job, listing, metrics = _serving(tmp_path, scenario)
+
+    assert created[0] == 202 and created[1]["video_id"] == "dQw4w9WgXcQ"
+    assert duplicate == (200, duplicate[1]) and duplicate[1]["id"] == created[1]["id"]
+    assert job["status"] == "done" and job["slides"]
+    assert job["slides_done"] == job["slides_total"] == len(job["slides"])
+    assert [j["id"] for j in listing[1]] == [job["id"]]
+    assert "yt_slides_jobs_submitted_total 1" in metrics[1]
+    assert 'yt_slides_jobs_finished_total{status="done"} 1' in metrics[1]
+
+
+def test_bad_requests_are_rejected(tmp_path):
+    async def scenario(port):
+        return [
+            await _request(port, "POST", "/jobs", b"{not json"),
+            await _request(port, "POST", "/jobs", b'{"url": "dQw4w9WgXcQ", "style": "nope"}'),
+            await _request(port, "POST", "/jobs", b'{"url": "https://example.com/"}'),
+            await _request(port, "GET", "/jobs/missing"),
+            await _request(port, "PUT", "/jobs"),
+            await _request(port, "GET", "/nowhere"),
+        ]
+
+    statuses = [status for status, _ in _serving(tmp_path, scenario)]
+
+    assert statuses == [400, 400, 400, 404, 405, 404]
+
+
+def test_finished_jobs_cannot_be_cancelled(tmp_path):
+    async def scenario(port):
+        _, job = await _request(port, "POST", "/jobs", b'{"url": "dQw4w9WgXcQ", "dry_run": true}')
+        await _wait_for(port, job["id"])
+        return await _request(port, "DELETE", f"/jobs/{job['id']}")
+
+    status, body = _serving(tmp_path, scenario)
+
+    assert status == 409 and "already done" in body["error"]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from yt_slides.ai.summarizer import (
+    _parse_batch_summaries,
+    group_sections_by_tokens,
+    summarize_section,
+    summarize_sections_batch_async,
+)
+from yt_slides.bench.fakes import FakeGenaiClient
+from yt_slides.models import Section
+
+
+def _section(index: int, words: int = 10) -> Section:
+    return Section(
+        index=index,
+        title=f"Part {index}",
+        start_seconds=(index - 1) * 60,
+        end_seconds=index * 60,
+        transcript_text=" ".join(["word"] * words),
+    )
+
+
+def _entry(index: int, **overrides) -> dict:
+    entry = {
+        "index": index,
+        "headline": f"Headline {index}",
+        "key_points": ["a", "b", "c"],
+        "summary": "s",
+        "visual_suggestions": "chart",
+    }
+    entry.update(overrides)
+    return entry
+
+
+def test_groups_stay_under_the_token_budget():
+    sections = [_section(i, words=40) for i in range(1, 6)]  # ~51 tokens each
+
+    groups = group_sections_by_tokens(sections, max_tokens=120)
+
+    assert [[s.index for s in group] for group in groups] == [[1, 2], [3, 4], [5]]
+
+
+def test_an_oversized_section_gets_its_own_group():
+    sections = [_section(1), _section(2, words=1000), _section(3)]
+
+    groups = group_sections_by_tokens(sections, max_tokens=100)
+
+    assert [[s.index for s in group] for group in groups] == [[1], [2], [3]]
+
+
+def test_malformed_and_unknown_entries_are_dropped():
+    sections = [_section(1), _section(2), _section(3)]
+    text = json.dumps([
+        _entry(1),
+        _entry(1, headline="duplicate"),
+        {"index": 2, "headline": "missing fields"},
+        _entry(9),
+        _entry(3),
+    ])
+
+    summaries = _parse_batch_summaries(sections, text)
+
+    assert sorted(summaries) == [1, 3]
+    assert summaries[1].headline == "Headline 1"
+    assert summaries[3].section == sections[2]
+
+
+def test_unparseable_responses_yield_nothing():
+    sections = [_section(1)]
+
+    assert _parse_batch_summaries(sections, '[{"index": 1') == {}
+    assert _parse_batch_summaries(sections, json.dumps(_entry(1))) == {}
+
+
+def test_batch_request_covers_every_section_in_one_call():
+    calls = []
+
+    async def generate_content(model, contents, config=None):
+        calls.append(contents[0])
+        return SimpleNamespace(text=json.dumps([_entry(1), _entry(2)]), usage_metadata=None)
+
+    client = SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content)))
+    sections = [_section(1), _section(2)]
+
+    summaries = asyncio.run(summarize_sections_batch_async(client, sections, "Video", total_sections=2))
+
+    assert sorted(summaries) == [1, 2]
+    assert len(calls) == 1
+    assert "SECTION 1/2" in calls[0] and "SECTION 2/2" in calls[0]
+
+
+def test_summarize_section_runs_without_an_event_loop():
+    client = FakeGenaiClient()
+
+    summary = summarize_section(client, _section(2), "Video", total_sections=3)
+
+    assert summary.section.index == 2 and summary.headline
+    assert client.stats.text_calls == 1
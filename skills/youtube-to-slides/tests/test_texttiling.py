@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from yt_slides.transcript import Transcript
+
+pytest.importorskip("numpy")
+
+from yt_slides.ai.texttiling import segment_locally
+
+TOPICS = [
+    ["volcano", "magma", "eruption", "lava", "crater", "ash", "tectonic", "basalt"],
+    ["violin", "orchestra", "symphony", "concerto", "melody", "tempo", "conductor", "chord"],
+    ["compiler", "parser", "bytecode", "register", "optimizer", "linker", "syntax", "token"],
+]
+
+
+def _lecture(minutes_per_topic: int = 10, seed: int = 0) -> Transcript:
+    """Captions every five seconds, moving through TOPICS in order."""
+    rng = random.Random(seed)
+    texts, starts = [], []
+    for t, words in enumerate(TOPICS):
+        for k in range(minutes_per_topic * 12):
+            texts.append(" ".join(rng.choice(words) for _ in range(8)))
+            starts.append(t * minutes_per_topic * 60 + k * 5.0)
+    return Transcript(texts, starts, [5.0] * len(texts))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_finds_topic_changes(seed):
+    starts = [s.start_seconds for s in segment_locally(_lecture(seed=seed), 1800)]
+
+    assert {600.0, 1200.0} <= set(starts)
+
+
+def test_max_sections_keeps_the_strongest_boundaries():
+    sections = segment_locally(_lecture(), 1800, max_sections=3)
+
+    assert [s.start_seconds for s in sections] == [0.0, 600.0, 1200.0]
+    assert sections[-1].end_seconds == 1800
+    for section, words in zip(sections, TOPICS):
+        assert section.title.split(", ")[0].lower() in words
+
+
+def test_sections_cover_the_transcript():
+    transcript = _lecture()
+
+    sections = segment_locally(transcript, 1800)
+
+    assert " ".join(s.transcript_text for s in sections) == transcript.text
+    assert all(a.end_seconds == b.start_seconds for a, b in zip(sections, sections[1:]))
+
+
+def test_respects_min_section_length():
+    sections = segment_locally(_lecture(minutes_per_topic=3), 540, min_section_seconds=300)
+
+    assert all(s.end_seconds - s.start_seconds >= 300 for s in sections)
+
+
+def test_short_or_empty_transcripts_give_one_section():
+    assert len(segment_locally(Transcript(), 30)) == 1
+    assert len(segment_locally(_lecture(minutes_per_topic=1), 60)) == 1
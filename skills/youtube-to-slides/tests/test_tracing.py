@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from rich.console import Console
+
+from yt_slides import tracing
+
+
+def _tracer(**options) -> tracing.Tracer:
+    return tracing.Tracer(console=Console(quiet=True), **options)
+
+
+def test_spans_nest_under_the_current_span():
+    with _tracer() as tracer, tracing.span("outer", slide=1) as outer, tracing.span("inner") as inner:
+        pass
+
+    assert [s.name for s in tracer.spans] == ["pipeline", "outer", "inner"]
+    assert outer.parent_id == tracer.root.span_id
+    assert inner.parent_id == outer.span_id
+    assert outer.attributes == {"slide": 1}
+
+
+def test_spans_in_tasks_inherit_the_parent():
+    async def work(n: int) -> None:
+        with tracing.span("task", n=n):
+            await asyncio.sleep(0)
+
+    async def main() -> tracing.Tracer:
+        with _tracer() as tracer, tracing.span("stage"):
+            await asyncio.gather(work(1), work(2))
+        return tracer
+
+    tracer = asyncio.run(main())
+
+    stage = tracer.spans[1]
+    tasks = [s for s in tracer.spans if s.name == "task"]
+    assert len(tasks) == 2
+    assert {s.parent_id for s in tasks} == {stage.span_id}
+
+
+def test_spans_are_no_ops_without_a_tracer():
+    with tracing.span("orphan") as s:
+        tracing.set_attribute("key", "value")
+        tracing.record_retry(1.0)
+
+    assert s is None
+
+
+def test_errors_are_recorded_and_reraised():
+    with pytest.raises(ValueError), _tracer() as tracer, tracing.span("call"):
+        raise ValueError("boom")
+
+    call = tracer.spans[1]
+    assert (call.status, call.error) == ("error", "boom")
+    assert tracer.report()["status"] == "error"
+
+
+def test_report_totals_calls_retries_and_tokens(tmp_path):
+    usage = SimpleNamespace(prompt_token_count=10, candidates_token_count=4, thoughts_token_count=None)
+    part = SimpleNamespace(text="héllo", inline_data=None)
+    response = SimpleNamespace(
+        candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))], usage_metadata=usage
+    )
+    path = tmp_path / "run_report.json"
+
+    with _tracer(report_path=path):
+        for _ in range(2):
+            with tracing.span("gemini.text") as s:
+                tracing.record_retry(0.5)
+                tracing.record_response(s, 100, response)
+
+    report = json.loads(path.read_text())
+    totals = report["totals"]["gemini.text"]
+    assert (totals["count"], totals["retries"], totals["backoff_seconds"]) == (2, 2, 1.0)
+    assert (totals["prompt_tokens"], totals["output_tokens"]) == (20, 8)
+    assert report["spans"][1]["response_bytes"] == len("héllo".encode())
+    assert not list(tmp_path.glob("*.tmp"))
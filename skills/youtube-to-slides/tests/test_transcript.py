@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+
+from yt_slides.ai.segmenter import _parse_segments
+from yt_slides.models import Chapter, TranscriptSnippet
+from yt_slides.transcript import Transcript
+from yt_slides.youtube.chapters import assign_transcript_to_sections, split_by_time
+
+
+def _scan(snippets: list[TranscriptSnippet], start: float, end: float) -> str:
+    """The full scan the start-time index replaced."""
+    return " ".join(s.text for s in snippets if start <= s.start < end)
+
+
+def _scan_split_by_time(snippets, duration, interval):
+    parts = []
+    start = 0.0
+    while start < duration:
+        end = min(start + interval, float(duration))
+        text = _scan(snippets, start, end)
+        if text.strip():
+            parts.append((start, end, text))
+        start = end
+    return parts
+
+
+def _snippets(n: int, seed: int, shuffle: bool = False, step: float = 2.0) -> list[TranscriptSnippet]:
+    rng = random.Random(seed)
+    snippets = [
+        TranscriptSnippet(text=f"w{i} {rng.choice(['alpha', 'beta', 'gamma'])}", start=i * step, duration=step)
+        for i in range(n)
+    ]
+    if shuffle:
+        rng.shuffle(snippets)
+    return snippets
+
+
+def _chapters(bounds: list[float]) -> list[Chapter]:
+    return [
+        Chapter(title=f"c{i}", start_seconds=a, end_seconds=b)
+        for i, (a, b) in enumerate(zip(bounds, bounds[1:]))
+    ]
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+@pytest.mark.parametrize("seed", range(5))
+def test_assign_matches_full_scan(seed, shuffle):
+    snippets = _snippets(500, seed, shuffle)
+    rng = random.Random(seed)
+    bounds = sorted({0.0, 1000.0, *(float(rng.randrange(0, 1000)) for _ in range(12))})
+    chapters = _chapters(bounds)
+
+    sections = assign_transcript_to_sections(chapters, snippets)
+
+    assert [s.transcript_text for s in sections] == [
+        _scan(snippets, c.start_seconds, c.end_seconds) for c in chapters
+    ]
+    assert [s.index for s in sections] == list(range(1, len(chapters) + 1))
+
+
+def test_assign_accepts_a_transcript():
+    snippets = _snippets(50, 0, shuffle=True)
+    chapters = _chapters([0.0, 30.0, 100.0])
+
+    from_list = assign_transcript_to_sections(chapters, snippets)
+    from_transcript = assign_transcript_to_sections(chapters, Transcript.from_snippets(snippets))
+
+    assert from_list == from_transcript
+
+
+def test_snippet_on_a_boundary_belongs_to_the_later_section():
+    snippets = [
+        TranscriptSnippet(text="before", start=9.5, duration=1),
+        TranscriptSnippet(text="on", start=10.0, duration=1),
+        TranscriptSnippet(text="after", start=10.5, duration=1),
+    ]
+
+    sections = assign_transcript_to_sections(_chapters([0.0, 10.0, 20.0]), snippets)
+
+    assert [s.transcript_text for s in sections] == ["before", "on after"]
+
+
+def test_snippets_past_the_last_section_are_dropped():
+    snippets = _snippets(20, 0)  # starts 0..38
+
+    sections = assign_transcript_to_sections(_chapters([0.0, 10.0, 20.0]), snippets)
+
+    assert sections[-1].transcript_text == _scan(snippets, 10.0, 20.0)
+    assert "w19" not in " ".join(s.transcript_text for s in sections)
+
+
+def test_empty_transcript():
+    sections = assign_transcript_to_sections(_chapters([0.0, 60.0, 120.0]), [])
+
+    assert [s.transcript_text for s in sections] == ["", ""]
+    assert split_by_time([], 600) == []
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+@pytest.mark.parametrize("interval", [7, 60, 180])
+def test_split_by_time_matches_full_scan(interval, shuffle):
+    snippets = _snippets(300, 1, shuffle, step=3.0)
+    duration = 1000  # the last snippets start past the end
+
+    sections = split_by_time(snippets, duration, interval)
+
+    assert [(s.start_seconds, s.end_seconds, s.transcript_text) for s in sections] == (
+        _scan_split_by_time(snippets, duration, interval)
+    )
+    assert [s.index for s in sections] == list(range(1, len(sections) + 1))
+
+
+def test_split_by_time_skips_silent_parts():
+    snippets = [
+        TranscriptSnippet(text="start", start=5, duration=1),
+        TranscriptSnippet(text="end", start=400, duration=1),
+    ]
+
+    sections = split_by_time(snippets, 600, 180)
+
+    assert [(s.title, s.start_seconds, s.transcript_text) for s in sections] == [
+        ("Part 1", 0.0, "start"),
+        ("Part 2", 360.0, "end"),
+    ]
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_parse_segments_matches_full_scan(shuffle):
+    snippets = _snippets(400, 2, shuffle)
+    reply = {
+        "sections": [
+            {"title": "Intro", "start_seconds": 0, "end_seconds": 120},
+            {"title": "Middle", "start_seconds": 120, "end_seconds": 500.5},
+            {"title": "End", "start_seconds": 500.5, "end_seconds": 800},
+        ]
+    }
+
+    sections = _parse_segments(json.dumps(reply), Transcript.from_snippets(snippets))
+
+    assert [s.transcript_text for s in sections] == [
+        _scan(snippets, s["start_seconds"], s["end_seconds"]) for s in reply["sections"]
+    ]
+    assert [s.title for s in sections] == ["Intro", "Middle", "End"]
+
+
+def test_parse_segments_rejects_malformed_replies():
+    transcript = Transcript.from_snippets(_snippets(10, 0))
+
+    with pytest.raises(ValueError):
+        _parse_segments('{"sections": [', transcript)
+    with pytest.raises(KeyError):
+        _parse_segments('{"groups": []}', transcript)
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_between_keeps_transcript_order(shuffle):
+    snippets = _snippets(100, 3, shuffle)
+    transcript = Transcript.from_snippets(snippets)
+
+    part = transcript.between(20.0, 60.0)
+
+    assert [s.text for s in part] == [s.text for s in snippets if 20.0 <= s.start < 60.0]
+    assert part.text == transcript.text_between(20.0, 60.0)
+    assert len(transcript.between(60.0, 20.0)) == 0
+
+
+def test_transcript_round_trips_snippets():
+    snippets = _snippets(10, 4)
+    transcript = Transcript.from_snippets(snippets)
+
+    assert list(transcript) == snippets
+    assert transcript[-1] == snippets[-1]
+    assert list(transcript[2:5]) == snippets[2:5]
+    assert transcript.text == " ".join(s.text for s in snippets)
+    with pytest.raises(IndexError):
+        transcript[10]
+    with pytest.raises(ValueError):
+        Transcript(["a"], [0.0], [])
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import pytest
+
+from yt_slides.youtube.playlist import expand_collection
+from yt_slides.youtube.url_parser import collection_url, extract_video_id, is_video_id
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42",
+        "https://youtu.be/dQw4w9WgXcQ",
+        "https://m.youtube.com/embed/dQw4w9WgXcQ",
+        " https://youtube.com/v/dQw4w9WgXcQ ",
+    ],
+)
+def test_video_urls(url):
+    assert extract_video_id(url) == "dQw4w9WgXcQ"
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        (
+            "https://youtube.com/playlist?list=PLrAXtmErZgOeiKm4sgNOknGvNjby9efdf&si=x",
+            "https://www.youtube.com/playlist?list=PLrAXtmErZgOeiKm4sgNOknGvNjby9efdf",
+        ),
+        ("https://www.youtube.com/@veritasium", "https://www.youtube.com/@veritasium/videos"),
+        ("https://m.youtube.com/@veritasium/streams", "https://www.youtube.com/@veritasium/streams"),
+        (
+            "https://www.youtube.com/channel/UCHnyfMqiRRG1u-2MsSQLbXA/shorts",
+            "https://www.youtube.com/channel/UCHnyfMqiRRG1u-2MsSQLbXA/shorts",
+        ),
+        ("https://www.youtube.com/c/Name", "https://www.youtube.com/c/Name/videos"),
+        ("https://www.youtube.com/user/Name/videos/", "https://www.youtube.com/user/Name/videos"),
+    ],
+)
+def test_collection_urls_are_normalized(url, expected):
+    assert collection_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PLrAXtmErZgOeiKm4sgNOknGvNjby9efdf",
+        "https://www.youtube.com/playlist?list=short",
+        "https://www.youtube.com/playlist",
+        "https://www.youtube.com/@",
+        "https://www.youtube.com/@veritasium/community",
+        "https://www.youtube.com/@veritasium/videos/extra",
+        "https://www.youtube.com/channel",
+        "https://example.com/@veritasium",
+    ],
+)
+def test_other_urls_are_not_collections(url):
+    assert collection_url(url) is None
+
+
+def test_collections_are_not_videos():
+    with pytest.raises(ValueError, match="playlist or channel"):
+        extract_video_id("https://www.youtube.com/@veritasium")
+    with pytest.raises(ValueError, match="Could not extract video ID"):
+        extract_video_id("https://example.com/watch?v=dQw4w9WgXcQ")
+
+
+def test_is_video_id():
+    assert is_video_id("dQw4w9WgXcQ")
+    assert is_video_id("a-b_c123XYZ")
+    assert not is_video_id("dQw4w9WgXc")
+    assert not is_video_id("dQw4w9WgXcQQ")
+    assert not is_video_id("dQw4w9WgXc!")
+    assert not is_video_id("")
+
+
+def test_expansion_skips_unusable_and_repeated_entries(monkeypatch):
+    class _YoutubeDL:
+        def __init__(self, options):
+            assert options["extract_flat"] == "in_playlist"
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def extract_info(self, url, download):
+            entries = [{"id": "dQw4w9WgXcQ"}, None, {"id": "[Private video]"}, {}, {"id": "9bZkp7q5f2w"}]
+            return {"entries": [*entries, {"id": "dQw4w9WgXcQ"}]}
+
+    monkeypatch.setattr("yt_dlp.YoutubeDL", _YoutubeDL)
+
+    assert expand_collection("https://www.youtube.com/@channel/videos") == ["dQw4w9WgXcQ", "9bZkp7q5f2w"]
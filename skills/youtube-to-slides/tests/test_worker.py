@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from rich.console import Console
+
+from yt_slides.bench.fakes import FakeGenaiClient, FakeYouTube, fake_backends
+from yt_slides.bench.runner import bench_settings
+from yt_slides.models import JobRequest
+from yt_slides.worker import QueueWorker
+from yt_slides.workqueue import WorkQueue
+
+VIDEO = "dQw4w9WgXcQ"
+
+
+def _work(tmp_path, **overrides) -> tuple[FakeGenaiClient, WorkQueue]:
+    """Enqueue one video and drain the queue with a worker backed by fakes."""
+    settings = bench_settings(
+        tmp_path, request_interval_seconds=0, postprocess_workers=0, queue_poll_seconds=0.01, **overrides
+    )
+    client = FakeGenaiClient()
+    queue = WorkQueue(tmp_path / "queue.sqlite3")
+    queue.enqueue([JobRequest(url=VIDEO)])
+    worker = QueueWorker(
+        settings, queue, concurrency=2, backends=fake_backends(FakeYouTube(600), client), console=Console(quiet=True)
+    )
+    asyncio.run(worker.run(exit_when_idle=True))
+    return client, queue
+
+
+def test_a_video_is_split_into_items_and_assembled(tmp_path):
+    client, queue = _work(tmp_path)
+
+    metadata = json.loads((tmp_path / "output" / VIDEO / "metadata.json").read_text())
+    assert client.stats.image_calls == len(metadata["sections"]) > 1
+    assert queue.counts()["slide"] == {"done": len(metadata["sections"])}
+    assert not metadata.get("incomplete")
+
+
+def test_the_image_budget_holds_across_items(tmp_path):
+    client, queue = _work(tmp_path, max_images=2)
+
+    assert client.stats.image_calls == 2
+    assert queue.usage(VIDEO)[2] == 2
+    metadata = json.loads((tmp_path / "output" / VIDEO / "metadata.json").read_text())
+    assert metadata["usage"]["images"] == 2
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from yt_slides.models import JobRequest
+from yt_slides.workqueue import WorkQueue, read_record, write_record
+
+VIDEO = "dQw4w9WgXcQ"
+OTHER = "9bZkp7q5f2w"
+
+
+@pytest.fixture
+def queue(tmp_path):
+    with WorkQueue(tmp_path / "queue.sqlite3", lease_seconds=60, max_attempts=2) as queue:
+        yield queue
+
+
+def _request(video_id: str = VIDEO) -> JobRequest:
+    return JobRequest(url=f"https://youtu.be/{video_id}")
+
+
+def _drain(queue: WorkQueue, owner: str = "w") -> list[tuple[str, int]]:
+    """Complete every item in lease order; video items find two slides."""
+    done = []
+    while (item := queue.lease(owner)) is not None:
+        queue.complete(item, slides=2 if item.kind == "video" else 0)
+        done.append((item.kind, item.slide))
+    return done
+
+
+def test_enqueue_outcomes(queue):
+    assert queue.enqueue([_request(), _request(OTHER)]) == [(VIDEO, "added"), (OTHER, "added")]
+    assert queue.enqueue([_request()]) == [(VIDEO, "queued")]
+
+    _drain(queue)
+
+    assert queue.enqueue([_request()]) == [(VIDEO, "done")]
+
+
+def test_enqueue_rejects_other_urls(queue):
+    with pytest.raises(ValueError):
+        queue.enqueue([JobRequest(url="https://example.com/video")])
+
+
+def test_video_splits_into_slides_then_assembly(queue):
+    queue.enqueue([_request()])
+
+    assert _drain(queue) == [("video", 0), ("slide", 1), ("slide", 2), ("assemble", 0)]
+    assert queue.counts() == {"video": {"done": 1}, "slide": {"done": 2}, "assemble": {"done": 1}}
+    assert not queue.has_work()
+
+
+def test_started_videos_finish_before_new_ones(queue):
+    queue.enqueue([_request(), _request(OTHER)])
+
+    first = queue.lease("w")
+    queue.complete(first, slides=1)
+    following = queue.lease("w")
+
+    assert (first.video_id, first.kind) == (VIDEO, "video")
+    assert (following.video_id, following.kind) == (VIDEO, "slide")
+
+
+def test_video_without_sections_is_assembled_directly(queue):
+    queue.enqueue([_request()])
+
+    queue.complete(queue.lease("w"), slides=0)
+
+    assert queue.lease("w").kind == "assemble"
+
+
+def test_leased_items_are_not_handed_out_twice(queue):
+    queue.enqueue([_request()])
+
+    assert queue.lease("a") is not None
+    assert queue.lease("b") is None
+    assert queue.has_work()
+
+
+def test_expired_lease_is_handed_to_another_worker(queue):
+    queue.lease_seconds = 0.01
+    queue.enqueue([_request()])
+    crashed = queue.lease("a")
+    time.sleep(0.02)
+
+    taken_over = queue.lease("b")
+
+    assert taken_over.id == crashed.id
+    assert taken_over.attempts == 2
+    assert not queue.renew(crashed)
+    assert queue.renew(taken_over)
+
+
+def test_item_fails_after_max_attempts(queue):
+    queue.enqueue([_request()])
+    for _ in range(queue.max_attempts):
+        queue.fail(queue.lease("w"), "boom")
+
+    assert queue.lease("w") is None
+    assert [(item.kind, item.error) for item in queue.failed()] == [("video", "boom")]
+    assert not queue.has_work()
+
+
+def test_expired_leases_count_as_attempts(queue):
+    queue.lease_seconds = 0.01
+    queue.enqueue([_request()])
+    for _ in range(queue.max_attempts):
+        queue.lease("w")
+        time.sleep(0.02)
+
+    assert queue.lease("w") is None
+    assert queue.failed()[0].error == "lease expired 2 times"
+
+
+def test_fail_ignores_items_taken_over(queue):
+    queue.lease_seconds = 0.01
+    queue.enqueue([_request()])
+    stale = queue.lease("a")
+    time.sleep(0.02)
+    queue.lease_seconds = 60
+    current = queue.lease("b")
+
+    queue.fail(stale, "late")
+
+    assert queue.counts()["video"] == {"leased": 1}
+    assert queue.renew(current)
+
+
+def test_enqueue_retries_failed_items_with_a_fresh_budget(queue):
+    queue.enqueue([_request()])
+    queue.add_usage(VIDEO, 100, 50, 1)
+    for _ in range(queue.max_attempts):
+        queue.fail(queue.lease("w"), "boom")
+
+    assert queue.enqueue([_request()]) == [(VIDEO, "retried")]
+    assert queue.usage(VIDEO) == (0, 0, 0)
+    assert queue.lease("w").attempts == 1
+
+
+def test_usage_adds_up_per_video(queue):
+    queue.add_usage(VIDEO, 100, 50, 1)
+    queue.add_usage(VIDEO, 10, 5, 1)
+
+    assert queue.usage(VIDEO) == (110, 55, 2)
+    assert queue.usage(OTHER) == (0, 0, 0)
+
+
+def test_completing_twice_is_harmless(queue):
+    queue.enqueue([_request()])
+    item = queue.lease("w")
+
+    queue.complete(item, slides=2)
+    queue.complete(item, slides=2)
+
+    assert queue.counts()["slide"] == {"pending": 2}
+
+
+def test_queue_is_shared_between_connections(tmp_path):
+    path = tmp_path / "queue.sqlite3"
+    with WorkQueue(path) as producer, WorkQueue(path) as worker:
+        producer.enqueue([_request()])
+
+        assert worker.lease("w").video_id == VIDEO
+        assert producer.lease("w") is None
+
+
+def test_completion_records(queue, tmp_path):
+    queue.enqueue([_request()])
+    item = queue.lease("w")
+
+    assert read_record(tmp_path, item) is None
+    write_record(tmp_path, item, slides=3)
+
+    record = read_record(tmp_path, item)
+    assert (record["kind"], record["worker"], record["slides"]) == ("video", "w", 3)
+    assert not list(tmp_path.glob(".queue/*.tmp"))